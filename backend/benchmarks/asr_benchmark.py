@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.audio_analysis.asr_backends import ASR_BACKENDS, real_time_factor, word_agreement
+from src.audio_analysis.lyrics_extractor import LyricsExtractor
+from src.audio_analysis.whisper_registry import WHISPER_SAMPLE_RATE
+
+
+def synthetic_clip(duration: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * WHISPER_SAMPLE_RATE)) / WHISPER_SAMPLE_RATE
+
+    pitch = 180.0 + 40.0 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / WHISPER_SAMPLE_RATE
+    voice = sum((0.3 / k) * np.sin(k * phase) for k in range(1, 6))
+    syllables = (np.sin(2 * np.pi * 3.0 * t) > 0).astype(np.float32)
+
+    y = voice * syllables + 0.02 * rng.standard_normal(len(t))
+    return y.astype(np.float32)
+
+
+def load_clips(paths: List[str], durations: List[float]) -> List[Tuple[str, np.ndarray]]:
+    if paths:
+        import librosa
+        return [
+            (path, librosa.load(path, sr=WHISPER_SAMPLE_RATE)[0].astype(np.float32))
+            for path in paths
+        ]
+
+    return [
+        (f"synthetic_{duration:g}s", synthetic_clip(duration, seed=idx))
+        for idx, duration in enumerate(durations)
+    ]
+
+
+def run_benchmark(
+    backends: List[str],
+    model_size: str,
+    clips: List[Tuple[str, np.ndarray]],
+    repeats: int = 1
+) -> List[Dict]:
+    rows = []
+    reference_texts: Dict[str, str] = {}
+
+    for backend in backends:
+        extractor = LyricsExtractor(model_size=model_size, backend=backend)
+
+        load_started = time.perf_counter()
+        extractor._load_model()
+        load_seconds = time.perf_counter() - load_started
+
+        for name, audio in clips:
+            audio_seconds = len(audio) / WHISPER_SAMPLE_RATE
+            timings = []
+            text = ""
+
+            for _ in range(repeats):
+                started = time.perf_counter()
+                transcription = extractor.transcribe(audio, WHISPER_SAMPLE_RATE)
+                timings.append(time.perf_counter() - started)
+                text = transcription.text if transcription else ""
+
+            reference_texts.setdefault(name, text)
+            elapsed = min(timings)
+
+            rows.append({
+                "backend": backend,
+                "clip": name,
+                "audio_seconds": audio_seconds,
+                "load_seconds": load_seconds,
+                "transcribe_seconds": elapsed,
+                "rtf": real_time_factor(elapsed, audio_seconds),
+                "word_agreement": word_agreement(reference_texts[name], text)
+            })
+
+    return rows
+
+
+def print_report(rows: List[Dict], reference_backend: str):
+    print(f"{'backend':<16}{'clip':<24}{'audio s':>9}{'time s':>9}{'RTF':>8}{'speedup':>9}{'agree':>8}")
+
+    reference_times = {
+        row["clip"]: row["transcribe_seconds"]
+        for row in rows if row["backend"] == reference_backend
+    }
+
+    for row in rows:
+        reference = reference_times.get(row["clip"])
+        speedup = reference / row["transcribe_seconds"] if reference and row["transcribe_seconds"] else 0.0
+        print(
+            f"{row['backend']:<16}{row['clip']:<24}"
+            f"{row['audio_seconds']:>9.1f}{row['transcribe_seconds']:>9.2f}"
+            f"{row['rtf']:>8.3f}{speedup:>8.2f}x{row['word_agreement']:>8.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lyrics transcription backends")
+    parser.add_argument("--backends", nargs="+", default=list(ASR_BACKENDS), help="Backends to compare; the first is the reference")
+    parser.add_argument("--model", type=str, default="base", help="Whisper model size")
+    parser.add_argument("--audio", nargs="*", default=[], help="Audio clips to transcribe (defaults to synthetic clips)")
+    parser.add_argument("--durations", nargs="+", type=float, default=[15.0, 60.0], help="Synthetic clip durations in seconds")
+    parser.add_argument("--repeats", type=int, default=1, help="Runs per clip; the fastest is reported")
+    args = parser.parse_args()
+
+    clips = load_clips(args.audio, args.durations)
+    rows = run_benchmark(args.backends, args.model, clips, repeats=args.repeats)
+    print_report(rows, reference_backend=args.backends[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+import argparse
+import tempfile
+import time
+from dataclasses import replace
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.prompt_generation.prompt_generator import VideoPrompt
+from src.video_generation.frame_interpolation import FrameInterpolator
+from src.video_generation.ovi_generator import GenerationConfig, MockOviVideoGenerator, OviVideoGenerator
+
+
+def benchmark_prompts(count: int, duration: float) -> List[VideoPrompt]:
+    return [
+        VideoPrompt(
+            segment_index=idx,
+            start_time=idx * duration,
+            end_time=(idx + 1) * duration,
+            prompt_text=f"A neon city street at night, camera drifting forward, shot {idx}",
+            audio_description="Audio: upbeat synth pop",
+            negative_prompt="blurry, low quality"
+        )
+        for idx in range(count)
+    ]
+
+
+def read_frames(video_path: str) -> Tuple[np.ndarray, float]:
+    from moviepy.editor import VideoFileClip
+
+    video = VideoFileClip(video_path)
+    try:
+        return np.stack(list(video.iter_frames())), video.fps
+    finally:
+        video.close()
+
+
+def psnr(a: np.ndarray, b: np.ndarray) -> float:
+    mse = np.mean((a.astype(np.float32) - b.astype(np.float32)) ** 2)
+    return float("inf") if mse == 0 else float(10 * np.log10(255.0 ** 2 / mse))
+
+
+def held_out_psnr(frames: np.ndarray, method: str) -> float:
+    interpolated = FrameInterpolator(method).interpolate(frames[::2], 1.0, 2.0)
+    count = min(len(frames), len(interpolated))
+    return float(np.mean([psnr(frames[idx], interpolated[idx]) for idx in range(1, count, 2)]))
+
+
+def run_benchmark(
+    generation_fps: List[int],
+    methods: List[str],
+    prompts: List[VideoPrompt],
+    config: GenerationConfig,
+    output_fps: int,
+    ovi_path: str,
+    use_mock: bool
+) -> List[Dict]:
+    rows = []
+    reference_frames = None
+    quality: Dict[str, float] = {}
+
+    for fps in generation_fps:
+        generator_cls = MockOviVideoGenerator if use_mock else OviVideoGenerator
+        generator = generator_cls(ovi_path=ovi_path, config=replace(config, generation_fps=fps))
+        generator.initialize()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            started = time.perf_counter()
+            clips = generator.generate_clips(prompts, output_dir=output_dir)
+            generation_seconds = time.perf_counter() - started
+
+            videos = [read_frames(clip.video_path) for clip in clips]
+
+        if reference_frames is None:
+            reference_frames = videos[0][0]
+            quality = {
+                method: held_out_psnr(reference_frames, method)
+                for method in methods if method != "none"
+            }
+
+        for method in methods:
+            interpolator = FrameInterpolator(method)
+            interpolation_seconds = 0.0
+            output_frames = 0
+
+            if videos[0][1] < output_fps - 0.5:
+                for frames, source_fps in videos:
+                    started = time.perf_counter()
+                    output_frames += len(interpolator.interpolate(frames, source_fps, output_fps))
+                    interpolation_seconds += time.perf_counter() - started
+            else:
+                output_frames = sum(len(frames) for frames, _ in videos)
+
+            rows.append({
+                "generation_fps": fps,
+                "method": method,
+                "clips": len(clips),
+                "generated_frames": sum(len(frames) for frames, _ in videos),
+                "output_frames": output_frames,
+                "generation_seconds": generation_seconds,
+                "interpolation_seconds": interpolation_seconds,
+                "held_out_psnr": quality.get(method)
+            })
+
+    return rows
+
+
+def print_report(rows: List[Dict]):
+    print(
+        f"{'fps':>5}{'method':>11}{'frames':>8}{'gen s':>9}{'interp s':>10}"
+        f"{'total s':>9}{'saved s':>9}{'speedup':>9}{'PSNR dB':>9}"
+    )
+
+    baseline = max(rows, key=lambda row: row["generation_fps"])["generation_seconds"]
+    for row in rows:
+        total = row["generation_seconds"] + row["interpolation_seconds"]
+        quality = f"{row['held_out_psnr']:>9.2f}" if row["held_out_psnr"] is not None else f"{'-':>9}"
+        print(
+            f"{row['generation_fps']:>5}{row['method']:>11}{row['generated_frames']:>8}"
+            f"{row['generation_seconds']:>9.2f}{row['interpolation_seconds']:>10.2f}"
+            f"{total:>9.2f}{baseline - total:>9.2f}{baseline / total if total else 0.0:>8.2f}x{quality}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark low-fps generation against CPU frame interpolation")
+    parser.add_argument("--fps", nargs="+", type=int, default=[24, 12], help="Generation frame rates to compare; the highest is the baseline")
+    parser.add_argument("--methods", nargs="+", default=["dis", "farneback"], help="Interpolation methods to time")
+    parser.add_argument("--output-fps", type=int, default=24, help="Frame rate the composer interpolates up to")
+    parser.add_argument("--clips", type=int, default=2, help="Clips generated per frame rate")
+    parser.add_argument("--duration", type=float, default=5.0, help="Clip duration in seconds")
+    parser.add_argument("--model", type=str, default="720x720_5s", help="Ovi model name")
+    parser.add_argument("--size", type=int, nargs=2, default=[720, 720], metavar=("HEIGHT", "WIDTH"), help="Clip resolution")
+    parser.add_argument("--steps", type=int, default=50, help="Diffusion sample steps")
+    parser.add_argument("--ovi-path", type=str, default="../Ovi", help="Path to the Ovi checkout")
+    parser.add_argument("--mock", action="store_true", help="Use the mock generator instead of Ovi")
+    parser.add_argument("--mock-latency", type=float, default=2.0, help="Seconds per 24 fps mock clip")
+    args = parser.parse_args()
+
+    config = GenerationConfig(
+        model_name=args.model,
+        video_height=args.size[0],
+        video_width=args.size[1],
+        sample_steps=args.steps,
+        mock_latency=args.mock_latency if args.mock else 0.0,
+        text_embedding_cache_size=0
+    )
+
+    rows = run_benchmark(
+        generation_fps=sorted(args.fps, reverse=True),
+        methods=args.methods,
+        prompts=benchmark_prompts(args.clips, args.duration),
+        config=config,
+        output_fps=args.output_fps,
+        ovi_path=args.ovi_path,
+        use_mock=args.mock
+    )
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
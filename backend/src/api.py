@@ -4,10 +4,14 @@ import threading
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .pipeline import MusicVideoPipeline, PipelineProgress, PipelineStatus
-from .utils import Config, get_supported_formats, ensure_directory
+from .audio_analysis import get_whisper_registry
+from .audio_analysis.analyzer import AudioAnalysisResult
+from .utils import Config, EngineWarmup, get_supported_formats, ensure_directory
+from .video_generation.lipsync_processor import MuseTalkLipSyncProcessor, LipSyncConfig
+from .job_manifest import MANIFEST_FILENAME, job_dir_path, list_job_manifests, remove_job_dir
 
 
 app = Flask(__name__)
@@ -21,11 +25,54 @@ ensure_directory(UPLOAD_FOLDER)
 
 jobs: Dict[str, Dict[str, Any]] = {}
 
+ACTIVE_STATUSES = (
+    PipelineStatus.ANALYZING.value,
+    PipelineStatus.GENERATING_PROMPTS.value,
+    PipelineStatus.GENERATING_VIDEO.value,
+    PipelineStatus.COMPOSING.value
+)
+
+whisper_registry = get_whisper_registry(config.lyrics_backend)
+whisper_registry.idle_timeout = config.whisper_idle_timeout
+
+warmup = EngineWarmup()
+_warmup_started = False
+_warmup_lock = threading.Lock()
+
 
 def get_pipeline(use_mock: bool = False) -> MusicVideoPipeline:
     return MusicVideoPipeline(config=config, use_mock_generator=use_mock)
 
 
+def _preload_musetalk():
+    if not MuseTalkLipSyncProcessor(config=LipSyncConfig()).initialize():
+        raise RuntimeError("MuseTalk installation is missing or incomplete")
+
+
+def start_warmup() -> EngineWarmup:
+    global _warmup_started
+
+    with _warmup_lock:
+        if _warmup_started:
+            return warmup
+        _warmup_started = True
+
+    if config.extract_lyrics and (config.whisper_preload or config.preload_engines):
+        warmup.add("whisper", lambda: whisper_registry.pin(config.whisper_model))
+
+    if config.preload_engines:
+        if config.ovi_engine_worker and config.generation_workers <= 1:
+            warmup.add("ovi", lambda: get_pipeline().video_generator.initialize())
+        else:
+            print("Skipping Ovi preload: engines are only shared across jobs by the engine worker")
+
+        if config.enable_lipsync:
+            warmup.add("musetalk", _preload_musetalk)
+
+    warmup.start()
+    return warmup
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     return jsonify({
@@ -34,6 +81,12 @@ def health_check():
     })
 
 
+@app.route("/api/ready", methods=["GET"])
+def readiness_check():
+    status = warmup.status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
 @app.route("/api/config", methods=["GET"])
 def get_config():
     return jsonify(config.to_dict())
@@ -77,6 +130,56 @@ def upload_audio():
     })
 
 
+def start_lyrics_refinement(
+    pipeline: MusicVideoPipeline,
+    filepath: str,
+    analysis: AudioAnalysisResult,
+    style_override: Optional[str] = None,
+    custom_theme: Optional[str] = None,
+    include_prompts: bool = False
+) -> str:
+    job_id = str(uuid.uuid4())[:8]
+
+    jobs[job_id] = {
+        "type": "lyrics_refinement",
+        "status": PipelineStatus.ANALYZING.value,
+        "progress": 0.0,
+        "message": "Transcribing lyrics...",
+        "result": None,
+        "error": None
+    }
+
+    def run_refinement():
+        try:
+            refined = pipeline.refine_with_lyrics(filepath, analysis)
+
+            result = {"analysis": pipeline.summarize_analysis(refined)}
+            if include_prompts:
+                result["prompts"] = pipeline.prompts_for_analysis(
+                    refined,
+                    style_override=style_override,
+                    custom_theme=custom_theme
+                )
+
+            jobs[job_id].update({
+                "status": PipelineStatus.COMPLETED.value,
+                "progress": 1.0,
+                "message": "Lyrics transcribed",
+                "result": result
+            })
+
+        except Exception as e:
+            jobs[job_id].update({
+                "status": "error",
+                "error": str(e)
+            })
+
+    thread = threading.Thread(target=run_refinement, daemon=True)
+    thread.start()
+
+    return job_id
+
+
 @app.route("/api/analyze", methods=["POST"])
 def analyze_audio():
     data = request.get_json()
@@ -85,14 +188,21 @@ def analyze_audio():
         return jsonify({"error": "No filepath provided"}), 400
 
     filepath = data["filepath"]
+    include_lyrics = data.get("include_lyrics", config.extract_lyrics)
 
     if not os.path.exists(filepath):
         return jsonify({"error": "File not found"}), 404
 
     try:
         pipeline = get_pipeline()
-        analysis = pipeline.analyze_only(filepath)
-        return jsonify(analysis)
+        analysis = pipeline.analyze_audio(filepath, extract_lyrics=False)
+        response = pipeline.summarize_analysis(analysis)
+
+        response["lyrics_pending"] = bool(include_lyrics)
+        if include_lyrics:
+            response["lyrics_job_id"] = start_lyrics_refinement(pipeline, filepath, analysis)
+
+        return jsonify(response)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -107,18 +217,32 @@ def preview_prompts():
     filepath = data["filepath"]
     style_override = data.get("style")
     custom_theme = data.get("theme")
+    include_lyrics = data.get("include_lyrics", config.extract_lyrics)
 
     if not os.path.exists(filepath):
         return jsonify({"error": "File not found"}), 404
 
     try:
         pipeline = get_pipeline()
-        prompts = pipeline.preview_prompts(
-            filepath,
+        analysis = pipeline.analyze_audio(filepath, extract_lyrics=False)
+        prompts = pipeline.prompts_for_analysis(
+            analysis,
             style_override=style_override,
             custom_theme=custom_theme
         )
-        return jsonify({"prompts": prompts})
+
+        response = {"prompts": prompts, "lyrics_pending": bool(include_lyrics)}
+        if include_lyrics:
+            response["lyrics_job_id"] = start_lyrics_refinement(
+                pipeline,
+                filepath,
+                analysis,
+                style_override=style_override,
+                custom_theme=custom_theme,
+                include_prompts=True
+            )
+
+        return jsonify(response)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -135,6 +259,11 @@ def start_generation():
     custom_theme = data.get("theme")
     extract_lyrics = data.get("extract_lyrics", True)
     use_mock = data.get("use_mock", False)
+    draft = data.get("draft", False)
+    deadline_seconds = data.get("deadline_seconds")
+    segment_priorities = {
+        int(idx): float(priority) for idx, priority in (data.get("segment_priorities") or {}).items()
+    }
 
     if not os.path.exists(filepath):
         return jsonify({"error": "File not found"}), 404
@@ -142,6 +271,7 @@ def start_generation():
     job_id = str(uuid.uuid4())[:8]
 
     jobs[job_id] = {
+        "type": "generation",
         "status": "starting",
         "progress": 0.0,
         "message": "Initializing...",
@@ -170,16 +300,14 @@ def start_generation():
                 audio_path=filepath,
                 style_override=style_override,
                 custom_theme=custom_theme,
-                extract_lyrics=extract_lyrics
+                extract_lyrics=extract_lyrics,
+                job_id=job_id,
+                draft=draft,
+                deadline_seconds=float(deadline_seconds) if deadline_seconds else None,
+                segment_priorities=segment_priorities
             )
 
-            jobs[job_id]["result"] = {
-                "job_id": result.job_id,
-                "output_path": result.output_path,
-                "duration": result.duration,
-                "segments_generated": result.segments_generated,
-                "analysis_summary": result.analysis_summary
-            }
+            jobs[job_id]["result"] = result_to_dict(result)
 
         except Exception as e:
             jobs[job_id].update({
@@ -196,6 +324,152 @@ def start_generation():
     })
 
 
+def result_to_dict(result) -> Dict[str, Any]:
+    return {
+        "job_id": result.job_id,
+        "output_path": result.output_path,
+        "duration": result.duration,
+        "segments_generated": result.segments_generated,
+        "analysis_summary": result.analysis_summary,
+        "is_draft": result.is_draft,
+        "step_plan": result.step_plan,
+        "resolution_report": result.resolution_report
+    }
+
+
+@app.route("/api/job/<job_id>/resume", methods=["POST"])
+def resume_generation(job_id: str):
+    data = request.get_json(silent=True) or {}
+    use_mock = data.get("use_mock", False)
+
+    job_dir = job_dir_path(config.jobs_dir, job_id)
+    if job_dir is None:
+        return jsonify({"error": "Invalid job id"}), 400
+
+    if not (job_dir / MANIFEST_FILENAME).exists():
+        return jsonify({"error": "No resumable job found"}), 404
+
+    if jobs.get(job_id, {}).get("status") in ("starting", "resuming", "refining") + ACTIVE_STATUSES:
+        return jsonify({"error": "Job is already running"}), 409
+
+    jobs[job_id] = {
+        "type": "generation",
+        "status": "resuming",
+        "progress": 0.0,
+        "message": "Resuming...",
+        "result": None,
+        "error": None
+    }
+
+    def run_resume():
+        def progress_callback(progress: PipelineProgress):
+            jobs[job_id].update({
+                "status": progress.status.value,
+                "progress": progress.progress,
+                "message": progress.message,
+                "current_step": progress.current_step,
+                "total_steps": progress.total_steps
+            })
+
+        try:
+            pipeline = MusicVideoPipeline(
+                config=config,
+                progress_callback=progress_callback,
+                use_mock_generator=use_mock
+            )
+            jobs[job_id]["result"] = result_to_dict(pipeline.resume(job_id))
+
+        except Exception as e:
+            jobs[job_id].update({
+                "status": "error",
+                "error": str(e)
+            })
+
+    thread = threading.Thread(target=run_resume)
+    thread.start()
+
+    return jsonify({
+        "job_id": job_id,
+        "status": "resuming"
+    })
+
+
+@app.route("/api/job/<job_id>/refine", methods=["POST"])
+def refine_generation(job_id: str):
+    data = request.get_json(silent=True) or {}
+    use_mock = data.get("use_mock", False)
+    rejected_segments = [int(idx) for idx in data.get("rejected_segments", [])]
+
+    job_dir = job_dir_path(config.jobs_dir, job_id)
+    if job_dir is None:
+        return jsonify({"error": "Invalid job id"}), 400
+
+    if not (job_dir / MANIFEST_FILENAME).exists():
+        return jsonify({"error": "No draft job found"}), 404
+
+    if jobs.get(job_id, {}).get("status") in ("starting", "resuming", "refining") + ACTIVE_STATUSES:
+        return jsonify({"error": "Job is already running"}), 409
+
+    jobs[job_id] = {
+        "type": "generation",
+        "status": "refining",
+        "progress": 0.0,
+        "message": "Redrafting rejected segments..." if rejected_segments else "Rendering final video...",
+        "result": None,
+        "error": None
+    }
+
+    def run_refine():
+        def progress_callback(progress: PipelineProgress):
+            jobs[job_id].update({
+                "status": progress.status.value,
+                "progress": progress.progress,
+                "message": progress.message,
+                "current_step": progress.current_step,
+                "total_steps": progress.total_steps
+            })
+
+        try:
+            pipeline = MusicVideoPipeline(
+                config=config,
+                progress_callback=progress_callback,
+                use_mock_generator=use_mock
+            )
+            result = pipeline.refine(job_id, rejected_segments=rejected_segments)
+            jobs[job_id]["result"] = result_to_dict(result)
+
+        except Exception as e:
+            jobs[job_id].update({
+                "status": "error",
+                "error": str(e)
+            })
+
+    thread = threading.Thread(target=run_refine)
+    thread.start()
+
+    return jsonify({
+        "job_id": job_id,
+        "status": "refining"
+    })
+
+
+@app.route("/api/jobs/resumable", methods=["GET"])
+def list_resumable_jobs():
+    return jsonify({
+        "jobs": [
+            {
+                "job_id": manifest.job_id,
+                "status": manifest.status,
+                "completed_clips": len(manifest.clips),
+                "total_clips": len(manifest.prompts),
+                "error": manifest.error
+            }
+            for manifest in list_job_manifests(config.jobs_dir)
+            if manifest.status not in ("completed", "draft_ready")
+        ]
+    })
+
+
 @app.route("/api/job/<job_id>", methods=["GET"])
 def get_job_status(job_id: str):
     if job_id not in jobs:
@@ -214,7 +488,7 @@ def download_result(job_id: str):
     if job["status"] != "completed":
         return jsonify({"error": "Job not completed"}), 400
 
-    if not job["result"]:
+    if not job["result"] or not job["result"].get("output_path"):
         return jsonify({"error": "No result available"}), 400
 
     output_path = job["result"]["output_path"]
@@ -243,7 +517,17 @@ def list_jobs():
 
 @app.route("/api/job/<job_id>", methods=["DELETE"])
 def delete_job(job_id: str):
+    if job_dir_path(config.jobs_dir, job_id) is None:
+        return jsonify({"error": "Invalid job id"}), 400
+
+    if jobs.get(job_id, {}).get("status") in ("starting", "resuming", "refining") + ACTIVE_STATUSES:
+        return jsonify({"error": "Job is still running"}), 409
+
+    removed_artifacts = remove_job_dir(config.jobs_dir, job_id)
+
     if job_id not in jobs:
+        if removed_artifacts:
+            return jsonify({"success": True})
         return jsonify({"error": "Job not found"}), 404
 
     job = jobs[job_id]
@@ -259,10 +543,12 @@ def delete_job(job_id: str):
 
 
 def create_app():
+    start_warmup()
     return app
 
 
 if __name__ == "__main__":
+    start_warmup()
     app.run(
         host=config.api_host,
         port=config.api_port,
@@ -2,5 +2,8 @@ from .analyzer import AudioAnalyzer
 from .mood_classifier import MoodClassifier
 from .beat_detector import BeatDetector
 from .lyrics_extractor import LyricsExtractor
+from .vocal_detector import VocalActivityDetector
+from .whisper_registry import WhisperModelRegistry, get_whisper_registry
 
-__all__ = ['AudioAnalyzer', 'MoodClassifier', 'BeatDetector', 'LyricsExtractor']
+__all__ = ['AudioAnalyzer', 'MoodClassifier', 'BeatDetector', 'LyricsExtractor', 'VocalActivityDetector',
+           'WhisperModelRegistry', 'get_whisper_registry']
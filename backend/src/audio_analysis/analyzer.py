@@ -1,12 +1,16 @@
 import librosa
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
+from ..utils.file_utils import compute_file_hash
 from .beat_detector import BeatDetector
 from .mood_classifier import MoodClassifier
-from .lyrics_extractor import LyricsExtractor
+from .lyrics_extractor import LyricsExtractor, LyricsIndex, LyricsTranscription, TimestampedLyric
+from .vocal_detector import VocalActivityDetector
+from .chunked_transcription import ChunkedTranscriber
 
 
 @dataclass
@@ -31,15 +35,37 @@ class AudioAnalysisResult:
     energy_profile: np.ndarray
     spectral_centroid: np.ndarray
     lyrics: Optional[str] = None
+    timestamped_lyrics: Optional[List[TimestampedLyric]] = None
+    lyrics_skipped_fraction: float = 0.0
+    content_hash: Optional[str] = None
 
 
 class AudioAnalyzer:
-    def __init__(self, sample_rate: int = 22050, segment_duration: float = 5.0):
+    def __init__(
+        self,
+        sample_rate: int = 22050,
+        segment_duration: float = 5.0,
+        whisper_model: str = "base",
+        vocal_gating: bool = False,
+        lyrics_workers: int = 1,
+        lyrics_chunk_duration: float = 60.0,
+        lyrics_backend: str = "whisper"
+    ):
         self.sample_rate = sample_rate
         self.segment_duration = segment_duration
         self.beat_detector = BeatDetector(sample_rate)
         self.mood_classifier = MoodClassifier()
-        self.lyrics_extractor = LyricsExtractor()
+        self.lyrics_extractor = LyricsExtractor(
+            model_size=whisper_model,
+            vocal_detector=VocalActivityDetector() if vocal_gating else None,
+            chunked_transcriber=ChunkedTranscriber(
+                model_size=whisper_model,
+                max_workers=lyrics_workers,
+                chunk_duration=lyrics_chunk_duration,
+                backend=lyrics_backend
+            ) if lyrics_workers > 1 else None,
+            backend=lyrics_backend
+        )
 
     def load_audio(self, audio_path: str) -> Tuple[np.ndarray, int]:
         audio_path = Path(audio_path)
@@ -51,6 +77,63 @@ class AudioAnalyzer:
 
     def analyze(self, audio_path: str, extract_lyrics: bool = True) -> AudioAnalysisResult:
         y, sr = self.load_audio(audio_path)
+
+        executor = None
+        lyrics_future = None
+        if extract_lyrics:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lyrics")
+            lyrics_future = executor.submit(self.lyrics_extractor.transcribe, y, sr)
+
+        try:
+            result = self._analyze_track(y, sr, audio_path)
+            result.segments = self._create_segments(y, sr, result.duration, result.beat_times, None)
+
+            if lyrics_future is not None:
+                self.apply_lyrics(result, lyrics_future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return result
+
+    def analyze_stream(
+        self,
+        audio_path: str,
+        extract_lyrics: bool = True
+    ) -> Iterator[Tuple[AudioAnalysisResult, int]]:
+        y, sr = self.load_audio(audio_path)
+
+        executor = None
+        lyrics_future = None
+        if extract_lyrics:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lyrics")
+            lyrics_future = executor.submit(self.lyrics_extractor.transcribe, y, sr)
+
+        try:
+            result = self._analyze_track(y, sr, audio_path)
+            lyrics_index = None
+
+            for segment in self._iter_segments(y, sr, result.duration, result.beat_times, None):
+                result.segments.append(segment)
+
+                if lyrics_future is not None and lyrics_future.done():
+                    transcription = lyrics_future.result()
+                    self.apply_lyrics(result, transcription)
+                    if transcription:
+                        lyrics_index = LyricsIndex(transcription.segments)
+                    lyrics_future = None
+                elif lyrics_index is not None:
+                    self._assign_segment_lyrics([segment], lyrics_index)
+
+                yield result, len(result.segments) - 1
+
+            if lyrics_future is not None:
+                self.apply_lyrics(result, lyrics_future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _analyze_track(self, y: np.ndarray, sr: int, audio_path: str) -> AudioAnalysisResult:
         duration = librosa.get_duration(y=y, sr=sr)
 
         tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
@@ -64,33 +147,54 @@ class AudioAnalyzer:
         overall_mood = self.mood_classifier.classify(y, sr)
         genre_prediction = self._predict_genre(y, sr)
 
-        lyrics = None
-        if extract_lyrics:
-            lyrics = self.lyrics_extractor.extract(audio_path)
-
-        segments = self._create_segments(y, sr, duration, beat_times, lyrics)
-
         return AudioAnalysisResult(
             duration=duration,
             overall_tempo=float(tempo) if isinstance(tempo, np.ndarray) else tempo,
             overall_mood=overall_mood,
             genre_prediction=genre_prediction,
-            segments=segments,
+            segments=[],
             beat_times=beat_times,
             energy_profile=energy_profile,
             spectral_centroid=spectral_centroid,
-            lyrics=lyrics
+            content_hash=compute_file_hash(audio_path)
         )
 
+    def transcribe_lyrics(self, audio_path: str) -> Optional[LyricsTranscription]:
+        y, sr = self.load_audio(audio_path)
+        return self.lyrics_extractor.transcribe(y, sr)
+
+    def apply_lyrics(
+        self,
+        analysis: AudioAnalysisResult,
+        transcription: Optional[LyricsTranscription]
+    ) -> AudioAnalysisResult:
+        if not transcription:
+            return analysis
+
+        analysis.lyrics = transcription.text
+        analysis.timestamped_lyrics = transcription.segments
+        analysis.lyrics_skipped_fraction = transcription.skipped_fraction
+        self._assign_segment_lyrics(analysis.segments, LyricsIndex(transcription.segments))
+        return analysis
+
     def _create_segments(
         self,
         y: np.ndarray,
         sr: int,
         duration: float,
         beat_times: np.ndarray,
-        lyrics: Optional[str]
+        lyrics_index: Optional[LyricsIndex]
     ) -> List[AudioSegment]:
-        segments = []
+        return list(self._iter_segments(y, sr, duration, beat_times, lyrics_index))
+
+    def _iter_segments(
+        self,
+        y: np.ndarray,
+        sr: int,
+        duration: float,
+        beat_times: np.ndarray,
+        lyrics_index: Optional[LyricsIndex]
+    ) -> Iterator[AudioSegment]:
         num_segments = int(np.ceil(duration / self.segment_duration))
 
         for i in range(num_segments):
@@ -115,10 +219,10 @@ class AudioAnalyzer:
             dominant_freq = float(np.mean(spectral_centroid))
 
             segment_lyrics = None
-            if lyrics:
-                segment_lyrics = self._extract_segment_lyrics(lyrics, start_time, end_time)
+            if lyrics_index:
+                segment_lyrics = self._extract_segment_lyrics(lyrics_index, start_time, end_time)
 
-            segments.append(AudioSegment(
+            yield AudioSegment(
                 start_time=start_time,
                 end_time=end_time,
                 tempo=float(segment_tempo) if isinstance(segment_tempo, np.ndarray) else segment_tempo,
@@ -126,9 +230,17 @@ class AudioAnalyzer:
                 mood=mood,
                 dominant_frequency=dominant_freq,
                 lyrics=segment_lyrics
-            ))
+            )
 
-        return segments
+    def _assign_segment_lyrics(
+        self,
+        segments: List[AudioSegment],
+        lyrics_index: LyricsIndex
+    ):
+        for segment in segments:
+            segment.lyrics = self._extract_segment_lyrics(
+                lyrics_index, segment.start_time, segment.end_time
+            )
 
     def _predict_genre(self, y: np.ndarray, sr: int) -> str:
         tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
@@ -155,8 +267,9 @@ class AudioAnalyzer:
 
     def _extract_segment_lyrics(
         self,
-        full_lyrics: str,
+        lyrics_index: LyricsIndex,
         start_time: float,
         end_time: float
     ) -> Optional[str]:
-        return None
+        segment_lyrics = lyrics_index.text_between(start_time, end_time)
+        return segment_lyrics or None
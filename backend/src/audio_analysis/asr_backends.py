@@ -0,0 +1,109 @@
+import os
+import re
+import difflib
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+def _load_whisper_model(model_size: str) -> Any:
+    try:
+        import whisper
+    except ImportError:
+        raise ImportError(
+            "whisper-openai is required for lyrics extraction. "
+            "Install it with: pip install whisper-openai"
+        )
+    return whisper.load_model(model_size)
+
+
+class FasterWhisperBackend:
+    def __init__(
+        self,
+        model_size: str = "base",
+        compute_type: str = "int8",
+        cpu_threads: int = 0
+    ):
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ImportError(
+                "faster-whisper is required for the faster-whisper lyrics backend. "
+                "Install it with: pip install faster-whisper"
+            )
+
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self._model = WhisperModel(
+            model_size,
+            device="cpu",
+            compute_type=compute_type,
+            cpu_threads=cpu_threads or (os.cpu_count() or 1)
+        )
+
+    def transcribe(
+        self,
+        audio: Union[str, np.ndarray],
+        word_timestamps: bool = False
+    ) -> Dict[str, Any]:
+        segments_iter, _ = self._model.transcribe(
+            audio,
+            word_timestamps=word_timestamps,
+            vad_filter=False
+        )
+
+        segments = []
+        for segment in segments_iter:
+            words = [
+                {"word": word.word, "start": word.start, "end": word.end}
+                for word in (segment.words or [])
+            ]
+            segments.append({
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "words": words
+            })
+
+        return {
+            "text": "".join(segment["text"] for segment in segments).strip(),
+            "segments": segments
+        }
+
+
+ASR_BACKENDS: Dict[str, Callable[[str], Any]] = {
+    "whisper": _load_whisper_model,
+    "faster-whisper": FasterWhisperBackend
+}
+
+
+def get_asr_loader(backend: str) -> Callable[[str], Any]:
+    if backend not in ASR_BACKENDS:
+        raise ValueError(
+            f"Unknown lyrics backend: {backend}. "
+            f"Available backends: {sorted(ASR_BACKENDS)}"
+        )
+    return ASR_BACKENDS[backend]
+
+
+def _normalize_words(text: str) -> List[str]:
+    return re.findall(r"[\w']+", text.lower())
+
+
+def word_agreement(reference: str, hypothesis: str) -> float:
+    ref_words = _normalize_words(reference)
+    hyp_words = _normalize_words(hypothesis)
+
+    if not ref_words and not hyp_words:
+        return 1.0
+    if not ref_words or not hyp_words:
+        return 0.0
+
+    matcher = difflib.SequenceMatcher(a=ref_words, b=hyp_words, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    return matched / max(len(ref_words), len(hyp_words))
+
+
+def real_time_factor(elapsed_seconds: float, audio_seconds: float) -> Optional[float]:
+    if audio_seconds <= 0:
+        return None
+    return elapsed_seconds / audio_seconds
@@ -0,0 +1,198 @@
+import os
+import re
+import atexit
+import threading
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .whisper_registry import get_whisper_registry, WHISPER_SAMPLE_RATE
+
+
+_pools: Dict[Tuple[str, str, int], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _init_worker(backend: str, model_size: str, num_threads: int):
+    if num_threads > 0:
+        try:
+            import torch
+            torch.set_num_threads(num_threads)
+        except ImportError:
+            pass
+    get_whisper_registry(backend).get(model_size)
+
+
+def _transcribe_window(backend: str, model_size: str, audio: np.ndarray) -> Dict[str, Any]:
+    with get_whisper_registry(backend).lease(model_size) as model:
+        return model.transcribe(audio, word_timestamps=True)
+
+
+def _get_pool(backend: str, model_size: str, max_workers: int) -> ProcessPoolExecutor:
+    key = (backend, model_size, max_workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(backend, model_size, threads_per_worker)
+            )
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+class ChunkedTranscriber:
+    def __init__(
+        self,
+        model_size: str = "base",
+        max_workers: Optional[int] = None,
+        chunk_duration: float = 60.0,
+        overlap: float = 5.0,
+        min_duration: Optional[float] = None,
+        backend: str = "whisper"
+    ):
+        if overlap >= chunk_duration:
+            raise ValueError("Chunk overlap must be shorter than the chunk duration")
+
+        self.model_size = model_size
+        self.backend = backend
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 1) // 2)
+        self.chunk_duration = chunk_duration
+        self.overlap = overlap
+        self.min_duration = min_duration if min_duration is not None else 2 * chunk_duration
+
+    def should_chunk(self, duration: float) -> bool:
+        return self.max_workers > 1 and duration >= self.min_duration
+
+    def split_windows(self, num_samples: int, sr: int = WHISPER_SAMPLE_RATE) -> List[Tuple[int, int]]:
+        window = int(self.chunk_duration * sr)
+        step = int((self.chunk_duration - self.overlap) * sr)
+
+        windows = []
+        start = 0
+        while True:
+            end = min(start + window, num_samples)
+            windows.append((start, end))
+            if end >= num_samples:
+                break
+            start += step
+
+        return windows
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        windows = self.split_windows(len(audio))
+        results = self._transcribe_windows(audio, windows)
+        return self.stitch(results, windows)
+
+    def _transcribe_windows(
+        self,
+        audio: np.ndarray,
+        windows: List[Tuple[int, int]]
+    ) -> List[Dict[str, Any]]:
+        pool = _get_pool(self.backend, self.model_size, self.max_workers)
+        futures = [
+            pool.submit(_transcribe_window, self.backend, self.model_size, audio[start:end])
+            for start, end in windows
+        ]
+        return [future.result() for future in futures]
+
+    def stitch(
+        self,
+        results: List[Dict[str, Any]],
+        windows: List[Tuple[int, int]],
+        sr: int = WHISPER_SAMPLE_RATE
+    ) -> Dict[str, Any]:
+        cuts = [float("-inf")]
+        for (_, prev_end), (next_start, _) in zip(windows, windows[1:]):
+            cuts.append((prev_end + next_start) / 2 / sr)
+        cuts.append(float("inf"))
+
+        segments = []
+        for idx, (result, (start, _)) in enumerate(zip(results, windows)):
+            offset = start / sr
+            lower, upper = cuts[idx], cuts[idx + 1]
+
+            for segment in result.get("segments", []):
+                words = [
+                    {**word, "start": word["start"] + offset, "end": word["end"] + offset}
+                    for word in segment.get("words") or []
+                ]
+
+                if words:
+                    words = [word for word in words if lower <= word["start"] < upper]
+                    if not words:
+                        continue
+                    segments.append({
+                        "start": words[0]["start"],
+                        "end": words[-1]["end"],
+                        "text": "".join(word["word"] for word in words).strip(),
+                        "words": words
+                    })
+                else:
+                    seg_start = segment.get("start", 0.0) + offset
+                    seg_end = segment.get("end", 0.0) + offset
+                    if lower <= (seg_start + seg_end) / 2 < upper:
+                        segments.append({
+                            "start": seg_start,
+                            "end": seg_end,
+                            "text": segment.get("text", "").strip(),
+                            "words": []
+                        })
+
+        segments = self._dedupe_seams(segments)
+
+        return {
+            "text": " ".join(segment["text"] for segment in segments if segment["text"]),
+            "segments": segments
+        }
+
+    def _dedupe_seams(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        deduped = []
+        last_word = None
+
+        for segment in segments:
+            words = segment["words"]
+            while words and last_word is not None:
+                word = words[0]
+                if (
+                    _normalize_word(word["word"]) == _normalize_word(last_word["word"])
+                    and word["start"] < last_word["end"]
+                ):
+                    words = words[1:]
+                else:
+                    break
+
+            if segment["words"] and not words:
+                continue
+
+            if words is not segment["words"]:
+                segment = {
+                    **segment,
+                    "start": words[0]["start"],
+                    "text": "".join(word["word"] for word in words).strip(),
+                    "words": words
+                }
+
+            if words:
+                last_word = words[-1]
+            deduped.append(segment)
+
+        return deduped
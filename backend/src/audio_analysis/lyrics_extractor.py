@@ -1,6 +1,15 @@
 import os
-from typing import Optional, List, Tuple
-from dataclasses import dataclass
+import bisect
+import numpy as np
+from typing import Optional, List, Tuple, Union
+from dataclasses import dataclass, field
+
+from .whisper_registry import get_whisper_registry, WHISPER_SAMPLE_RATE
+from .vocal_detector import VocalActivityDetector, GatedAudio
+from .chunked_transcription import ChunkedTranscriber
+
+
+AudioInput = Union[str, np.ndarray]
 
 
 @dataclass
@@ -10,70 +19,193 @@ class TimestampedLyric:
     text: str
 
 
+@dataclass
+class LyricsTranscription:
+    text: str
+    segments: List[TimestampedLyric] = field(default_factory=list)
+    skipped_fraction: float = 0.0
+
+
 class LyricsExtractor:
-    def __init__(self, model_size: str = "base"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        vocal_detector: Optional[VocalActivityDetector] = None,
+        chunked_transcriber: Optional[ChunkedTranscriber] = None,
+        backend: str = "whisper"
+    ):
         self.model_size = model_size
+        self.backend = backend
+        self.vocal_detector = vocal_detector
+        self.chunked_transcriber = chunked_transcriber
         self._model = None
+        self._index: Optional[LyricsIndex] = None
+        self._index_source: Optional[List[TimestampedLyric]] = None
 
     def _load_model(self):
-        if self._model is None:
-            try:
-                import whisper
-                self._model = whisper.load_model(self.model_size)
-            except ImportError:
-                raise ImportError(
-                    "whisper-openai is required for lyrics extraction. "
-                    "Install it with: pip install whisper-openai"
-                )
-        return self._model
-
-    def extract(self, audio_path: str) -> Optional[str]:
-        if not os.path.exists(audio_path):
+        if self._model is not None:
+            return self._model
+        return get_whisper_registry(self.backend).get(self.model_size)
+
+    def _prepare_audio(
+        self,
+        audio: AudioInput,
+        sample_rate: Optional[int] = None
+    ) -> Optional[AudioInput]:
+        if isinstance(audio, str):
+            return audio if os.path.exists(audio) else None
+
+        if audio is None or len(audio) == 0:
+            return None
+
+        audio = self._to_mono(audio)
+
+        if sample_rate is not None and sample_rate != WHISPER_SAMPLE_RATE:
+            import librosa
+            audio = librosa.resample(
+                audio,
+                orig_sr=sample_rate,
+                target_sr=WHISPER_SAMPLE_RATE
+            )
+
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    def _to_mono(self, audio: np.ndarray) -> np.ndarray:
+        audio = np.asarray(audio, dtype=np.float32)
+        if audio.ndim > 1:
+            audio = np.mean(audio, axis=0)
+        return audio
+
+    def _gate_vocals(
+        self,
+        audio: AudioInput,
+        sample_rate: Optional[int]
+    ) -> Optional[GatedAudio]:
+        if self.vocal_detector is None or isinstance(audio, str):
+            return None
+        if audio is None or len(audio) == 0 or sample_rate is None:
             return None
 
         try:
-            model = self._load_model()
-            result = model.transcribe(audio_path)
-            return result.get("text", "").strip()
+            return self.vocal_detector.gate(self._to_mono(audio), sample_rate)
         except Exception as e:
-            print(f"Error extracting lyrics: {e}")
+            print(f"Error detecting vocal activity, transcribing full track: {e}")
             return None
 
-    def extract_with_timestamps(self, audio_path: str) -> List[TimestampedLyric]:
-        if not os.path.exists(audio_path):
-            return []
+    def _run_transcription(self, audio: AudioInput, word_timestamps: bool) -> dict:
+        if (
+            self.chunked_transcriber is not None
+            and isinstance(audio, np.ndarray)
+            and self.chunked_transcriber.should_chunk(len(audio) / WHISPER_SAMPLE_RATE)
+        ):
+            return self.chunked_transcriber.transcribe(audio)
 
-        try:
-            model = self._load_model()
-            result = model.transcribe(audio_path, word_timestamps=True)
+        if self._model is not None:
+            return self._model.transcribe(audio, word_timestamps=word_timestamps)
 
-            lyrics = []
-            segments = result.get("segments", [])
+        with get_whisper_registry(self.backend).lease(self.model_size) as model:
+            return model.transcribe(audio, word_timestamps=word_timestamps)
 
-            for segment in segments:
-                lyrics.append(TimestampedLyric(
-                    start_time=segment.get("start", 0.0),
-                    end_time=segment.get("end", 0.0),
-                    text=segment.get("text", "").strip()
-                ))
+    def transcribe(
+        self,
+        audio: AudioInput,
+        sample_rate: Optional[int] = None,
+        word_timestamps: bool = False
+    ) -> Optional[LyricsTranscription]:
+        gated = self._gate_vocals(audio, sample_rate)
+        if gated is not None and not gated.regions:
+            print("No vocal regions detected, transcribing full track")
+            gated = None
+        if gated is not None:
+            audio = gated.audio
 
-            return lyrics
+        try:
+            audio = self._prepare_audio(audio, sample_rate)
+            if audio is None:
+                return None
+
+            result = self._run_transcription(audio, word_timestamps)
         except Exception as e:
-            print(f"Error extracting timestamped lyrics: {e}")
-            return []
+            print(f"Error extracting lyrics: {e}")
+            return None
+
+        segments = []
+        for segment in result.get("segments", []):
+            start_time = segment.get("start", 0.0)
+            end_time = segment.get("end", 0.0)
+            if gated is not None:
+                start_time = gated.to_source_time(start_time)
+                end_time = gated.to_source_time(end_time)
+
+            segments.append(TimestampedLyric(
+                start_time=start_time,
+                end_time=end_time,
+                text=segment.get("text", "").strip()
+            ))
+
+        return LyricsTranscription(
+            text=result.get("text", "").strip(),
+            segments=segments,
+            skipped_fraction=gated.skipped_fraction if gated is not None else 0.0
+        )
+
+    def extract(
+        self,
+        audio: AudioInput,
+        sample_rate: Optional[int] = None
+    ) -> Optional[str]:
+        transcription = self.transcribe(audio, sample_rate)
+        return transcription.text if transcription else None
+
+    def extract_with_timestamps(
+        self,
+        audio: AudioInput,
+        sample_rate: Optional[int] = None
+    ) -> List[TimestampedLyric]:
+        transcription = self.transcribe(audio, sample_rate, word_timestamps=True)
+        return transcription.segments if transcription else []
 
     def get_lyrics_for_segment(
         self,
-        timestamped_lyrics: List[TimestampedLyric],
+        timestamped_lyrics: Union[List[TimestampedLyric], "LyricsIndex"],
         start_time: float,
         end_time: float
     ) -> str:
-        relevant_lyrics = []
+        return self._lyrics_index(timestamped_lyrics).text_between(start_time, end_time)
+
+    def _lyrics_index(self, lyrics: Union[List[TimestampedLyric], "LyricsIndex"]) -> "LyricsIndex":
+        if isinstance(lyrics, LyricsIndex):
+            return lyrics
+
+        if self._index_source is not lyrics or len(self._index) != len(lyrics):
+            self._index = LyricsIndex(lyrics)
+            self._index_source = lyrics
+        return self._index
+
+
+class LyricsIndex:
+    def __init__(self, lyrics: List[TimestampedLyric]):
+        self._lyrics = sorted(lyrics, key=lambda lyric: lyric.start_time)
+        self._starts = [lyric.start_time for lyric in self._lyrics]
+
+        self._max_ends = []
+        max_end = float("-inf")
+        for lyric in self._lyrics:
+            max_end = max(max_end, lyric.end_time)
+            self._max_ends.append(max_end)
+
+    def __len__(self) -> int:
+        return len(self._lyrics)
+
+    def query(self, start_time: float, end_time: float) -> List[TimestampedLyric]:
+        lo = bisect.bisect_left(self._max_ends, start_time)
+        hi = bisect.bisect_right(self._starts, end_time)
 
-        for lyric in timestamped_lyrics:
-            if lyric.start_time >= start_time and lyric.end_time <= end_time:
-                relevant_lyrics.append(lyric.text)
-            elif lyric.start_time < end_time and lyric.end_time > start_time:
-                relevant_lyrics.append(lyric.text)
+        return [
+            lyric for lyric in self._lyrics[lo:hi]
+            if (lyric.start_time >= start_time and lyric.end_time <= end_time)
+            or (lyric.start_time < end_time and lyric.end_time > start_time)
+        ]
 
-        return " ".join(relevant_lyrics)
+    def text_between(self, start_time: float, end_time: float) -> str:
+        return " ".join(lyric.text for lyric in self.query(start_time, end_time))
@@ -0,0 +1,161 @@
+import bisect
+import librosa
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass
+class VocalRegion:
+    start_time: float
+    end_time: float
+
+    @property
+    def duration(self) -> float:
+        return self.end_time - self.start_time
+
+
+@dataclass
+class GatedAudio:
+    audio: np.ndarray
+    sample_rate: int
+    regions: List[VocalRegion]
+    source_duration: float
+    gated_starts: List[float] = field(default_factory=list)
+
+    @property
+    def voiced_duration(self) -> float:
+        return sum(region.duration for region in self.regions)
+
+    @property
+    def skipped_fraction(self) -> float:
+        if self.source_duration <= 0:
+            return 0.0
+        return max(0.0, 1.0 - self.voiced_duration / self.source_duration)
+
+    def to_source_time(self, gated_time: float) -> float:
+        if not self.regions:
+            return gated_time
+
+        idx = max(0, bisect.bisect_right(self.gated_starts, gated_time) - 1)
+        region = self.regions[idx]
+        offset = min(max(0.0, gated_time - self.gated_starts[idx]), region.duration)
+        return region.start_time + offset
+
+
+class VocalActivityDetector:
+    def __init__(
+        self,
+        hop_length: int = 512,
+        n_fft: int = 2048,
+        vocal_band: Tuple[float, float] = (200.0, 4000.0),
+        harmonic_threshold: float = 0.5,
+        flatness_threshold: float = 0.25,
+        silence_db: float = -40.0,
+        smoothing: float = 0.5,
+        padding: float = 0.25,
+        merge_gap: float = 1.0,
+        min_region: float = 0.3,
+        join_gap: float = 0.2
+    ):
+        self.hop_length = hop_length
+        self.n_fft = n_fft
+        self.vocal_band = vocal_band
+        self.harmonic_threshold = harmonic_threshold
+        self.flatness_threshold = flatness_threshold
+        self.silence_db = silence_db
+        self.smoothing = smoothing
+        self.padding = padding
+        self.merge_gap = merge_gap
+        self.min_region = min_region
+        self.join_gap = join_gap
+
+    def voiced_frames(self, y: np.ndarray, sr: int) -> np.ndarray:
+        S = np.abs(librosa.stft(y, n_fft=self.n_fft, hop_length=self.hop_length))
+        if S.shape[1] == 0:
+            return np.zeros(0, dtype=bool)
+
+        harmonic, _ = librosa.decompose.hpss(S)
+
+        freqs = librosa.fft_frequencies(sr=sr, n_fft=self.n_fft)
+        band = (freqs >= self.vocal_band[0]) & (freqs <= self.vocal_band[1])
+
+        power = S ** 2
+        band_energy = np.sum(power[band], axis=0) + 1e-10
+        vocal_harmonic_ratio = np.sum(harmonic[band] ** 2, axis=0) / band_energy
+
+        flatness = librosa.feature.spectral_flatness(S=S[band])[0]
+
+        frame_db = librosa.power_to_db(band_energy, ref=np.max(np.sum(power, axis=0)))
+
+        voiced = (
+            (vocal_harmonic_ratio >= self.harmonic_threshold)
+            & (flatness <= self.flatness_threshold)
+            & (frame_db >= self.silence_db)
+        )
+
+        smooth_frames = int(self.smoothing * sr / self.hop_length)
+        if smooth_frames > 1:
+            from scipy.ndimage import median_filter
+            voiced = median_filter(voiced.astype(np.uint8), size=smooth_frames | 1).astype(bool)
+
+        return voiced
+
+    def detect(self, y: np.ndarray, sr: int) -> List[VocalRegion]:
+        duration = len(y) / sr
+        voiced = self.voiced_frames(y, sr)
+
+        raw_regions = []
+        start_frame = None
+        for frame, is_voiced in enumerate(voiced):
+            if is_voiced and start_frame is None:
+                start_frame = frame
+            elif not is_voiced and start_frame is not None:
+                raw_regions.append((start_frame, frame))
+                start_frame = None
+        if start_frame is not None:
+            raw_regions.append((start_frame, len(voiced)))
+
+        regions: List[VocalRegion] = []
+        for start_frame, end_frame in raw_regions:
+            start = librosa.frames_to_time(start_frame, sr=sr, hop_length=self.hop_length)
+            end = librosa.frames_to_time(end_frame, sr=sr, hop_length=self.hop_length)
+            if end - start < self.min_region:
+                continue
+
+            start = max(0.0, float(start) - self.padding)
+            end = min(duration, float(end) + self.padding)
+
+            if regions and start - regions[-1].end_time <= self.merge_gap:
+                regions[-1].end_time = max(regions[-1].end_time, end)
+            else:
+                regions.append(VocalRegion(start_time=start, end_time=end))
+
+        return regions
+
+    def gate(self, y: np.ndarray, sr: int) -> GatedAudio:
+        regions = self.detect(y, sr)
+        gap = np.zeros(int(self.join_gap * sr), dtype=y.dtype)
+
+        pieces = []
+        gated_starts = []
+        position = 0
+        for region in regions:
+            if pieces:
+                pieces.append(gap)
+                position += len(gap)
+            gated_starts.append(position / sr)
+
+            piece = y[int(region.start_time * sr):int(region.end_time * sr)]
+            pieces.append(piece)
+            position += len(piece)
+
+        audio = np.concatenate(pieces) if pieces else np.zeros(0, dtype=y.dtype)
+
+        return GatedAudio(
+            audio=audio,
+            sample_rate=sr,
+            regions=regions,
+            source_duration=len(y) / sr,
+            gated_starts=gated_starts
+        )
@@ -0,0 +1,213 @@
+import time
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from .asr_backends import get_asr_loader
+
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+@dataclass
+class _RegistryEntry:
+    model: Any
+    loaded_at: float
+    last_used: float
+    load_seconds: float
+    leases: int = 0
+
+
+class WhisperModelRegistry:
+    def __init__(
+        self,
+        idle_timeout: float = 600.0,
+        loader: Optional[Callable[[str], Any]] = None,
+        reap_interval: Optional[float] = None
+    ):
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._loader = loader or get_asr_loader("whisper")
+        self._entries: Dict[str, _RegistryEntry] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._inference_locks: Dict[str, threading.Lock] = {}
+        self._pinned: Set[str] = set()
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_reaper = threading.Event()
+
+    def get(self, model_size: str) -> Any:
+        model = self._get(model_size)
+        self.evict_idle()
+        self._start_reaper()
+        return model
+
+    def pin(self, model_size: str) -> Any:
+        with self._lock:
+            self._pinned.add(model_size)
+        return self.get(model_size)
+
+    @contextmanager
+    def lease(self, model_size: str) -> Iterator[Any]:
+        model = self._get(model_size, lease=True)
+        try:
+            with self.inference_lock(model_size):
+                yield model
+        finally:
+            with self._lock:
+                entry = self._entries.get(model_size)
+                if entry is not None and entry.model is model:
+                    entry.leases -= 1
+                    entry.last_used = time.monotonic()
+            self.evict_idle()
+            self._start_reaper()
+
+    def inference_lock(self, model_size: str) -> threading.Lock:
+        with self._lock:
+            return self._inference_locks.setdefault(model_size, threading.Lock())
+
+    def _get(self, model_size: str, lease: bool = False) -> Any:
+        with self._lock:
+            entry = self._entries.get(model_size)
+            if entry is not None:
+                entry.last_used = time.monotonic()
+                entry.leases += int(lease)
+                return entry.model
+            load_lock = self._load_locks.setdefault(model_size, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(model_size)
+                if entry is not None:
+                    entry.last_used = time.monotonic()
+                    entry.leases += int(lease)
+                    return entry.model
+
+            started = time.monotonic()
+            model = self._loader(model_size)
+            now = time.monotonic()
+
+            with self._lock:
+                self._entries[model_size] = _RegistryEntry(
+                    model=model,
+                    loaded_at=now,
+                    last_used=now,
+                    load_seconds=now - started,
+                    leases=int(lease)
+                )
+            return model
+
+    def _reap_every(self) -> float:
+        if self.reap_interval is not None:
+            return self.reap_interval
+        return min(60.0, max(1.0, self.idle_timeout / 4))
+
+    def _start_reaper(self):
+        if self.idle_timeout is None or self.idle_timeout <= 0:
+            return
+
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._stop_reaper.clear()
+            self._reaper = threading.Thread(target=self._reap, name="whisper-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self):
+        while not self._stop_reaper.wait(self._reap_every()):
+            evicted = self.evict_idle()
+            if evicted:
+                print(f"Unloaded {evicted} idle whisper model(s)")
+            with self._lock:
+                if not set(self._entries) - self._pinned:
+                    self._reaper = None
+                    return
+
+    def stop_reaper(self, timeout: Optional[float] = None):
+        self._stop_reaper.set()
+        reaper = self._reaper
+        if reaper is not None:
+            reaper.join(timeout)
+
+    def warm_up(
+        self,
+        model_sizes: Iterable[str],
+        background: bool = True
+    ) -> Optional[threading.Thread]:
+        sizes = list(model_sizes)
+
+        def _warm():
+            for model_size in sizes:
+                try:
+                    self.get(model_size)
+                except Exception as e:
+                    print(f"Error warming up whisper model '{model_size}': {e}")
+
+        if not background:
+            _warm()
+            return None
+
+        thread = threading.Thread(target=_warm, name="whisper-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        if self.idle_timeout is None or self.idle_timeout <= 0:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [
+                model_size for model_size, entry in self._entries.items()
+                if model_size not in self._pinned
+                and entry.leases == 0 and now - entry.last_used > self.idle_timeout
+            ]
+            for model_size in expired:
+                del self._entries[model_size]
+        return len(expired)
+
+    def unload(self, model_size: str) -> bool:
+        with self._lock:
+            self._pinned.discard(model_size)
+            return self._entries.pop(model_size, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._pinned.clear()
+            self._entries.clear()
+
+    def is_loaded(self, model_size: str) -> bool:
+        with self._lock:
+            return model_size in self._entries
+
+    def loaded_models(self) -> List[str]:
+        with self._lock:
+            return sorted(self._entries.keys())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model_size: {
+                    "load_seconds": entry.load_seconds,
+                    "idle_seconds": now - entry.last_used
+                }
+                for model_size, entry in self._entries.items()
+            }
+
+
+_registries: Dict[str, WhisperModelRegistry] = {}
+_registry_lock = threading.Lock()
+
+
+def get_whisper_registry(backend: str = "whisper") -> WhisperModelRegistry:
+    registry = _registries.get(backend)
+    if registry is None:
+        loader = get_asr_loader(backend)
+        with _registry_lock:
+            registry = _registries.get(backend)
+            if registry is None:
+                registry = WhisperModelRegistry(loader=loader)
+                _registries[backend] = registry
+    return registry
@@ -0,0 +1,234 @@
+import os
+import re
+import json
+import time
+import shutil
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .prompt_generation.prompt_generator import VideoPrompt
+from .video_generation.ovi_generator import GeneratedClip
+
+
+MANIFEST_FILENAME = "manifest.json"
+SEED_STRIDE = 10007
+JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{8}$")
+
+
+@dataclass
+class ClipRecord:
+    segment_index: int
+    start_time: float
+    end_time: float
+    video_path: str
+    prompt_used: str
+    seed: Optional[int]
+    reused: bool = False
+
+    def to_clip(self) -> GeneratedClip:
+        return GeneratedClip(
+            segment_index=self.segment_index,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            video_path=self.video_path,
+            prompt_used=self.prompt_used,
+            reused=self.reused
+        )
+
+
+class JobManifest:
+    def __init__(
+        self,
+        job_dir: str,
+        job_id: str,
+        audio_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        seed: int = 100
+    ):
+        self.job_dir = Path(job_dir)
+        self.job_id = job_id
+        self.audio_path = audio_path
+        self.options = options or {}
+        self.seed = seed
+
+        self.status = "created"
+        self.phase = "final"
+        self.error: Optional[str] = None
+        self.output_path: Optional[str] = None
+        self.draft_output_path: Optional[str] = None
+        self.analysis_summary: Optional[Dict[str, Any]] = None
+        self.prompts: List[Dict[str, Any]] = []
+        self.clips: Dict[int, ClipRecord] = {}
+        self.draft_clips: Dict[int, ClipRecord] = {}
+        self.seed_offsets: Dict[int, int] = {}
+        self.segment_profiles: List[Dict[str, Any]] = []
+        self.step_plan: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.job_dir / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, job_dir: str) -> "JobManifest":
+        path = Path(job_dir) / MANIFEST_FILENAME
+        if not path.exists():
+            raise FileNotFoundError(f"No job manifest found in {job_dir}")
+
+        with open(path) as f:
+            data = json.load(f)
+
+        manifest = cls(
+            job_dir=job_dir,
+            job_id=data["job_id"],
+            audio_path=data["audio_path"],
+            options=data.get("options"),
+            seed=data.get("seed", 100)
+        )
+        manifest.status = data.get("status", "created")
+        manifest.phase = data.get("phase", "final")
+        manifest.error = data.get("error")
+        manifest.output_path = data.get("output_path")
+        manifest.draft_output_path = data.get("draft_output_path")
+        manifest.analysis_summary = data.get("analysis_summary")
+        manifest.prompts = data.get("prompts", [])
+        manifest.clips = {
+            int(record["segment_index"]): ClipRecord(**record)
+            for record in data.get("clips", [])
+        }
+        manifest.draft_clips = {
+            int(record["segment_index"]): ClipRecord(**record)
+            for record in data.get("draft_clips", [])
+        }
+        manifest.seed_offsets = {
+            int(idx): offset for idx, offset in data.get("seed_offsets", {}).items()
+        }
+        manifest.segment_profiles = data.get("segment_profiles", [])
+        manifest.step_plan = data.get("step_plan")
+        manifest.created_at = data.get("created_at", manifest.created_at)
+        manifest.updated_at = data.get("updated_at", manifest.updated_at)
+        return manifest
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "audio_path": self.audio_path,
+            "options": self.options,
+            "seed": self.seed,
+            "status": self.status,
+            "phase": self.phase,
+            "error": self.error,
+            "output_path": self.output_path,
+            "draft_output_path": self.draft_output_path,
+            "analysis_summary": self.analysis_summary,
+            "prompts": self.prompts,
+            "clips": [asdict(self.clips[idx]) for idx in sorted(self.clips)],
+            "draft_clips": [asdict(self.draft_clips[idx]) for idx in sorted(self.draft_clips)],
+            "seed_offsets": self.seed_offsets,
+            "segment_profiles": self.segment_profiles,
+            "step_plan": self.step_plan,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+    def save(self):
+        with self._lock:
+            self.updated_at = time.time()
+            self.job_dir.mkdir(parents=True, exist_ok=True)
+
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+
+    def set_prompts(self, prompts: List[VideoPrompt]):
+        self.prompts = [asdict(prompt) for prompt in prompts]
+        self.save()
+
+    def get_prompts(self) -> List[VideoPrompt]:
+        return [VideoPrompt(**prompt) for prompt in self.prompts]
+
+    def segment_seed_base(self, segment_index: int) -> int:
+        return self.seed + self.seed_offsets.get(segment_index, 0) * SEED_STRIDE
+
+    def segment_seed(self, segment_index: int) -> int:
+        return self.segment_seed_base(segment_index) + segment_index
+
+    def reject_segments(self, segment_indices: List[int]):
+        for idx in segment_indices:
+            self.seed_offsets[idx] = self.seed_offsets.get(idx, 0) + 1
+            self.clips.pop(idx, None)
+        self.save()
+
+    def promote_draft(self):
+        self.draft_clips = self.clips
+        self.clips = {}
+        self.phase = "final"
+        self.save()
+
+    def record_clip(self, clip: GeneratedClip, seed: Optional[int] = None):
+        self.clips[clip.segment_index] = ClipRecord(
+            segment_index=clip.segment_index,
+            start_time=clip.start_time,
+            end_time=clip.end_time,
+            video_path=clip.video_path,
+            prompt_used=clip.prompt_used,
+            seed=seed,
+            reused=clip.reused
+        )
+        self.save()
+
+    def completed_clips(self) -> List[GeneratedClip]:
+        return [
+            self.clips[idx].to_clip() for idx in sorted(self.clips)
+            if os.path.exists(self.clips[idx].video_path)
+        ]
+
+    def pending_prompts(self) -> List[VideoPrompt]:
+        completed = {clip.segment_index for clip in self.completed_clips()}
+        return [prompt for prompt in self.get_prompts() if prompt.segment_index not in completed]
+
+    def mark(self, status: str, **fields: Any):
+        self.status = status
+        for key, value in fields.items():
+            setattr(self, key, value)
+        self.save()
+
+
+def list_job_manifests(jobs_dir: str) -> List[JobManifest]:
+    root = Path(jobs_dir)
+    if not root.exists():
+        return []
+
+    manifests = []
+    for job_dir in sorted(root.iterdir()):
+        if (job_dir / MANIFEST_FILENAME).exists():
+            try:
+                manifests.append(JobManifest.load(str(job_dir)))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Skipping unreadable job manifest in {job_dir}: {e}")
+    return manifests
+
+
+def job_dir_path(jobs_dir: str, job_id: str) -> Optional[Path]:
+    if not JOB_ID_PATTERN.match(job_id or ""):
+        return None
+
+    root = Path(jobs_dir).resolve()
+    job_dir = (root / job_id).resolve()
+    if job_dir.parent != root:
+        return None
+    return job_dir
+
+
+def remove_job_dir(jobs_dir: str, job_id: str) -> bool:
+    job_dir = job_dir_path(jobs_dir, job_id)
+    if job_dir is None or not job_dir.exists():
+        return False
+    shutil.rmtree(job_dir, ignore_errors=True)
+    return True
@@ -1,17 +1,51 @@
 import os
+import math
+import time
 import uuid
-import shutil
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass
+import queue
+import threading
+from typing import Optional, Callable, Dict, Any, List, Tuple
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
 from enum import Enum
 
 from .audio_analysis import AudioAnalyzer
+from .audio_analysis.analyzer import AudioAnalysisResult
 from .prompt_generation import PromptGenerator
-from .video_generation import OviVideoGenerator, VideoComposer, MockOviVideoGenerator
-from .video_generation.ovi_generator import GenerationConfig
+from .prompt_generation.prompt_generator import VideoPrompt
+from .video_generation import (
+    OviVideoGenerator,
+    VideoComposer,
+    MockOviVideoGenerator,
+    get_clip_library,
+    get_clip_cache,
+    get_engine_worker
+)
+from .video_generation.ovi_generator import GenerationConfig, GeneratedClip
 from .video_generation.video_composer import CompositionConfig
+from .video_generation.step_planner import (
+    SegmentProfile,
+    StepPlan,
+    StepPlanner,
+    profile_segments,
+    get_seconds_per_step
+)
 from .utils import Config, validate_audio_file, ensure_directory
+from .job_manifest import JobManifest, list_job_manifests, remove_job_dir
+
+
+def _scaled_dimension(size: int, scale: float) -> int:
+    if scale >= 1.0:
+        return size
+    return max(32, int(size * scale) // 32 * 32)
+
+
+def _parse_resolution(value: str) -> Optional[Tuple[int, int]]:
+    if not value:
+        return None
+
+    width, height = value.lower().split("x")
+    return int(width), int(height)
 
 
 class PipelineStatus(Enum):
@@ -40,6 +74,9 @@ class MusicVideoResult:
     duration: float
     segments_generated: int
     analysis_summary: Dict[str, Any]
+    is_draft: bool = False
+    step_plan: Optional[Dict[str, Any]] = None
+    resolution_report: Optional[Dict[str, Any]] = None
 
 
 class MusicVideoPipeline:
@@ -56,40 +93,86 @@ class MusicVideoPipeline:
         self.config.ensure_directories()
 
         self.audio_analyzer = AudioAnalyzer(
-            segment_duration=self.config.segment_duration
+            segment_duration=self.config.segment_duration,
+            whisper_model=self.config.whisper_model,
+            vocal_gating=self.config.vocal_gating,
+            lyrics_workers=self.config.lyrics_workers,
+            lyrics_chunk_duration=self.config.lyrics_chunk_duration,
+            lyrics_backend=self.config.lyrics_backend
         )
 
-        self.prompt_generator = PromptGenerator()
+        self.prompt_generator = PromptGenerator(
+            vocabulary_path=self.config.visual_vocabulary_path or None
+        )
 
-        gen_config = GenerationConfig(
+        self.generation_config = gen_config = GenerationConfig(
             model_name=self.config.model_name,
-            video_height=self.config.video_height,
-            video_width=self.config.video_width,
+            video_height=_scaled_dimension(self.config.video_height, self.config.generation_scale),
+            video_width=_scaled_dimension(self.config.video_width, self.config.generation_scale),
             sample_steps=self.config.sample_steps,
             video_guidance_scale=self.config.video_guidance_scale,
             audio_guidance_scale=self.config.audio_guidance_scale,
             cpu_offload=self.config.cpu_offload,
-            fp8=self.config.fp8
+            fp8=self.config.fp8,
+            batch_memory_gb=self.config.batch_memory_gb,
+            clip_memory_gb=self.config.clip_memory_gb,
+            num_workers=self.config.generation_workers,
+            devices=self.config.generation_devices,
+            text_embedding_cache_size=self.config.text_embedding_cache_size,
+            frame_handoff_gb=self.config.frame_handoff_gb,
+            mock_latency=self.config.mock_latency,
+            generation_fps=self.config.generation_fps
         )
 
+        self.clip_library = None
+        if self.config.clip_reuse:
+            self.clip_library = get_clip_library(
+                self.config.clip_library_dir,
+                threshold=self.config.clip_reuse_threshold,
+                max_bytes=int(self.config.clip_library_max_gb * 1024 ** 3)
+            )
+
         if use_mock_generator:
             self.video_generator = MockOviVideoGenerator(
                 ovi_path=self.config.ovi_path,
-                config=gen_config
+                config=gen_config,
+                clip_library=self.clip_library
             )
         else:
+            engine_worker = None
+            if self.config.ovi_engine_worker and self.config.generation_workers <= 1:
+                engine_worker = get_engine_worker(self.config.ovi_path, gen_config)
+
+            clip_cache = None
+            if self.config.clip_cache:
+                clip_cache = get_clip_cache(
+                    self.config.clip_cache_dir,
+                    max_bytes=int(self.config.clip_cache_max_gb * 1024 ** 3)
+                )
+
             self.video_generator = OviVideoGenerator(
                 ovi_path=self.config.ovi_path,
-                config=gen_config
+                config=gen_config,
+                clip_library=self.clip_library,
+                engine_worker=engine_worker,
+                clip_cache=clip_cache
             )
 
-        comp_config = CompositionConfig(
+        output_resolution = _parse_resolution(self.config.output_resolution)
+        if output_resolution is None and self.config.generation_scale < 1.0:
+            output_resolution = (self.config.video_width, self.config.video_height)
+
+        self.composition_config = comp_config = CompositionConfig(
+            output_resolution=output_resolution or CompositionConfig.output_resolution,
+            upscale_method=self.config.upscale_method if output_resolution else "none",
+            superres_model=self.config.superres_model,
             crossfade_duration=self.config.crossfade_duration,
             video_codec=self.config.output_video_codec,
             audio_codec=self.config.output_audio_codec,
             video_bitrate=self.config.output_video_bitrate,
             audio_bitrate=self.config.output_audio_bitrate,
-            enable_lipsync=self.config.enable_lipsync
+            enable_lipsync=self.config.enable_lipsync,
+            frame_interpolation=self.config.frame_interpolation
         )
 
         self.video_composer = VideoComposer(
@@ -125,56 +208,398 @@ class MusicVideoPipeline:
         output_filename: Optional[str] = None,
         style_override: Optional[str] = None,
         custom_theme: Optional[str] = None,
-        extract_lyrics: bool = True
+        extract_lyrics: bool = True,
+        job_id: Optional[str] = None,
+        draft: bool = False,
+        deadline_seconds: Optional[float] = None,
+        segment_priorities: Optional[Dict[int, float]] = None
     ) -> MusicVideoResult:
-        job_id = str(uuid.uuid4())[:8]
+        job_id = job_id or str(uuid.uuid4())[:8]
 
         valid, error = validate_audio_file(audio_path)
         if not valid:
             raise ValueError(f"Invalid audio file: {error}")
 
-        job_temp_dir = os.path.join(self.config.temp_dir, job_id)
-        ensure_directory(job_temp_dir)
+        job_dir = ensure_directory(os.path.join(self.config.jobs_dir, job_id))
+
+        manifest = JobManifest(
+            job_dir=job_dir,
+            job_id=job_id,
+            audio_path=audio_path,
+            options={
+                "output_filename": output_filename,
+                "style_override": style_override,
+                "custom_theme": custom_theme,
+                "extract_lyrics": extract_lyrics,
+                "deadline_seconds": deadline_seconds,
+                "segment_priorities": {
+                    str(idx): priority for idx, priority in (segment_priorities or {}).items()
+                }
+            },
+            seed=self.generation_config.seed
+        )
+        if draft:
+            manifest.phase = "draft"
 
-        try:
-            self._update_progress(
-                PipelineStatus.ANALYZING, 0.1,
-                "Analyzing audio...", 1, 4
+        return self._run_job(manifest)
+
+    def refine(self, job_id: str, rejected_segments: Optional[List[int]] = None) -> MusicVideoResult:
+        manifest = JobManifest.load(os.path.join(self.config.jobs_dir, job_id))
+
+        if manifest.phase != "draft":
+            raise ValueError(f"Job {job_id} has no draft to refine")
+
+        valid, error = validate_audio_file(manifest.audio_path)
+        if not valid:
+            raise ValueError(f"Invalid audio file: {error}")
+
+        if rejected_segments:
+            manifest.reject_segments(rejected_segments)
+        else:
+            manifest.promote_draft()
+
+        return self._run_job(manifest)
+
+    def resume(self, job_id: str) -> MusicVideoResult:
+        manifest = JobManifest.load(os.path.join(self.config.jobs_dir, job_id))
+
+        valid, error = validate_audio_file(manifest.audio_path)
+        if not valid:
+            raise ValueError(f"Invalid audio file: {error}")
+
+        return self._run_job(manifest)
+
+    def cleanup_job(self, job_id: str) -> bool:
+        return remove_job_dir(self.config.jobs_dir, job_id)
+
+    def resumable_jobs(self) -> List[str]:
+        return [
+            manifest.job_id for manifest in list_job_manifests(self.config.jobs_dir)
+            if manifest.status not in ("completed", "draft_ready")
+        ]
+
+    def _apply_draft_settings(self):
+        gen_config = self.video_generator.config
+        original = (
+            gen_config.sample_steps, gen_config.video_height, gen_config.video_width,
+            gen_config.frame_handoff_gb
+        )
+
+        gen_config.sample_steps = self.config.draft_sample_steps
+        gen_config.frame_handoff_gb = 0.0
+        gen_config.video_height = _scaled_dimension(self.config.video_height, self.config.draft_scale)
+        gen_config.video_width = _scaled_dimension(self.config.video_width, self.config.draft_scale)
+
+        return original
+
+    def _restore_generation_settings(self, original):
+        gen_config = self.video_generator.config
+        (
+            gen_config.sample_steps, gen_config.video_height, gen_config.video_width,
+            gen_config.frame_handoff_gb
+        ) = original
+
+    def _plan_steps(
+        self,
+        manifest: JobManifest,
+        prompts: List[VideoPrompt],
+        elapsed: float
+    ) -> Optional[StepPlan]:
+        deadline = manifest.options.get("deadline_seconds")
+        if manifest.phase == "draft" or not prompts or not (self.config.adaptive_steps or deadline):
+            return None
+
+        profiles = {}
+        if self.config.adaptive_steps:
+            profiles = {
+                profile["segment_index"]: SegmentProfile(**profile)
+                for profile in manifest.segment_profiles
+            }
+
+        planner = StepPlanner(
+            base_steps=self.config.sample_steps,
+            min_steps=self.config.min_sample_steps,
+            max_steps=self.config.max_sample_steps
+        )
+        seconds_per_step = get_seconds_per_step(self.video_generator.timing_key())
+
+        return planner.plan(
+            [
+                profiles.get(prompt.segment_index, SegmentProfile(prompt.segment_index, energy=0.5))
+                for prompt in prompts
+            ],
+            deadline_seconds=deadline - elapsed if deadline else None,
+            seconds_per_step=seconds_per_step or self.config.seconds_per_step,
+            parallelism=self.config.generation_workers
+        )
+
+    def _record_analysis(
+        self,
+        manifest: JobManifest,
+        analysis: AudioAnalysisResult,
+        prompts: List[VideoPrompt]
+    ) -> Dict[str, Any]:
+        manifest.analysis_summary = {
+            "duration": analysis.duration,
+            "tempo": analysis.overall_tempo,
+            "mood": analysis.overall_mood,
+            "genre": analysis.genre_prediction,
+            "segments": len(analysis.segments),
+            "has_lyrics": analysis.lyrics is not None,
+            "lyrics_skipped_fraction": analysis.lyrics_skipped_fraction
+        }
+        manifest.segment_profiles = [
+            asdict(profile) for profile in profile_segments(
+                analysis.segments,
+                priorities={
+                    int(idx): priority
+                    for idx, priority in (manifest.options.get("segment_priorities") or {}).items()
+                }
             )
+        ]
+        manifest.set_prompts(prompts)
+        return manifest.analysis_summary
 
-            analysis = self.audio_analyzer.analyze(
-                audio_path,
-                extract_lyrics=extract_lyrics
+    def _generate_pending(
+        self,
+        manifest: JobManifest,
+        prompts: List[VideoPrompt],
+        job_dir: str,
+        new_clips: list
+    ) -> float:
+        started = time.monotonic()
+        new_clips.extend(self.video_generator.generate_clips(
+            [replace(prompt, seed=manifest.segment_seed(prompt.segment_index)) for prompt in prompts],
+            output_dir=job_dir,
+            seed=manifest.seed
+        ))
+
+        return time.monotonic() - started
+
+    def _resolution_report(self, generation_seconds: float) -> Optional[Dict[str, Any]]:
+        gen_config = self.generation_config
+        native = (self.config.video_width, self.config.video_height)
+        generated = (gen_config.video_width, gen_config.video_height)
+        if generated == native:
+            return None
+
+        measured = get_seconds_per_step(self.video_generator.timing_key())
+        native_rate = get_seconds_per_step(
+            (gen_config.model_name, native[1], native[0], gen_config.fp8, gen_config.generation_fps)
+        )
+        if measured and native_rate:
+            ratio, basis = native_rate / measured, "measured"
+        else:
+            ratio, basis = (native[0] * native[1]) / (generated[0] * generated[1]), "pixel_ratio"
+
+        composition = self.composition_config
+        native_seconds = generation_seconds * ratio
+        return {
+            "generated_resolution": f"{generated[0]}x{generated[1]}",
+            "native_resolution": f"{native[0]}x{native[1]}",
+            "output_resolution": (
+                "x".join(str(value) for value in composition.output_resolution)
+                if composition.upscale_method != "none" else None
+            ),
+            "upscale_method": composition.upscale_method,
+            "generation_seconds": generation_seconds,
+            "native_seconds_estimate": native_seconds,
+            "seconds_saved": native_seconds - generation_seconds,
+            "speedup": ratio,
+            "estimate_basis": basis
+        }
+
+    def _can_stream(self, manifest: JobManifest) -> bool:
+        if not self.config.streaming_pipeline:
+            return False
+        if manifest.phase == "draft":
+            return True
+        return not (self.config.adaptive_steps or manifest.options.get("deadline_seconds"))
+
+    def _stream_generation(
+        self,
+        manifest: JobManifest,
+        job_dir: str,
+        completed_clips: List[GeneratedClip],
+        new_clips: list
+    ):
+        options = manifest.options
+        completed = {clip.segment_index for clip in completed_clips}
+        items: "queue.Queue" = queue.Queue()
+
+        def produce():
+            try:
+                for item in self.audio_analyzer.analyze_stream(
+                    manifest.audio_path,
+                    extract_lyrics=options.get("extract_lyrics", True)
+                ):
+                    items.put(item)
+                items.put(None)
+            except Exception as e:
+                items.put(e)
+
+        producer = threading.Thread(target=produce, name="analysis-stream", daemon=True)
+        producer.start()
+
+        self.video_generator.progress_callback = None
+        analysis = None
+        prompts: Dict[int, VideoPrompt] = {}
+        generation_seconds = 0.0
+        finished = False
+
+        while not finished:
+            batch = [items.get()]
+            while not items.empty():
+                batch.append(items.get_nowait())
+
+            ready = []
+            for item in batch:
+                if item is None:
+                    finished = True
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    analysis, segment_index = item
+                    ready.append(segment_index)
+
+            if not ready:
+                continue
+
+            for segment_index in ready:
+                prompts[segment_index] = self.prompt_generator.prompt_for_segment(
+                    analysis,
+                    segment_index,
+                    style_override=options.get("style_override"),
+                    custom_theme=options.get("custom_theme")
+                )
+            manifest.set_prompts([prompts[idx] for idx in sorted(prompts)])
+
+            generation_seconds += self._generate_pending(
+                manifest,
+                [prompts[idx] for idx in ready if idx not in completed],
+                job_dir,
+                new_clips
             )
 
+            expected = max(len(prompts), math.ceil(analysis.duration / self.config.segment_duration))
             self._update_progress(
-                PipelineStatus.GENERATING_PROMPTS, 0.2,
-                "Generating visual prompts...", 2, 4
+                PipelineStatus.GENERATING_VIDEO, 0.1 + 0.7 * len(prompts) / expected,
+                f"Generated clips for {len(prompts)}/{expected} analyzed segments", 3, 4
             )
 
-            prompts = self.prompt_generator.generate_prompts(
-                analysis,
-                style_override=style_override,
-                custom_theme=custom_theme
-            )
+        producer.join()
 
-            self._update_progress(
-                PipelineStatus.GENERATING_VIDEO, 0.3,
-                "Generating video clips...", 3, 4
+        if analysis is None:
+            raise ValueError("Audio analysis produced no segments")
+
+        return analysis, [prompts[idx] for idx in sorted(prompts)], generation_seconds
+
+    def _run_job(self, manifest: JobManifest) -> MusicVideoResult:
+        options = manifest.options
+        audio_path = manifest.audio_path
+        is_draft = manifest.phase == "draft"
+        job_dir = str(manifest.job_dir / "draft") if is_draft else str(manifest.job_dir)
+        original_settings = self._apply_draft_settings() if is_draft else None
+        new_clips = []
+        started = time.monotonic()
+
+        try:
+            manifest.mark("running", error=None)
+            analysis_summary = manifest.analysis_summary
+
+            needs_analysis = not manifest.prompts or analysis_summary is None
+            step_plan = None
+
+            self.video_generator.clip_callback = lambda clip: manifest.record_clip(
+                clip, manifest.segment_seed(clip.segment_index)
             )
 
-            def video_progress(current, total, msg):
-                progress = 0.3 + (current / total) * 0.5
+            if needs_analysis and self._can_stream(manifest):
                 self._update_progress(
-                    PipelineStatus.GENERATING_VIDEO, progress,
-                    msg, 3, 4
+                    PipelineStatus.ANALYZING, 0.1,
+                    "Analyzing audio and generating clips as segments are ready...", 1, 4
                 )
 
-            self.video_generator.progress_callback = video_progress
+                completed_clips = manifest.completed_clips()
+                analysis, prompts, generation_seconds = self._stream_generation(
+                    manifest, job_dir, completed_clips, new_clips
+                )
+                analysis_summary = self._record_analysis(manifest, analysis, prompts)
+            else:
+                if needs_analysis:
+                    self._update_progress(
+                        PipelineStatus.ANALYZING, 0.1,
+                        "Analyzing audio...", 1, 4
+                    )
+
+                    analysis = self.audio_analyzer.analyze(
+                        audio_path,
+                        extract_lyrics=options.get("extract_lyrics", True)
+                    )
+
+                    self._update_progress(
+                        PipelineStatus.GENERATING_PROMPTS, 0.2,
+                        "Generating visual prompts...", 2, 4
+                    )
+
+                    prompts = self.prompt_generator.generate_prompts(
+                        analysis,
+                        style_override=options.get("style_override"),
+                        custom_theme=options.get("custom_theme")
+                    )
+                    analysis_summary = self._record_analysis(manifest, analysis, prompts)
+                else:
+                    prompts = manifest.get_prompts()
+
+                completed_clips = manifest.completed_clips()
+                pending_prompts = manifest.pending_prompts()
+
+                self._update_progress(
+                    PipelineStatus.GENERATING_VIDEO, 0.3,
+                    f"Generating video clips ({len(completed_clips)} already done)..."
+                    if completed_clips else "Generating video clips...", 3, 4
+                )
 
-            clips = self.video_generator.generate_clips(
-                prompts,
-                output_dir=job_temp_dir
+                def video_progress(current, total, msg):
+                    progress = 0.3 + (current / total) * 0.5
+                    self._update_progress(
+                        PipelineStatus.GENERATING_VIDEO, progress,
+                        msg, 3, 4
+                    )
+
+                self.video_generator.progress_callback = video_progress
+
+                step_plan = self._plan_steps(manifest, pending_prompts, time.monotonic() - started)
+                if step_plan is not None:
+                    pending_prompts = [
+                        replace(prompt, sample_steps=step_plan.steps[prompt.segment_index])
+                        for prompt in pending_prompts
+                    ]
+                    print(
+                        f"Step plan ({step_plan.mode}): {step_plan.total_steps} steps over "
+                        f"{len(pending_prompts)} segments"
+                    )
+
+                generation_seconds = self._generate_pending(manifest, pending_prompts, job_dir, new_clips)
+
+                if step_plan is not None:
+                    step_plan.measured_seconds = generation_seconds
+                    step_plan.measured_seconds_per_step = get_seconds_per_step(self.video_generator.timing_key())
+                    manifest.step_plan = step_plan.to_dict()
+                    manifest.save()
+
+            resolution_report = None if is_draft else self._resolution_report(generation_seconds)
+            if resolution_report is not None:
+                print(
+                    f"Generated at {resolution_report['generated_resolution']} in "
+                    f"{resolution_report['generation_seconds']:.1f}s, about "
+                    f"{resolution_report['seconds_saved']:.1f}s less than at "
+                    f"{resolution_report['native_resolution']}"
+                )
+
+            clips = sorted(
+                completed_clips + new_clips,
+                key=lambda clip: getattr(clip, "segment_index", 0)
             )
 
             self._update_progress(
@@ -182,13 +607,28 @@ class MusicVideoPipeline:
                 "Composing final video...", 4, 4
             )
 
-            if output_filename:
+            output_filename = options.get("output_filename")
+            if is_draft:
+                audio_name = Path(audio_path).stem
+                output_path = os.path.join(
+                    self.config.output_dir,
+                    f"{audio_name}_draft_{manifest.job_id}.mp4"
+                )
+            elif output_filename:
                 output_path = os.path.join(self.config.output_dir, output_filename)
             else:
                 audio_name = Path(audio_path).stem
                 output_path = os.path.join(
                     self.config.output_dir,
-                    f"{audio_name}_musicvideo_{job_id}.mp4"
+                    f"{audio_name}_musicvideo_{manifest.job_id}.mp4"
+                )
+
+            clips_reused = sum(1 for clip in clips if getattr(clip, "reused", False))
+            if self.clip_library is not None:
+                library_stats = self.clip_library.stats()
+                print(
+                    f"Reused {clips_reused}/{len(clips)} clips from library "
+                    f"(overall hit rate {library_stats['hit_rate']:.0%})"
                 )
 
             self.video_composer.compose_music_video(
@@ -198,29 +638,37 @@ class MusicVideoPipeline:
                 use_crossfade=True
             )
 
+            if is_draft:
+                manifest.mark("draft_ready", draft_output_path=output_path)
+            else:
+                manifest.mark("completed", output_path=output_path)
+
             self._update_progress(
                 PipelineStatus.COMPLETED, 1.0,
-                "Music video generated successfully!", 4, 4
+                "Draft ready for review" if is_draft else "Music video generated successfully!", 4, 4
             )
 
             analysis_summary = {
-                "duration": analysis.duration,
-                "tempo": analysis.overall_tempo,
-                "mood": analysis.overall_mood,
-                "genre": analysis.genre_prediction,
-                "segments": len(analysis.segments),
-                "has_lyrics": analysis.lyrics is not None
+                **analysis_summary,
+                "clips_reused": clips_reused,
+                "clip_reuse_rate": clips_reused / len(clips) if clips else 0.0,
+                "clips_resumed": len(completed_clips),
+                "phase": manifest.phase
             }
 
             return MusicVideoResult(
-                job_id=job_id,
+                job_id=manifest.job_id,
                 output_path=output_path,
-                duration=analysis.duration,
+                duration=analysis_summary["duration"],
                 segments_generated=len(clips),
-                analysis_summary=analysis_summary
+                analysis_summary=analysis_summary,
+                is_draft=is_draft,
+                step_plan=step_plan.to_dict() if step_plan is not None else None,
+                resolution_report=resolution_report
             )
 
         except Exception as e:
+            manifest.mark("failed", error=str(e))
             self._update_progress(
                 PipelineStatus.ERROR, 0.0,
                 f"Error: {str(e)}", 0, 4
@@ -228,47 +676,56 @@ class MusicVideoPipeline:
             raise
 
         finally:
-            if os.path.exists(job_temp_dir):
-                shutil.rmtree(job_temp_dir, ignore_errors=True)
-
-    def analyze_only(self, audio_path: str) -> Dict[str, Any]:
+            self.video_generator.clip_callback = None
+            for clip in new_clips:
+                if isinstance(clip, GeneratedClip) and clip.frames is not None:
+                    clip.frames.release()
+            if original_settings is not None:
+                self._restore_generation_settings(original_settings)
+
+    def analyze_audio(
+        self,
+        audio_path: str,
+        extract_lyrics: bool = False
+    ) -> AudioAnalysisResult:
         valid, error = validate_audio_file(audio_path)
         if not valid:
             raise ValueError(f"Invalid audio file: {error}")
 
-        analysis = self.audio_analyzer.analyze(audio_path, extract_lyrics=True)
+        return self.audio_analyzer.analyze(audio_path, extract_lyrics=extract_lyrics)
 
-        return {
-            "duration": analysis.duration,
-            "tempo": analysis.overall_tempo,
-            "mood": analysis.overall_mood,
-            "genre": analysis.genre_prediction,
-            "segments": [
-                {
-                    "start_time": seg.start_time,
-                    "end_time": seg.end_time,
-                    "tempo": seg.tempo,
-                    "energy": seg.energy,
-                    "mood": seg.mood,
-                    "lyrics": seg.lyrics
-                }
-                for seg in analysis.segments
-            ],
-            "lyrics": analysis.lyrics,
-            "beat_count": len(analysis.beat_times)
-        }
+    def refine_with_lyrics(
+        self,
+        audio_path: str,
+        analysis: AudioAnalysisResult
+    ) -> AudioAnalysisResult:
+        transcription = self.audio_analyzer.transcribe_lyrics(audio_path)
+        return self.audio_analyzer.apply_lyrics(analysis, transcription)
+
+    def analyze_only(self, audio_path: str, extract_lyrics: bool = False) -> Dict[str, Any]:
+        analysis = self.analyze_audio(audio_path, extract_lyrics=extract_lyrics)
+        return self.summarize_analysis(analysis)
 
     def preview_prompts(
         self,
         audio_path: str,
         style_override: Optional[str] = None,
-        custom_theme: Optional[str] = None
+        custom_theme: Optional[str] = None,
+        extract_lyrics: bool = False
     ) -> list:
-        valid, error = validate_audio_file(audio_path)
-        if not valid:
-            raise ValueError(f"Invalid audio file: {error}")
+        analysis = self.analyze_audio(audio_path, extract_lyrics=extract_lyrics)
+        return self.prompts_for_analysis(
+            analysis,
+            style_override=style_override,
+            custom_theme=custom_theme
+        )
 
-        analysis = self.audio_analyzer.analyze(audio_path, extract_lyrics=True)
+    def prompts_for_analysis(
+        self,
+        analysis: AudioAnalysisResult,
+        style_override: Optional[str] = None,
+        custom_theme: Optional[str] = None
+    ) -> list:
         prompts = self.prompt_generator.generate_prompts(
             analysis,
             style_override=style_override,
@@ -287,6 +744,28 @@ class MusicVideoPipeline:
             for p in prompts
         ]
 
+    def summarize_analysis(self, analysis: AudioAnalysisResult) -> Dict[str, Any]:
+        return {
+            "duration": analysis.duration,
+            "tempo": analysis.overall_tempo,
+            "mood": analysis.overall_mood,
+            "genre": analysis.genre_prediction,
+            "segments": [
+                {
+                    "start_time": seg.start_time,
+                    "end_time": seg.end_time,
+                    "tempo": seg.tempo,
+                    "energy": seg.energy,
+                    "mood": seg.mood,
+                    "lyrics": seg.lyrics
+                }
+                for seg in analysis.segments
+            ],
+            "lyrics": analysis.lyrics,
+            "lyrics_skipped_fraction": analysis.lyrics_skipped_fraction,
+            "beat_count": len(analysis.beat_times)
+        }
+
     @property
     def status(self) -> PipelineStatus:
         return self._current_status
@@ -1,4 +1,5 @@
 from .prompt_generator import PromptGenerator
 from .visual_theme_mapper import VisualThemeMapper
+from .visual_vocabulary import VisualVocabularyMatcher, get_visual_matcher
 
-__all__ = ['PromptGenerator', 'VisualThemeMapper']
+__all__ = ['PromptGenerator', 'VisualThemeMapper', 'VisualVocabularyMatcher', 'get_visual_matcher']
@@ -1,9 +1,11 @@
 import random
+import hashlib
 from typing import List, Optional
 from dataclasses import dataclass
 
 from ..audio_analysis.analyzer import AudioAnalysisResult, AudioSegment
 from .visual_theme_mapper import VisualThemeMapper
+from .visual_vocabulary import get_visual_matcher
 
 
 @dataclass
@@ -14,12 +16,22 @@ class VideoPrompt:
     prompt_text: str
     audio_description: str
     negative_prompt: str
+    sample_steps: Optional[int] = None
+    seed: Optional[int] = None
 
 
 class PromptGenerator:
-    def __init__(self, creativity_level: float = 0.7):
+    def __init__(
+        self,
+        creativity_level: float = 0.7,
+        seed: int = 0,
+        vocabulary_path: Optional[str] = None
+    ):
         self.theme_mapper = VisualThemeMapper()
+        self.visual_matcher = get_visual_matcher(vocabulary_path)
         self.creativity_level = creativity_level
+        self.seed = seed
+        self._rng = random.Random(seed)
 
     def generate_prompts(
         self,
@@ -27,20 +39,61 @@ class PromptGenerator:
         style_override: Optional[str] = None,
         custom_theme: Optional[str] = None
     ) -> List[VideoPrompt]:
-        prompts = []
+        return [
+            self.prompt_for_segment(analysis, idx, style_override, custom_theme)
+            for idx in range(len(analysis.segments))
+        ]
+
+    def prompt_for_segment(
+        self,
+        analysis: AudioAnalysisResult,
+        segment_index: int,
+        style_override: Optional[str] = None,
+        custom_theme: Optional[str] = None
+    ) -> VideoPrompt:
+        return self._generate_segment_prompt(
+            segment=analysis.segments[segment_index],
+            segment_index=segment_index,
+            overall_mood=analysis.overall_mood,
+            genre=analysis.genre_prediction,
+            style_override=style_override,
+            custom_theme=custom_theme,
+            content_key=analysis.content_hash or self._analysis_fingerprint(analysis)
+        )
 
-        for idx, segment in enumerate(analysis.segments):
-            prompt = self._generate_segment_prompt(
-                segment=segment,
-                segment_index=idx,
-                overall_mood=analysis.overall_mood,
-                genre=analysis.genre_prediction,
-                style_override=style_override,
-                custom_theme=custom_theme
-            )
-            prompts.append(prompt)
+    def _analysis_fingerprint(self, analysis: AudioAnalysisResult) -> str:
+        return "|".join([
+            f"{analysis.duration:.3f}",
+            f"{analysis.overall_tempo:.3f}",
+            analysis.overall_mood,
+            analysis.genre_prediction,
+            str(len(analysis.segments))
+        ])
+
+    def _segment_fingerprint(self, segment: AudioSegment) -> str:
+        return "|".join([
+            f"{segment.start_time:.3f}",
+            f"{segment.end_time:.3f}",
+            f"{segment.tempo:.3f}",
+            f"{segment.energy:.6f}",
+            segment.mood
+        ])
 
-        return prompts
+    def _segment_seed(
+        self,
+        content_key: str,
+        segment_index: int,
+        style_override: Optional[str],
+        custom_theme: Optional[str]
+    ) -> int:
+        material = "|".join([
+            str(self.seed),
+            content_key,
+            str(segment_index),
+            style_override or "",
+            custom_theme or ""
+        ])
+        return int.from_bytes(hashlib.sha256(material.encode("utf-8")).digest()[:8], "big")
 
     def _generate_segment_prompt(
         self,
@@ -49,18 +102,26 @@ class PromptGenerator:
         overall_mood: str,
         genre: str,
         style_override: Optional[str] = None,
-        custom_theme: Optional[str] = None
+        custom_theme: Optional[str] = None,
+        content_key: Optional[str] = None
     ) -> VideoPrompt:
+        self._rng.seed(self._segment_seed(
+            content_key or self._segment_fingerprint(segment),
+            segment_index,
+            style_override,
+            custom_theme
+        ))
+
         visual_elements = self.theme_mapper.get_visual_elements(segment.mood)
         genre_aesthetics = self.theme_mapper.get_genre_aesthetics(genre)
         pacing = self.theme_mapper.get_tempo_pacing(segment.tempo)
         intensity = self.theme_mapper.map_energy_to_intensity(segment.energy)
         color_grading = self.theme_mapper.get_color_grading(segment.mood, genre)
 
-        scene = random.choice(visual_elements["scenes"])
-        environment = random.choice(visual_elements["environments"])
-        movement = random.choice(visual_elements["movements"])
-        style = style_override or random.choice(genre_aesthetics["style"])
+        scene = self._rng.choice(visual_elements["scenes"])
+        environment = self._rng.choice(visual_elements["environments"])
+        movement = self._rng.choice(visual_elements["movements"])
+        style = style_override or self._rng.choice(genre_aesthetics["style"])
 
         prompt_parts = []
 
@@ -148,43 +209,10 @@ class PromptGenerator:
         if not lyrics:
             return None
 
-        visual_keywords = {
-            "sky": "expansive sky views",
-            "sun": "warm sunlight",
-            "moon": "moonlit atmosphere",
-            "star": "starry night sky",
-            "rain": "rainfall effects",
-            "fire": "flame elements",
-            "ocean": "ocean waves",
-            "sea": "maritime scenery",
-            "mountain": "mountain landscapes",
-            "forest": "forest environment",
-            "city": "urban cityscape",
-            "night": "nighttime setting",
-            "day": "daylight scenes",
-            "love": "romantic imagery",
-            "heart": "love symbolism",
-            "dream": "dreamlike sequences",
-            "dance": "dancing figures",
-            "fly": "flying/soaring motion",
-            "run": "running movement",
-            "light": "dramatic lighting",
-            "dark": "shadowy atmosphere",
-            "gold": "golden color tones",
-            "blue": "blue color palette",
-            "red": "red accent colors",
-            "green": "natural green elements"
-        }
-
-        lyrics_lower = lyrics.lower()
-        found_visuals = []
-
-        for keyword, visual in visual_keywords.items():
-            if keyword in lyrics_lower:
-                found_visuals.append(visual)
+        found_visuals = self.visual_matcher.match(lyrics, limit=3)
 
         if found_visuals:
-            return ", ".join(found_visuals[:3])
+            return ", ".join(found_visuals)
 
         return None
 
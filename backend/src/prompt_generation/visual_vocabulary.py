@@ -0,0 +1,116 @@
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_VOCABULARY_PATH = Path(__file__).parent / "data" / "visual_vocabulary.json"
+
+_TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+
+def stem_word(word: str) -> str:
+    word = word.lower().replace("'", "")
+
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif word.endswith("ing") and len(word) - 3 >= 3:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) - 2 >= 3:
+        word = word[:-2]
+    elif word.endswith(("ches", "shes", "sses", "xes", "zes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss") and len(word) - 1 >= 3:
+        word = word[:-1]
+
+    if word.endswith("y") and len(word) - 1 >= 3:
+        word = word[:-1]
+    if word.endswith("e") and len(word) - 1 >= 3:
+        word = word[:-1]
+    if len(word) >= 4 and word[-1] == word[-2] and word[-1] not in "aeiouls":
+        word = word[:-1]
+
+    return word
+
+
+class VisualVocabularyMatcher:
+    def __init__(self, vocabulary: Dict[str, str]):
+        self._table: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], str]] = {}
+        self.max_phrase_length = 1
+
+        for keyword, visual in vocabulary.items():
+            words = tuple(_TOKEN_PATTERN.findall(keyword.lower()))
+            if not words:
+                continue
+            stems = tuple(stem_word(word) for word in words)
+            self._table.setdefault(stems, (words, visual))
+            self.max_phrase_length = max(self.max_phrase_length, len(words))
+
+    @classmethod
+    def from_file(cls, path: str) -> "VisualVocabularyMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            vocabulary = json.load(f)
+
+        if not isinstance(vocabulary, dict):
+            raise ValueError(f"Visual vocabulary must be a JSON object of keyword to visual: {path}")
+
+        return cls(vocabulary)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def _matches(self, tokens: List[str], stems: List[str], keywords: Tuple[str, ...]) -> bool:
+        for token, stem, keyword in zip(tokens, stems, keywords):
+            if token != keyword and token == stem:
+                return False
+        return True
+
+    def match(self, text: Optional[str], limit: Optional[int] = None) -> List[str]:
+        if not text:
+            return []
+
+        tokens = [token.replace("'", "") for token in _TOKEN_PATTERN.findall(text.lower())]
+        stems = [stem_word(token) for token in tokens]
+
+        found: List[str] = []
+        idx = 0
+        while idx < len(tokens):
+            matched_length = 0
+            for length in range(min(self.max_phrase_length, len(tokens) - idx), 0, -1):
+                entry = self._table.get(tuple(stems[idx:idx + length]))
+                if entry is None:
+                    continue
+
+                keywords, visual = entry
+                if not self._matches(tokens[idx:idx + length], stems[idx:idx + length], keywords):
+                    continue
+
+                if visual not in found:
+                    found.append(visual)
+                matched_length = length
+                break
+
+            if limit is not None and len(found) >= limit:
+                break
+            idx += matched_length or 1
+
+        return found
+
+
+_matchers: Dict[str, VisualVocabularyMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_visual_matcher(path: Optional[str] = None) -> VisualVocabularyMatcher:
+    key = os.path.abspath(path or str(DEFAULT_VOCABULARY_PATH))
+
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = VisualVocabularyMatcher.from_file(key)
+                _matchers[key] = matcher
+    return matcher
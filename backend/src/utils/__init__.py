@@ -1,4 +1,5 @@
-from .file_utils import validate_audio_file, get_supported_formats, ensure_directory
+from .file_utils import validate_audio_file, get_supported_formats, ensure_directory, compute_file_hash
 from .config import Config
+from .warmup import EngineWarmup
 
-__all__ = ['validate_audio_file', 'get_supported_formats', 'ensure_directory', 'Config']
+__all__ = ['validate_audio_file', 'get_supported_formats', 'ensure_directory', 'compute_file_hash', 'Config', 'EngineWarmup']
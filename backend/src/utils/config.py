@@ -9,6 +9,7 @@ class Config:
     ovi_path: str = "../Ovi"
     output_dir: str = "./output"
     temp_dir: str = "./temp"
+    jobs_dir: str = "./jobs"
 
     video_width: int = 720
     video_height: int = 720
@@ -17,14 +18,53 @@ class Config:
 
     model_name: str = "720x720_5s"
     sample_steps: int = 50
+    draft_sample_steps: int = 8
+    draft_scale: float = 0.5
+    adaptive_steps: bool = False
+    min_sample_steps: int = 20
+    max_sample_steps: int = 60
+    seconds_per_step: float = 2.5
     video_guidance_scale: float = 4.0
     audio_guidance_scale: float = 3.0
     cpu_offload: bool = True
     fp8: bool = True
+    ovi_engine_worker: bool = True
+    preload_engines: bool = False
+    batch_memory_gb: float = 0.0
+    clip_memory_gb: float = 6.0
+    generation_workers: int = 1
+    generation_devices: str = ""
+
+    clip_cache: bool = True
+    clip_cache_dir: str = "./clip_cache"
+    clip_cache_max_gb: float = 20.0
+    text_embedding_cache_size: int = 128
+    frame_handoff_gb: float = 0.0
+    mock_latency: float = 0.0
+    streaming_pipeline: bool = False
+    generation_fps: int = 24
+    frame_interpolation: str = "dis"
+    generation_scale: float = 1.0
+    output_resolution: str = ""
+    upscale_method: str = "lanczos"
+    superres_model: str = ""
+
+    clip_reuse: bool = False
+    clip_library_dir: str = "./clip_library"
+    clip_library_max_gb: float = 10.0
+    clip_reuse_threshold: float = 0.9
 
     whisper_model: str = "base"
+    lyrics_backend: str = "whisper"
+    whisper_idle_timeout: float = 600.0
+    whisper_preload: bool = False
+    vocal_gating: bool = False
+    lyrics_workers: int = 1
+    lyrics_chunk_duration: float = 60.0
     extract_lyrics: bool = True
 
+    visual_vocabulary_path: str = ""
+
     crossfade_duration: float = 0.5
     output_video_codec: str = "libx264"
     output_audio_codec: str = "aac"
@@ -44,15 +84,52 @@ class Config:
             ovi_path=os.getenv("OVI_PATH", "../Ovi"),
             output_dir=os.getenv("OUTPUT_DIR", "./output"),
             temp_dir=os.getenv("TEMP_DIR", "./temp"),
+            jobs_dir=os.getenv("JOBS_DIR", "./jobs"),
             video_width=int(os.getenv("VIDEO_WIDTH", "720")),
             video_height=int(os.getenv("VIDEO_HEIGHT", "720")),
             segment_duration=float(os.getenv("SEGMENT_DURATION", "5.0")),
             model_name=os.getenv("MODEL_NAME", "720x720_5s"),
             sample_steps=int(os.getenv("SAMPLE_STEPS", "50")),
+            draft_sample_steps=int(os.getenv("DRAFT_SAMPLE_STEPS", "8")),
+            draft_scale=float(os.getenv("DRAFT_SCALE", "0.5")),
+            adaptive_steps=os.getenv("ADAPTIVE_STEPS", "false").lower() == "true",
+            min_sample_steps=int(os.getenv("MIN_SAMPLE_STEPS", "20")),
+            max_sample_steps=int(os.getenv("MAX_SAMPLE_STEPS", "60")),
+            seconds_per_step=float(os.getenv("SECONDS_PER_STEP", "2.5")),
             cpu_offload=os.getenv("CPU_OFFLOAD", "true").lower() == "true",
             fp8=os.getenv("FP8", "true").lower() == "true",
+            ovi_engine_worker=os.getenv("OVI_ENGINE_WORKER", "true").lower() == "true",
+            preload_engines=os.getenv("PRELOAD_ENGINES", "false").lower() == "true",
+            batch_memory_gb=float(os.getenv("BATCH_MEMORY_GB", "0")),
+            clip_memory_gb=float(os.getenv("CLIP_MEMORY_GB", "6")),
+            generation_workers=int(os.getenv("GENERATION_WORKERS", "1")),
+            generation_devices=os.getenv("GENERATION_DEVICES", ""),
+            clip_cache=os.getenv("CLIP_CACHE", "true").lower() == "true",
+            clip_cache_dir=os.getenv("CLIP_CACHE_DIR", "./clip_cache"),
+            clip_cache_max_gb=float(os.getenv("CLIP_CACHE_MAX_GB", "20")),
+            text_embedding_cache_size=int(os.getenv("TEXT_EMBEDDING_CACHE_SIZE", "128")),
+            frame_handoff_gb=float(os.getenv("FRAME_HANDOFF_GB", "0")),
+            mock_latency=float(os.getenv("MOCK_LATENCY", "0")),
+            streaming_pipeline=os.getenv("STREAMING_PIPELINE", "false").lower() == "true",
+            generation_fps=int(os.getenv("GENERATION_FPS", "24")),
+            frame_interpolation=os.getenv("FRAME_INTERPOLATION", "dis"),
+            generation_scale=float(os.getenv("GENERATION_SCALE", "1.0")),
+            output_resolution=os.getenv("OUTPUT_RESOLUTION", ""),
+            upscale_method=os.getenv("UPSCALE_METHOD", "lanczos"),
+            superres_model=os.getenv("SUPERRES_MODEL", ""),
+            clip_reuse=os.getenv("CLIP_REUSE", "false").lower() == "true",
+            clip_library_dir=os.getenv("CLIP_LIBRARY_DIR", "./clip_library"),
+            clip_library_max_gb=float(os.getenv("CLIP_LIBRARY_MAX_GB", "10")),
+            clip_reuse_threshold=float(os.getenv("CLIP_REUSE_THRESHOLD", "0.9")),
             whisper_model=os.getenv("WHISPER_MODEL", "base"),
+            lyrics_backend=os.getenv("LYRICS_BACKEND", "whisper"),
+            whisper_idle_timeout=float(os.getenv("WHISPER_IDLE_TIMEOUT", "600")),
+            whisper_preload=os.getenv("WHISPER_PRELOAD", "false").lower() == "true",
+            vocal_gating=os.getenv("VOCAL_GATING", "false").lower() == "true",
+            lyrics_workers=int(os.getenv("LYRICS_WORKERS", "1")),
+            lyrics_chunk_duration=float(os.getenv("LYRICS_CHUNK_DURATION", "60")),
             extract_lyrics=os.getenv("EXTRACT_LYRICS", "true").lower() == "true",
+            visual_vocabulary_path=os.getenv("VISUAL_VOCABULARY_PATH", ""),
             api_host=os.getenv("API_HOST", "127.0.0.1"),
             api_port=int(os.getenv("API_PORT", "5000")),
             debug=os.getenv("DEBUG", "false").lower() == "true",
@@ -69,18 +146,55 @@ class Config:
             "ovi_path": self.ovi_path,
             "output_dir": self.output_dir,
             "temp_dir": self.temp_dir,
+            "jobs_dir": self.jobs_dir,
             "video_width": self.video_width,
             "video_height": self.video_height,
             "video_fps": self.video_fps,
             "segment_duration": self.segment_duration,
             "model_name": self.model_name,
             "sample_steps": self.sample_steps,
+            "draft_sample_steps": self.draft_sample_steps,
+            "draft_scale": self.draft_scale,
+            "adaptive_steps": self.adaptive_steps,
+            "min_sample_steps": self.min_sample_steps,
+            "max_sample_steps": self.max_sample_steps,
+            "seconds_per_step": self.seconds_per_step,
             "video_guidance_scale": self.video_guidance_scale,
             "audio_guidance_scale": self.audio_guidance_scale,
             "cpu_offload": self.cpu_offload,
             "fp8": self.fp8,
+            "ovi_engine_worker": self.ovi_engine_worker,
+            "preload_engines": self.preload_engines,
+            "batch_memory_gb": self.batch_memory_gb,
+            "clip_memory_gb": self.clip_memory_gb,
+            "generation_workers": self.generation_workers,
+            "generation_devices": self.generation_devices,
+            "clip_cache": self.clip_cache,
+            "clip_cache_dir": self.clip_cache_dir,
+            "clip_cache_max_gb": self.clip_cache_max_gb,
+            "text_embedding_cache_size": self.text_embedding_cache_size,
+            "frame_handoff_gb": self.frame_handoff_gb,
+            "mock_latency": self.mock_latency,
+            "streaming_pipeline": self.streaming_pipeline,
+            "generation_fps": self.generation_fps,
+            "frame_interpolation": self.frame_interpolation,
+            "generation_scale": self.generation_scale,
+            "output_resolution": self.output_resolution,
+            "upscale_method": self.upscale_method,
+            "superres_model": self.superres_model,
+            "clip_reuse": self.clip_reuse,
+            "clip_library_dir": self.clip_library_dir,
+            "clip_library_max_gb": self.clip_library_max_gb,
+            "clip_reuse_threshold": self.clip_reuse_threshold,
             "whisper_model": self.whisper_model,
+            "lyrics_backend": self.lyrics_backend,
+            "whisper_idle_timeout": self.whisper_idle_timeout,
+            "whisper_preload": self.whisper_preload,
+            "vocal_gating": self.vocal_gating,
+            "lyrics_workers": self.lyrics_workers,
+            "lyrics_chunk_duration": self.lyrics_chunk_duration,
             "extract_lyrics": self.extract_lyrics,
+            "visual_vocabulary_path": self.visual_vocabulary_path,
             "crossfade_duration": self.crossfade_duration,
             "api_host": self.api_host,
             "api_port": self.api_port,
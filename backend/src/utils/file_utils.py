@@ -1,4 +1,5 @@
 import os
+import hashlib
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -44,6 +45,14 @@ def ensure_directory(dir_path: str) -> str:
     return str(path)
 
 
+def compute_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def get_unique_filename(directory: str, base_name: str, extension: str) -> str:
     dir_path = Path(directory)
     counter = 0
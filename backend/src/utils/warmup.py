@@ -0,0 +1,83 @@
+import time
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class ComponentStatus:
+    name: str
+    status: str = "pending"
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class EngineWarmup:
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._components: Dict[str, ComponentStatus] = {}
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, loader: Callable[[], Any]):
+        with self._lock:
+            self._loaders[name] = loader
+            self._components[name] = ComponentStatus(name=name)
+
+    def _load(self, name: str):
+        with self._lock:
+            self._components[name].status = "loading"
+
+        started = time.monotonic()
+        try:
+            self._loaders[name]()
+        except Exception as e:
+            print(f"Error warming up {name}: {e}")
+            with self._lock:
+                component = self._components[name]
+                component.status = "failed"
+                component.error = str(e)
+                component.load_seconds = time.monotonic() - started
+            return
+
+        with self._lock:
+            component = self._components[name]
+            component.status = "ready"
+            component.load_seconds = time.monotonic() - started
+        print(f"Warmed up {name} in {component.load_seconds:.1f}s")
+
+    def start(self, background: bool = True) -> List[threading.Thread]:
+        self.started_at = time.monotonic()
+
+        if not background:
+            for name in list(self._loaders):
+                self._load(name)
+            return []
+
+        for name in list(self._loaders):
+            thread = threading.Thread(target=self._load, args=(name,), name=f"warmup-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self._threads
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return self.is_ready()
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return all(component.status == "ready" for component in self._components.values())
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            components = {name: asdict(component) for name, component in self._components.items()}
+            ready = all(component["status"] == "ready" for component in components.values())
+
+        return {
+            "ready": ready,
+            "uptime_seconds": time.monotonic() - self.started_at if self.started_at is not None else None,
+            "components": components
+        }
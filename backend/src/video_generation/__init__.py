@@ -1,4 +1,26 @@
 from .ovi_generator import OviVideoGenerator, MockOviVideoGenerator
 from .video_composer import VideoComposer
+from .clip_library import ClipLibrary, get_clip_library
+from .engine_worker import OviEngineWorker, get_engine_worker
+from .clip_cache import ClipCache, get_clip_cache
+from .clip_scheduler import ClipScheduler
+from .text_embedding_cache import TextEmbeddingCache
+from .step_planner import StepPlanner, StepPlan
+from .frame_interpolation import FrameInterpolator
 
-__all__ = ['OviVideoGenerator', 'MockOviVideoGenerator', 'VideoComposer']
+__all__ = [
+    'OviVideoGenerator',
+    'MockOviVideoGenerator',
+    'VideoComposer',
+    'ClipLibrary',
+    'get_clip_library',
+    'OviEngineWorker',
+    'get_engine_worker',
+    'ClipCache',
+    'get_clip_cache',
+    'ClipScheduler',
+    'TextEmbeddingCache',
+    'StepPlanner',
+    'StepPlan',
+    'FrameInterpolator'
+]
@@ -0,0 +1,138 @@
+import os
+import json
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def clip_cache_key(**inputs: Any) -> str:
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ClipCache:
+    def __init__(
+        self,
+        cache_dir: str = "./clip_cache",
+        max_bytes: int = 20 * 1024 ** 3,
+        suffix: str = ".mp4"
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _load(self):
+        files = sorted(
+            (path for path in self.cache_dir.glob(f"*{self.suffix}") if path.is_file()),
+            key=lambda path: path.stat().st_mtime
+        )
+        for path in files:
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total_bytes += size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, output_path: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False
+
+            cached_path = self._path(key)
+            try:
+                shutil.copyfile(cached_path, output_path)
+                os.utime(cached_path)
+            except OSError:
+                self._remove(key)
+                self.misses += 1
+                return False
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+
+    def put(self, key: str, video_path: str):
+        size = os.path.getsize(video_path)
+        if size > self.max_bytes:
+            return
+
+        cached_path = self._path(key)
+        tmp_path = cached_path.with_suffix(".tmp")
+        shutil.copyfile(video_path, tmp_path)
+        os.replace(tmp_path, cached_path)
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries[key]
+            self._entries[key] = size
+            self._entries.move_to_end(key)
+            self._total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+_caches: Dict[str, ClipCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_clip_cache(cache_dir: str, max_bytes: Optional[int] = None) -> ClipCache:
+    key = os.path.abspath(cache_dir)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ClipCache(cache_dir) if max_bytes is None else ClipCache(cache_dir, max_bytes=max_bytes)
+            _caches[key] = cache
+        elif max_bytes is not None:
+            cache.max_bytes = max_bytes
+        return cache
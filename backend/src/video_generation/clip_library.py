@@ -0,0 +1,321 @@
+import os
+import re
+import json
+import uuid
+import time
+import zlib
+import shutil
+import threading
+import numpy as np
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def hashed_ngram_vector(text: str, n_features: int = 4096) -> np.ndarray:
+    words = _WORD_PATTERN.findall(text.lower())
+    terms = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    vector = np.zeros(n_features, dtype=np.float32)
+    for term in terms:
+        vector[zlib.crc32(term.encode("utf-8")) % n_features] += 1.0
+
+    np.log1p(vector, out=vector)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def probe_clip_duration(video_path: str) -> Optional[float]:
+    import cv2
+
+    capture = cv2.VideoCapture(video_path)
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        frames = capture.get(cv2.CAP_PROP_FRAME_COUNT)
+    finally:
+        capture.release()
+
+    if fps <= 0 or frames <= 0:
+        return None
+    return frames / fps
+
+
+def retime_clip(source_path: str, output_path: str, duration: float) -> str:
+    import cv2
+
+    capture = cv2.VideoCapture(source_path)
+    frames = []
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS) or 24
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            frames.append(frame)
+    finally:
+        capture.release()
+
+    if not frames:
+        raise ValueError(f"Could not read frames from {source_path}")
+
+    target_frames = max(1, int(round(duration * fps)))
+    indices = np.linspace(0, len(frames) - 1, target_frames).round().astype(int)
+
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    for idx in indices:
+        writer.write(frames[idx])
+    writer.release()
+
+    return output_path
+
+
+@dataclass
+class LibraryEntry:
+    entry_id: str
+    prompt: str
+    video_path: str
+    width: int
+    height: int
+    duration: float
+    uses: int = 0
+    size: int = 0
+    last_used: float = 0.0
+
+
+class ClipLibrary:
+    def __init__(
+        self,
+        library_dir: str = "./clip_library",
+        threshold: float = 0.9,
+        max_retime: float = 0.25,
+        n_features: int = 4096,
+        max_bytes: int = 10 * 1024 ** 3
+    ):
+        self.library_dir = Path(library_dir)
+        self.threshold = threshold
+        self.max_retime = max_retime
+        self.n_features = n_features
+        self.max_bytes = max_bytes
+
+        self._entries: List[LibraryEntry] = []
+        self._vectors = np.zeros((0, n_features), dtype=np.float32)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+        self.library_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def index_path(self) -> Path:
+        return self.library_dir / "index.json"
+
+    def _load(self):
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path) as f:
+            records = json.load(f)
+
+        entries = [
+            LibraryEntry(**record) for record in records
+            if os.path.exists(record.get("video_path", ""))
+        ]
+        for entry in entries:
+            entry.size = entry.size or os.path.getsize(entry.video_path)
+
+        self._entries = entries
+        self._vectors = self._vectorize([entry.prompt for entry in entries])
+        self._total_bytes = sum(entry.size for entry in entries)
+
+        with self._lock:
+            if self._evict():
+                self._save()
+
+    def _save(self):
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump([asdict(entry) for entry in self._entries], f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _vectorize(self, prompts: List[str]) -> np.ndarray:
+        if not prompts:
+            return np.zeros((0, self.n_features), dtype=np.float32)
+        return np.stack([hashed_ngram_vector(prompt, self.n_features) for prompt in prompts])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        prompt: str,
+        video_path: str,
+        width: int,
+        height: int,
+        duration: Optional[float] = None
+    ) -> Optional[LibraryEntry]:
+        size = os.path.getsize(video_path)
+        if size > self.max_bytes:
+            return None
+
+        entry_id = uuid.uuid4().hex
+        stored_path = self.library_dir / f"{entry_id}{Path(video_path).suffix or '.mp4'}"
+        shutil.copy2(video_path, stored_path)
+
+        if duration is None:
+            duration = probe_clip_duration(str(stored_path)) or 0.0
+
+        entry = LibraryEntry(
+            entry_id=entry_id,
+            prompt=prompt,
+            video_path=str(stored_path),
+            width=width,
+            height=height,
+            duration=duration,
+            size=size,
+            last_used=time.time()
+        )
+        vector = hashed_ngram_vector(prompt, self.n_features)
+
+        with self._lock:
+            self._entries.append(entry)
+            self._vectors = np.vstack([self._vectors, vector[None, :]])
+            self._total_bytes += size
+            self._evict(keep=entry)
+            self._save()
+
+        return entry
+
+    def _evict(self, keep: Optional[LibraryEntry] = None) -> int:
+        if self._total_bytes <= self.max_bytes:
+            return 0
+
+        candidates = sorted(
+            (idx for idx, entry in enumerate(self._entries) if entry is not keep),
+            key=lambda idx: (self._entries[idx].uses, self._entries[idx].last_used)
+        )
+        evicted = set()
+        for idx in candidates:
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.add(idx)
+            self._total_bytes -= self._entries[idx].size
+
+            try:
+                os.unlink(self._entries[idx].video_path)
+            except FileNotFoundError:
+                pass
+
+        kept = [idx not in evicted for idx in range(len(self._entries))]
+        self._entries = [entry for entry, keep_entry in zip(self._entries, kept) if keep_entry]
+        self._vectors = self._vectors[np.array(kept, dtype=bool)]
+        self.evictions += len(evicted)
+        return len(evicted)
+
+    def query(
+        self,
+        prompt: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        top_k: int = 5
+    ) -> List[Tuple[LibraryEntry, float]]:
+        with self._lock:
+            entries = self._entries
+            vectors = self._vectors
+
+        if not entries:
+            return []
+
+        scores = vectors @ hashed_ngram_vector(prompt, self.n_features)
+
+        if width is not None and height is not None:
+            mismatched = np.array([
+                entry.width != width or entry.height != height for entry in entries
+            ])
+            scores = np.where(mismatched, -1.0, scores)
+
+        k = min(top_k, len(entries))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [(entries[i], float(scores[i])) for i in top if scores[i] >= 0]
+
+    def find_match(
+        self,
+        prompt: str,
+        width: int,
+        height: int,
+        duration: float
+    ) -> Optional[LibraryEntry]:
+        match = None
+        for entry, score in self.query(prompt, width, height):
+            if score < self.threshold:
+                break
+            if self._can_retime(entry.duration, duration):
+                match = entry
+                break
+
+        with self._lock:
+            self.lookups += 1
+            if match is not None:
+                self.hits += 1
+                match.uses += 1
+                match.last_used = time.time()
+                self._save()
+
+        return match
+
+    def _can_retime(self, stored: float, needed: float) -> bool:
+        if stored <= 0 or needed <= 0:
+            return False
+        return abs(stored - needed) / needed <= self.max_retime
+
+    def materialize(self, entry: LibraryEntry, output_path: str, duration: float) -> str:
+        if abs(entry.duration - duration) < 1e-2:
+            shutil.copy2(entry.video_path, output_path)
+            return output_path
+        return retime_clip(entry.video_path, output_path, duration)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / self.lookups if self.lookups else 0.0
+            }
+
+
+_libraries: Dict[str, ClipLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_clip_library(
+    library_dir: str,
+    threshold: float = 0.9,
+    max_bytes: Optional[int] = None
+) -> ClipLibrary:
+    key = os.path.abspath(library_dir)
+    with _libraries_lock:
+        library = _libraries.get(key)
+        if library is None:
+            if max_bytes is None:
+                library = ClipLibrary(library_dir, threshold=threshold)
+            else:
+                library = ClipLibrary(library_dir, threshold=threshold, max_bytes=max_bytes)
+            _libraries[key] = library
+        elif max_bytes is not None:
+            library.max_bytes = max_bytes
+        library.threshold = threshold
+        return library
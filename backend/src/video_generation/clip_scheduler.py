@@ -0,0 +1,183 @@
+import os
+import time
+import atexit
+import threading
+import multiprocessing
+from dataclasses import fields, replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .clip_cache import ClipCache
+from .step_planner import record_step_timing
+
+
+ENGINE_CONFIG_FIELDS = (
+    "model_name", "cpu_offload", "fp8", "generation_fps", "devices", "text_embedding_cache_size"
+)
+
+_pools: Dict[Tuple, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+_worker_generator = None
+
+
+def _init_worker(
+    generator_cls: type,
+    ovi_path: str,
+    config: Any,
+    cache_dir: Optional[str],
+    cache_max_bytes: Optional[int],
+    devices: List[str],
+    slots: Any
+):
+    global _worker_generator
+
+    slot = slots.get()
+    if devices:
+        os.environ["CUDA_VISIBLE_DEVICES"] = devices[slot % len(devices)]
+
+    if getattr(config, "frame_handoff_gb", 0):
+        config = replace(config, frame_handoff_gb=0.0)
+
+    clip_cache = None
+    if cache_dir:
+        clip_cache = ClipCache(cache_dir, max_bytes=cache_max_bytes)
+
+    _worker_generator = generator_cls(ovi_path=ovi_path, config=config, clip_cache=clip_cache)
+    _worker_generator.initialize()
+
+
+def _render_settings(config: Any) -> Dict[str, Any]:
+    settings = {
+        field.name: getattr(config, field.name)
+        for field in fields(config) if field.name not in ENGINE_CONFIG_FIELDS
+    }
+    settings["frame_handoff_gb"] = 0.0
+    return settings
+
+
+def _generate_clip(prompt: Any, output_dir: str, seed: int, render_settings: Dict[str, Any]) -> Tuple[Any, int]:
+    _worker_generator.config = replace(_worker_generator.config, **render_settings)
+    clip = _worker_generator._generate_single_clip(prompt, Path(output_dir), seed)
+    return clip, os.getpid()
+
+
+def shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+class ClipScheduler:
+    def __init__(self, generator: Any, num_workers: int, devices: Optional[List[str]] = None):
+        self.generator = generator
+        self.num_workers = num_workers
+        self.devices = devices or []
+        self.worker_pids: Set[int] = set()
+
+    def _pool_key(self) -> Tuple:
+        cache = self.generator.clip_cache
+        return (
+            type(self.generator),
+            str(self.generator.ovi_path),
+            tuple(getattr(self.generator.config, name) for name in ENGINE_CONFIG_FIELDS),
+            str(cache.cache_dir) if cache is not None else None,
+            self.num_workers,
+            tuple(self.devices)
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        key = self._pool_key()
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                context = multiprocessing.get_context("spawn")
+                slots = context.Queue()
+                for slot in range(self.num_workers):
+                    slots.put(slot)
+
+                cache = self.generator.clip_cache
+                pool = ProcessPoolExecutor(
+                    max_workers=self.num_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(
+                        type(self.generator),
+                        str(self.generator.ovi_path),
+                        self.generator.config,
+                        str(cache.cache_dir) if cache is not None else None,
+                        cache.max_bytes if cache is not None else None,
+                        self.devices,
+                        slots
+                    )
+                )
+                _pools[key] = pool
+            return pool
+
+    def _discard_pool(self):
+        with _pools_lock:
+            pool = _pools.pop(self._pool_key(), None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, prompts: List[Any], output_dir: str, seed: Optional[int] = None) -> List[Any]:
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        base_seed = seed or self.generator.config.seed
+        progress_callback = self.generator.progress_callback
+        total = len(prompts)
+
+        clips = []
+        pending = []
+        for prompt in prompts:
+            clip = self.generator._reuse_clip(prompt, output_path)
+            if clip is not None:
+                self.generator._complete_clip(prompt, clip)
+                clips.append(clip)
+            else:
+                pending.append(prompt)
+
+        done = len(clips)
+        if not pending:
+            return sorted(clips, key=lambda c: c.segment_index)
+
+        started = time.monotonic()
+        pool = self._get_pool()
+        render_settings = _render_settings(self.generator.config)
+        futures = {
+            pool.submit(_generate_clip, prompt, str(output_path), base_seed, render_settings): prompt
+            for prompt in pending
+        }
+
+        try:
+            for future in as_completed(futures):
+                clip, pid = future.result()
+                self.worker_pids.add(pid)
+                self.generator._complete_clip(futures[future], clip)
+                clips.append(clip)
+
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, f"Generated clip {done}/{total}")
+        except BrokenProcessPool as e:
+            self._discard_pool()
+            raise RuntimeError(f"Clip generation worker crashed: {e}")
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+        record_step_timing(
+            self.generator.timing_key(),
+            (time.monotonic() - started) * min(self.num_workers, len(pending)),
+            sum(prompt.sample_steps or self.generator.config.sample_steps for prompt in pending)
+        )
+
+        return sorted(clips, key=lambda c: c.segment_index)
@@ -0,0 +1,331 @@
+import sys
+import time
+import atexit
+import threading
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .frame_buffer import FrameBuffer
+from .text_embedding_cache import TextEmbeddingCache, install_text_embedding_cache
+
+
+OVI_FPS = 24
+
+def load_ovi_engine(ovi_path: str, config: Any) -> Any:
+    ovi_path_str = str(ovi_path)
+    if ovi_path_str not in sys.path:
+        sys.path.insert(0, ovi_path_str)
+
+    try:
+        from ovi.ovi_fusion_engine import OviFusionEngine, DEFAULT_CONFIG
+    except ImportError as e:
+        raise ImportError(
+            f"Failed to import Ovi. Make sure Ovi is cloned to {ovi_path}. "
+            f"Error: {e}"
+        )
+
+    DEFAULT_CONFIG["cpu_offload"] = config.cpu_offload
+    DEFAULT_CONFIG["fp8"] = config.fp8
+    DEFAULT_CONFIG["model_name"] = config.model_name
+    DEFAULT_CONFIG["mode"] = "t2v"
+
+    return OviFusionEngine()
+
+
+class OviEngineBackend:
+    def __init__(
+        self,
+        ovi_path: str,
+        config: Any,
+        engine: Any = None,
+        save_video: Optional[Callable] = None
+    ):
+        self.engine = engine if engine is not None else load_ovi_engine(ovi_path, config)
+
+        if save_video is None:
+            from ovi.utils.io_utils import save_video
+        self._save_video = save_video
+
+        self.text_embeddings: Optional[TextEmbeddingCache] = None
+        cache_size = getattr(config, "text_embedding_cache_size", 0)
+        if cache_size > 0:
+            cache = TextEmbeddingCache(max_entries=cache_size)
+            if install_text_embedding_cache(self.engine, cache, config.model_name):
+                self.text_embeddings = cache
+            else:
+                print("Ovi engine has no text encoder to cache; text embedding cache disabled")
+
+        self.fps = OVI_FPS
+        generation_fps = getattr(config, "generation_fps", OVI_FPS)
+        if generation_fps < OVI_FPS:
+            self.fps = self._reduce_frame_rate(generation_fps)
+
+    def _reduce_frame_rate(self, fps: int) -> float:
+        latent_length = getattr(self.engine, "video_latent_length", None)
+        if not latent_length or latent_length < 2:
+            print(f"Ovi engine does not expose video_latent_length; generating at {OVI_FPS} fps")
+            return OVI_FPS
+
+        reduced = max(2, int(round((latent_length - 1) * fps / OVI_FPS)) + 1)
+        self.engine.video_latent_length = reduced
+        return OVI_FPS * (reduced - 1) / (latent_length - 1)
+
+    def generate(self, output_path: str, **kwargs) -> Union[str, FrameBuffer]:
+        return self.generate_batch([{"output_path": output_path, **kwargs}])[0]
+
+    def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Union[str, FrameBuffer]]:
+        engine_requests = [
+            {key: value for key, value in request.items() if key not in ("output_path", "frame_handoff")}
+            for request in requests
+        ]
+
+        if len(engine_requests) > 1 and hasattr(self.engine, "generate_batch"):
+            outputs = self.engine.generate_batch(engine_requests)
+        else:
+            outputs = [self.engine.generate(**request) for request in engine_requests]
+
+        return [
+            self._output(request, generated_video, generated_audio)
+            for request, (generated_video, generated_audio, _) in zip(requests, outputs)
+        ]
+
+    def _output(self, request: Dict[str, Any], generated_video: Any, generated_audio: Any) -> Union[str, FrameBuffer]:
+        handoff = request.get("frame_handoff")
+
+        if handoff == "memory":
+            try:
+                return FrameBuffer.create(generated_video, fps=self.fps)
+            except MemoryError as e:
+                print(f"{e}; spilling frames to disk")
+                handoff = "spill"
+
+        if handoff == "spill":
+            return FrameBuffer.create(generated_video, fps=self.fps, spill_path=request["output_path"])
+
+        self._save_video(
+            request["output_path"],
+            generated_video,
+            generated_audio,
+            fps=self.fps,
+            sample_rate=16000
+        )
+        return request["output_path"]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "text_embeddings": self.text_embeddings.stats() if self.text_embeddings else None
+        }
+
+
+class _WorkerCrashed(Exception):
+    pass
+
+
+def _worker_main(conn, backend_factory: Callable[[str, Any], Any], ovi_path: str, config: Any):
+    try:
+        backend = backend_factory(ovi_path, config)
+    except Exception as e:
+        conn.send(("failed", None, f"{type(e).__name__}: {e}"))
+        conn.close()
+        return
+
+    conn.send(("ready", None, None))
+
+    while True:
+        try:
+            command, request_id, payload = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if command == "stop":
+            break
+
+        try:
+            if command == "generate_batch":
+                result = backend.generate_batch(payload)
+            elif command == "stats":
+                result = backend.stats()
+            else:
+                result = backend.generate(**payload)
+            conn.send(("ok", request_id, result))
+        except Exception as e:
+            conn.send(("error", request_id, f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+class OviEngineWorker:
+    def __init__(
+        self,
+        ovi_path: str,
+        config: Any,
+        backend_factory: Optional[Callable[[str, Any], Any]] = None,
+        start_timeout: float = 1800.0,
+        max_retries: int = 1
+    ):
+        self.ovi_path = str(ovi_path)
+        self.config = config
+        self.backend_factory = backend_factory or OviEngineBackend
+        self.start_timeout = start_timeout
+        self.max_retries = max_retries
+
+        self.starts = 0
+        self.restarts = 0
+        self.requests = 0
+        self.load_seconds: Optional[float] = None
+
+        self._process = None
+        self._conn = None
+        self._request_id = 0
+        self._crashed = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self._ensure_running()
+
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def _ensure_running(self):
+        if self.is_running():
+            return
+
+        if self._process is not None or self._crashed:
+            self.restarts += 1
+            print("Restarting Ovi engine worker")
+            self._terminate()
+        self._crashed = False
+
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.backend_factory, self.ovi_path, self.config),
+            name="ovi-engine-worker",
+            daemon=True
+        )
+
+        started = time.monotonic()
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+
+        try:
+            status, _, message = self._receive(self.start_timeout)
+        except (_WorkerCrashed, TimeoutError) as e:
+            self._terminate()
+            raise RuntimeError(f"Ovi engine worker failed to start: {e}")
+
+        if status != "ready":
+            self._terminate()
+            raise RuntimeError(f"Ovi engine worker failed to start: {message}")
+
+        self.starts += 1
+        self.load_seconds = time.monotonic() - started
+        print(f"Ovi engine worker ready in {self.load_seconds:.1f}s (pid {process.pid})")
+
+    def _receive(self, timeout: Optional[float] = None) -> Tuple[str, Optional[int], Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            try:
+                if self._conn.poll(0.5):
+                    return self._conn.recv()
+            except (EOFError, OSError) as e:
+                raise _WorkerCrashed(str(e) or "connection closed")
+
+            if not self._process.is_alive():
+                raise _WorkerCrashed(f"worker exited with code {self._process.exitcode}")
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"no response from Ovi engine worker after {timeout:.0f}s")
+
+    def generate(self, output_path: str, **kwargs) -> Union[str, FrameBuffer]:
+        return self._call("generate", {"output_path": output_path, **kwargs})
+
+    def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Union[str, FrameBuffer]]:
+        return self._call("generate_batch", requests)
+
+    def backend_stats(self) -> Dict[str, Any]:
+        return self._call("stats", None)
+
+    def _call(self, command: str, payload: Any) -> Any:
+        with self._lock:
+            for attempt in range(self.max_retries + 1):
+                self._ensure_running()
+                self._request_id += 1
+                self.requests += 1
+
+                try:
+                    self._conn.send((command, self._request_id, payload))
+                    status, _, result = self._receive()
+                except (_WorkerCrashed, BrokenPipeError, OSError) as e:
+                    print(f"Ovi engine worker crashed during generation: {e}")
+                    self._terminate()
+                    self._crashed = True
+                    if attempt == self.max_retries:
+                        raise RuntimeError(f"Ovi engine worker crashed: {e}")
+                    continue
+
+                if status != "ok":
+                    raise RuntimeError(f"Ovi generation failed: {result}")
+                return result
+
+    def _terminate(self):
+        process, conn = self._process, self._conn
+        self._process, self._conn = None, None
+
+        if conn is not None:
+            try:
+                if process is not None and process.is_alive():
+                    conn.send(("stop", None, None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+
+        if process is not None:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=5)
+
+    def shutdown(self):
+        with self._lock:
+            self._terminate()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running(),
+            "pid": self._process.pid if self.is_running() else None,
+            "starts": self.starts,
+            "restarts": self.restarts,
+            "requests": self.requests,
+            "load_seconds": self.load_seconds
+        }
+
+
+_workers: Dict[Tuple, OviEngineWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_engine_worker(ovi_path: str, config: Any) -> OviEngineWorker:
+    key = (
+        str(ovi_path), config.model_name, config.cpu_offload, config.fp8,
+        getattr(config, "generation_fps", OVI_FPS)
+    )
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = OviEngineWorker(ovi_path, config)
+            _workers[key] = worker
+        return worker
+
+
+def shutdown_engine_workers():
+    with _workers_lock:
+        for worker in _workers.values():
+            worker.shutdown()
+        _workers.clear()
+
+
+atexit.register(shutdown_engine_workers)
@@ -0,0 +1,161 @@
+import os
+import shutil
+import threading
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+SHM_ROOT = "/dev/shm"
+
+
+def frames_to_uint8(video: Any) -> np.ndarray:
+    if hasattr(video, "detach"):
+        video = video.detach().float().cpu().numpy()
+
+    frames = np.asarray(video)
+    if frames.ndim == 4 and frames.shape[0] == 3 and frames.shape[-1] != 3:
+        frames = np.transpose(frames, (1, 2, 3, 0))
+
+    if frames.dtype != np.uint8:
+        frames = ((np.clip(frames, -1.0, 1.0) + 1.0) * 127.5).round().astype(np.uint8)
+
+    return np.ascontiguousarray(frames)
+
+
+def shared_memory_available(nbytes: int) -> bool:
+    if not os.path.isdir(SHM_ROOT):
+        return True
+    return shutil.disk_usage(SHM_ROOT).free > nbytes
+
+
+class FrameBudget:
+    def __init__(self):
+        self.used_bytes = 0
+        self.peak_bytes = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, nbytes: int, limit: int) -> bool:
+        with self._lock:
+            if self.used_bytes + nbytes > limit:
+                return False
+
+            self.used_bytes += nbytes
+            self.peak_bytes = max(self.peak_bytes, self.used_bytes)
+            return True
+
+    def release(self, nbytes: int):
+        with self._lock:
+            self.used_bytes = max(0, self.used_bytes - nbytes)
+
+    def stats(self) -> Dict[str, int]:
+        return {"used_bytes": self.used_bytes, "peak_bytes": self.peak_bytes}
+
+
+class FrameBuffer:
+    def __init__(
+        self,
+        shape: Tuple[int, ...],
+        dtype: str = "uint8",
+        fps: float = 24,
+        shm_name: Optional[str] = None,
+        spill_path: Optional[str] = None
+    ):
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.fps = fps
+        self.shm_name = shm_name
+        self.spill_path = spill_path
+        self.released = False
+
+        self._shm = None
+        self._budget: Optional[FrameBudget] = None
+        self._reserved = 0
+
+    @classmethod
+    def create(cls, video: Any, fps: float = 24, spill_path: Optional[str] = None) -> "FrameBuffer":
+        frames = frames_to_uint8(video)
+
+        if spill_path is None and not shared_memory_available(frames.nbytes):
+            raise MemoryError(f"Not enough shared memory for {frames.nbytes} bytes of frames")
+
+        if spill_path is not None:
+            spill_path = str(Path(spill_path).with_suffix(".npy"))
+            np.save(spill_path, frames)
+            return cls(frames.shape, str(frames.dtype), fps, spill_path=spill_path)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, frames.nbytes))
+        np.ndarray(frames.shape, dtype=frames.dtype, buffer=shm.buf)[:] = frames
+
+        buffer = cls(frames.shape, str(frames.dtype), fps, shm_name=shm.name)
+        buffer._shm = shm
+        return buffer
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_shm"] = None
+        state["_budget"] = None
+        state["_reserved"] = 0
+        return state
+
+    @property
+    def in_memory(self) -> bool:
+        return self.shm_name is not None
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    @property
+    def num_frames(self) -> int:
+        return self.shape[0]
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / self.fps
+
+    def track(self, budget: FrameBudget, reserved: int):
+        self._budget = budget
+        self._reserved = reserved
+
+    def array(self) -> np.ndarray:
+        if self.released:
+            raise ValueError("Frame buffer has already been released")
+
+        if self.spill_path is not None:
+            return np.load(self.spill_path, mmap_mode="r")
+
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(name=self.shm_name)
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+
+    def release(self):
+        if self.released:
+            return
+        self.released = True
+
+        if self.shm_name is not None:
+            shm = self._shm
+            self._shm = None
+            try:
+                if shm is None:
+                    shm = shared_memory.SharedMemory(name=self.shm_name)
+                try:
+                    shm.close()
+                except BufferError:
+                    pass
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+        if self.spill_path is not None:
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+
+        if self._budget is not None:
+            self._budget.release(self._reserved)
+            self._budget = None
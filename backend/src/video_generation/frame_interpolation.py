@@ -0,0 +1,94 @@
+from typing import Callable, Dict, Tuple
+
+import cv2
+import numpy as np
+
+
+INTERPOLATION_METHODS = ("dis", "farneback", "none")
+
+
+class FrameInterpolator:
+    def __init__(self, method: str = "dis"):
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"Unknown frame interpolation method: {method}")
+
+        self.method = method
+        self.pairs_computed = 0
+        self._dis = None
+        self._grids: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _flow(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        if self.method == "farneback":
+            return cv2.calcOpticalFlowFarneback(a, b, None, 0.5, 3, 15, 3, 5, 1.2, 0)
+
+        if self._dis is None:
+            self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_FAST)
+        return self._dis.calc(a, b, None)
+
+    def _grid(self, height: int, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        grid = self._grids.get((height, width))
+        if grid is None:
+            grid = np.meshgrid(
+                np.arange(width, dtype=np.float32),
+                np.arange(height, dtype=np.float32)
+            )
+            self._grids[(height, width)] = grid
+        return grid
+
+    def flows(self, a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        gray_a = cv2.cvtColor(a, cv2.COLOR_RGB2GRAY)
+        gray_b = cv2.cvtColor(b, cv2.COLOR_RGB2GRAY)
+        self.pairs_computed += 1
+        return self._flow(gray_a, gray_b), self._flow(gray_b, gray_a)
+
+    def blend(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        t: float,
+        flows: Tuple[np.ndarray, np.ndarray]
+    ) -> np.ndarray:
+        flow_ab, flow_ba = flows
+        grid_x, grid_y = self._grid(*a.shape[:2])
+
+        warped_a = cv2.remap(
+            a, grid_x + t * flow_ba[..., 0], grid_y + t * flow_ba[..., 1],
+            cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE
+        )
+        warped_b = cv2.remap(
+            b, grid_x + (1 - t) * flow_ab[..., 0], grid_y + (1 - t) * flow_ab[..., 1],
+            cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE
+        )
+        return cv2.addWeighted(warped_a, 1 - t, warped_b, t, 0)
+
+    def frame_function(
+        self,
+        get_frame: Callable[[int], np.ndarray],
+        num_frames: int,
+        source_fps: float
+    ) -> Callable[[float], np.ndarray]:
+        last = max(0, num_frames - 1)
+        pair: Dict[str, object] = {}
+
+        def make_frame(time_seconds: float) -> np.ndarray:
+            position = min(max(0.0, time_seconds * source_fps), last)
+            index = int(position + 1e-6)
+            t = position - index
+
+            if self.method == "none" or t < 1e-3 or index >= last:
+                return get_frame(index)
+
+            if pair.get("index") != index:
+                a = np.ascontiguousarray(get_frame(index))
+                b = np.ascontiguousarray(get_frame(index + 1))
+                pair.update(index=index, frames=(a, b), flows=self.flows(a, b))
+
+            a, b = pair["frames"]
+            return self.blend(a, b, t, pair["flows"])
+
+        return make_frame
+
+    def interpolate(self, frames: np.ndarray, source_fps: float, target_fps: float) -> np.ndarray:
+        make_frame = self.frame_function(lambda idx: frames[idx], len(frames), source_fps)
+        count = max(1, int(round(len(frames) * target_fps / source_fps)))
+        return np.stack([make_frame(idx / target_fps) for idx in range(count)])
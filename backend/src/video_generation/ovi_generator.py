@@ -1,11 +1,18 @@
 import os
-import sys
+import re
+import time
 import tempfile
-from typing import Optional, List, Callable
+from typing import Any, Dict, Iterable, Optional, List, Callable, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 
 from ..prompt_generation.prompt_generator import VideoPrompt
+from .clip_library import ClipLibrary
+from .clip_cache import ClipCache, clip_cache_key
+from .frame_buffer import FrameBuffer, FrameBudget
+from .step_planner import record_step_timing
+from .engine_worker import OviEngineWorker, OviEngineBackend, OVI_FPS
+from .clip_scheduler import ClipScheduler
 
 
 @dataclass
@@ -15,6 +22,8 @@ class GeneratedClip:
     end_time: float
     video_path: str
     prompt_used: str
+    reused: bool = False
+    frames: Optional[FrameBuffer] = None
 
 
 @dataclass
@@ -28,6 +37,20 @@ class GenerationConfig:
     cpu_offload: bool = True
     fp8: bool = True
     seed: int = 100
+    batch_memory_gb: float = 0.0
+    clip_memory_gb: float = 6.0
+    max_batch_size: int = 8
+    num_workers: int = 1
+    devices: str = ""
+    text_embedding_cache_size: int = 128
+    frame_handoff_gb: float = 0.0
+    mock_latency: float = 0.0
+    generation_fps: int = OVI_FPS
+
+
+BATCH_INVARIANT_KEYS = (
+    "output_path", "text_prompt", "seed", "video_negative_prompt", "audio_negative_prompt", "frame_handoff"
+)
 
 
 class OviVideoGenerator:
@@ -35,11 +58,19 @@ class OviVideoGenerator:
         self,
         ovi_path: str = "./Ovi",
         config: Optional[GenerationConfig] = None,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        clip_library: Optional[ClipLibrary] = None,
+        engine_worker: Optional[OviEngineWorker] = None,
+        clip_cache: Optional[ClipCache] = None
     ):
         self.ovi_path = Path(ovi_path)
         self.config = config or GenerationConfig()
         self.progress_callback = progress_callback
+        self.clip_library = clip_library
+        self.engine_worker = engine_worker
+        self.clip_cache = clip_cache
+        self.clip_callback: Optional[Callable[[GeneratedClip], None]] = None
+        self.frame_budget = FrameBudget()
         self._engine = None
         self._initialized = False
 
@@ -47,25 +78,60 @@ class OviVideoGenerator:
         if self._initialized:
             return
 
-        ovi_path_str = str(self.ovi_path)
-        if ovi_path_str not in sys.path:
-            sys.path.insert(0, ovi_path_str)
+        if self.engine_worker is not None:
+            self.engine_worker.start()
+        else:
+            self._engine = OviEngineBackend(str(self.ovi_path), self.config)
+        self._initialized = True
 
-        try:
-            from ovi.ovi_fusion_engine import OviFusionEngine, DEFAULT_CONFIG
-
-            DEFAULT_CONFIG["cpu_offload"] = self.config.cpu_offload
-            DEFAULT_CONFIG["fp8"] = self.config.fp8
-            DEFAULT_CONFIG["model_name"] = self.config.model_name
-            DEFAULT_CONFIG["mode"] = "t2v"
-
-            self._engine = OviFusionEngine()
-            self._initialized = True
-        except ImportError as e:
-            raise ImportError(
-                f"Failed to import Ovi. Make sure Ovi is cloned to {self.ovi_path}. "
-                f"Error: {e}"
-            )
+    def batch_size(self) -> int:
+        if self.config.batch_memory_gb <= 0:
+            return 1
+
+        pixels = self.config.video_height * self.config.video_width
+        clip_memory = self.config.clip_memory_gb * pixels / (720 * 720)
+        return max(1, min(self.config.max_batch_size, int(self.config.batch_memory_gb // clip_memory)))
+
+    def timing_key(self) -> Tuple:
+        return (
+            self.config.model_name, self.config.video_height, self.config.video_width,
+            self.config.fp8, self.config.generation_fps
+        )
+
+    def clip_frame_bytes(self) -> int:
+        match = re.search(r"_(\d+)s$", self.config.model_name)
+        seconds = int(match.group(1)) if match else 5
+        return (seconds * self.config.generation_fps + 1) * self.config.video_height * self.config.video_width * 3
+
+    def _frame_handoff(self, nbytes: Optional[int] = None) -> Tuple[Optional[str], int]:
+        limit = int(self.config.frame_handoff_gb * 1024 ** 3)
+        if limit <= 0:
+            return None, 0
+
+        nbytes = nbytes or self.clip_frame_bytes()
+        if self.frame_budget.reserve(nbytes, limit):
+            return "memory", nbytes
+        return "spill", 0
+
+    def _track_frames(self, output: Any, reserved: int) -> Optional[FrameBuffer]:
+        if not isinstance(output, FrameBuffer):
+            self.frame_budget.release(reserved)
+            return None
+
+        if output.in_memory:
+            output.track(self.frame_budget, reserved)
+        else:
+            self.frame_budget.release(reserved)
+        return output
+
+    def text_embedding_stats(self) -> Optional[Dict[str, Any]]:
+        if self.engine_worker is not None:
+            if not self.engine_worker.is_running():
+                return None
+            return self.engine_worker.backend_stats()["text_embeddings"]
+        if self._engine is not None:
+            return self._engine.stats()["text_embeddings"]
+        return None
 
     def generate_clips(
         self,
@@ -73,6 +139,14 @@ class OviVideoGenerator:
         output_dir: str,
         seed: Optional[int] = None
     ) -> List[GeneratedClip]:
+        if self.config.num_workers > 1:
+            devices = [device.strip() for device in self.config.devices.split(",") if device.strip()]
+            scheduler = ClipScheduler(self, self.config.num_workers, devices=devices)
+            return scheduler.run(prompts, output_dir, seed=seed)
+
+        if self.batch_size() > 1:
+            return self.generate_batch(prompts, output_dir, seed=seed)
+
         if not self._initialized:
             self.initialize()
 
@@ -86,52 +160,254 @@ class OviVideoGenerator:
             if self.progress_callback:
                 self.progress_callback(idx + 1, total, f"Generating clip {idx + 1}/{total}")
 
-            clip = self._generate_single_clip(
-                prompt=prompt,
-                output_dir=output_path,
-                seed=seed or self.config.seed
-            )
+            clip = self._reuse_clip(prompt, output_path)
+            if clip is None:
+                clip = self._generate_single_clip(
+                    prompt=prompt,
+                    output_dir=output_path,
+                    seed=seed or self.config.seed
+                )
+            self._complete_clip(prompt, clip)
             clips.append(clip)
 
         return clips
 
+    def generate_batch(
+        self,
+        prompts: List[VideoPrompt],
+        output_dir: str,
+        seed: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> List[GeneratedClip]:
+        if not self._initialized:
+            self.initialize()
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        batch_size = batch_size or self.batch_size()
+        base_seed = seed or self.config.seed
+        total = len(prompts)
+
+        clips: Dict[int, GeneratedClip] = {}
+        groups: Dict[Tuple, List[Tuple[int, VideoPrompt, Dict[str, Any]]]] = {}
+
+        for idx, prompt in enumerate(prompts):
+            clip = self._reuse_clip(prompt, output_path)
+            if clip is not None:
+                self._complete_clip(prompt, clip)
+                clips[idx] = clip
+                continue
+
+            request = self._clip_request(prompt, output_path, base_seed)
+            groups.setdefault(self._batch_key(request), []).append((idx, prompt, request))
+
+        done = len(clips)
+        for group in groups.values():
+            for start in range(0, len(group), batch_size):
+                chunk = group[start:start + batch_size]
+
+                if self.progress_callback:
+                    self.progress_callback(
+                        done + len(chunk), total,
+                        f"Generating clips {done + 1}-{done + len(chunk)}/{total}"
+                    )
+
+                outputs = self._render_batch([request for _, _, request in chunk])
+
+                for (idx, prompt, request), output in zip(chunk, outputs):
+                    clip = self._clip_from_request(prompt, request, output)
+                    self._complete_clip(prompt, clip)
+                    clips[idx] = clip
+                done += len(chunk)
+
+        return [clips[idx] for idx in range(total)]
+
+    def _batch_key(self, request: Dict[str, Any]) -> Tuple:
+        return tuple(sorted(
+            (key, repr(value)) for key, value in request.items()
+            if key not in BATCH_INVARIANT_KEYS
+        ))
+
+    def _reuse_clip(self, prompt: VideoPrompt, output_dir: Path) -> Optional[GeneratedClip]:
+        if self.clip_library is None:
+            return None
+
+        library_prompt = self._format_prompt_for_ovi(prompt)
+        duration = prompt.end_time - prompt.start_time
+
+        entry = self.clip_library.find_match(
+            library_prompt,
+            width=self.config.video_width,
+            height=self.config.video_height,
+            duration=duration
+        )
+        if entry is None:
+            return None
+
+        output_path = output_dir / f"clip_{prompt.segment_index:04d}.mp4"
+        try:
+            self.clip_library.materialize(entry, str(output_path), duration)
+        except Exception as e:
+            print(f"Error reusing library clip {entry.entry_id}: {e}")
+            return None
+
+        return GeneratedClip(
+            segment_index=prompt.segment_index,
+            start_time=prompt.start_time,
+            end_time=prompt.end_time,
+            video_path=str(output_path),
+            prompt_used=library_prompt,
+            reused=True
+        )
+
+    def _complete_clip(self, prompt: VideoPrompt, clip: GeneratedClip):
+        if not clip.reused:
+            self._store_clip(prompt, clip)
+        if self.clip_callback:
+            self.clip_callback(clip)
+
+    def _store_clip(self, prompt: VideoPrompt, clip: GeneratedClip):
+        if self.clip_library is None or clip.frames is not None:
+            return
+
+        try:
+            self.clip_library.add(
+                self._format_prompt_for_ovi(prompt),
+                clip.video_path,
+                width=self.config.video_width,
+                height=self.config.video_height
+            )
+        except Exception as e:
+            print(f"Error adding clip {clip.segment_index} to library: {e}")
+
     def _generate_single_clip(
         self,
         prompt: VideoPrompt,
         output_dir: Path,
         seed: int
     ) -> GeneratedClip:
-        from ovi.utils.io_utils import save_video
+        request = self._clip_request(prompt, output_dir, seed)
+        output = self._render_batch([request])[0]
+        return self._clip_from_request(prompt, request, output)
 
-        ovi_prompt = self._format_prompt_for_ovi(prompt)
+    def _clip_request(self, prompt: VideoPrompt, output_dir: Path, seed: int) -> Dict[str, Any]:
+        output_filename = f"clip_{prompt.segment_index:04d}.mp4"
+
+        request = self._render_request(
+            text_prompt=self._format_prompt_for_ovi(prompt),
+            negative_prompt=prompt.negative_prompt,
+            seed=prompt.seed if prompt.seed is not None else seed + prompt.segment_index,
+            output_path=str(output_dir / output_filename)
+        )
+        if prompt.sample_steps:
+            request["sample_steps"] = prompt.sample_steps
+        return request
 
-        generated_video, generated_audio, _ = self._engine.generate(
-            text_prompt=ovi_prompt,
+    def _clip_from_request(
+        self,
+        prompt: VideoPrompt,
+        request: Dict[str, Any],
+        output: Any = None
+    ) -> GeneratedClip:
+        return GeneratedClip(
+            segment_index=prompt.segment_index,
+            start_time=prompt.start_time,
+            end_time=prompt.end_time,
+            video_path=request["output_path"],
+            prompt_used=request["text_prompt"],
+            frames=output if isinstance(output, FrameBuffer) else None
+        )
+
+    def _render_request(
+        self,
+        text_prompt: str,
+        negative_prompt: str,
+        seed: int,
+        output_path: str
+    ) -> Dict[str, Any]:
+        return dict(
+            output_path=output_path,
+            text_prompt=text_prompt,
             image_path=None,
             video_frame_height_width=[self.config.video_height, self.config.video_width],
-            seed=seed + prompt.segment_index,
+            seed=seed,
             solver_name="unipc",
             sample_steps=self.config.sample_steps,
             shift=5.0,
             video_guidance_scale=self.config.video_guidance_scale,
             audio_guidance_scale=self.config.audio_guidance_scale,
             slg_layer=11,
-            video_negative_prompt=prompt.negative_prompt,
+            video_negative_prompt=negative_prompt,
             audio_negative_prompt="robotic, muffled, echo, distorted"
         )
 
-        output_filename = f"clip_{prompt.segment_index:04d}.mp4"
-        output_path = output_dir / output_filename
+    def _cache_key(self, request: Dict[str, Any]) -> Optional[str]:
+        if self.clip_cache is None:
+            return None
 
-        save_video(str(output_path), generated_video, generated_audio, fps=24, sample_rate=16000)
+        inputs = {key: value for key, value in request.items() if key != "output_path"}
+        if self.config.generation_fps != OVI_FPS:
+            inputs["generation_fps"] = self.config.generation_fps
 
-        return GeneratedClip(
-            segment_index=prompt.segment_index,
-            start_time=prompt.start_time,
-            end_time=prompt.end_time,
-            video_path=str(output_path),
-            prompt_used=ovi_prompt
-        )
+        return clip_cache_key(model_name=self.config.model_name, fp8=self.config.fp8, **inputs)
+
+    def _render_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        frame_handoff: bool = True
+    ) -> List[Union[str, FrameBuffer]]:
+        outputs: Dict[int, Union[str, FrameBuffer]] = {}
+        pending = []
+        for idx, request in enumerate(requests):
+            cache_key = self._cache_key(request)
+            if cache_key is not None and self.clip_cache.get(cache_key, request["output_path"]):
+                outputs[idx] = request["output_path"]
+                continue
+            pending.append((idx, request, cache_key))
+
+        reservations = []
+        engine_requests = []
+        for _, request, _ in pending:
+            handoff, reserved = self._frame_handoff() if frame_handoff else (None, 0)
+            reservations.append(reserved)
+            engine_requests.append({**request, "frame_handoff": handoff} if handoff else request)
+
+        renderer = self.engine_worker if self.engine_worker is not None else self._engine
+
+        started = time.monotonic()
+        try:
+            if len(engine_requests) == 1:
+                request = dict(engine_requests[0])
+                rendered = [renderer.generate(request.pop("output_path"), **request)]
+            elif engine_requests:
+                rendered = renderer.generate_batch(engine_requests)
+            else:
+                rendered = []
+        except Exception:
+            for reserved in reservations:
+                self.frame_budget.release(reserved)
+            raise
+
+        if engine_requests:
+            record_step_timing(
+                self.timing_key(),
+                time.monotonic() - started,
+                sum(request["sample_steps"] for request in engine_requests)
+            )
+
+        for (idx, request, cache_key), output, reserved in zip(pending, rendered, reservations):
+            frames = self._track_frames(output, reserved)
+            outputs[idx] = frames if frames is not None else request["output_path"]
+
+            if cache_key is None or frames is not None:
+                continue
+            try:
+                self.clip_cache.put(cache_key, request["output_path"])
+            except OSError as e:
+                print(f"Error caching clip {request['output_path']}: {e}")
+
+        return [outputs[idx] for idx in range(len(requests))]
 
     def _format_prompt_for_ovi(self, prompt: VideoPrompt) -> str:
         return f"{prompt.prompt_text}\n\n{prompt.audio_description}"
@@ -147,28 +423,15 @@ class OviVideoGenerator:
         if not self._initialized:
             self.initialize()
 
-        from ovi.utils.io_utils import save_video
-
         full_prompt = f"{prompt_text}\n\nAudio: {audio_description}"
 
-        generated_video, generated_audio, _ = self._engine.generate(
+        request = self._render_request(
             text_prompt=full_prompt,
-            image_path=None,
-            video_frame_height_width=[self.config.video_height, self.config.video_width],
+            negative_prompt=negative_prompt,
             seed=seed or self.config.seed,
-            solver_name="unipc",
-            sample_steps=self.config.sample_steps,
-            shift=5.0,
-            video_guidance_scale=self.config.video_guidance_scale,
-            audio_guidance_scale=self.config.audio_guidance_scale,
-            slg_layer=11,
-            video_negative_prompt=negative_prompt,
-            audio_negative_prompt="robotic, muffled, echo, distorted"
+            output_path=output_path
         )
-
-        save_video(output_path, generated_video, generated_audio, fps=24, sample_rate=16000)
-
-        return output_path
+        return self._render_batch([request], frame_handoff=False)[0]
 
     def is_available(self) -> bool:
         try:
@@ -178,48 +441,62 @@ class OviVideoGenerator:
             return False
 
 
+MOCK_CHUNK_FRAMES = 24
+
+
 class MockOviVideoGenerator(OviVideoGenerator):
     def initialize(self):
         self._initialized = True
 
+    def batch_size(self) -> int:
+        return 1
+
     def _generate_single_clip(
         self,
         prompt: VideoPrompt,
         output_dir: Path,
         seed: int
     ) -> GeneratedClip:
-        import cv2
-        import numpy as np
-
         output_filename = f"clip_{prompt.segment_index:04d}.mp4"
         output_path = output_dir / output_filename
 
         duration = prompt.end_time - prompt.start_time
-        fps = 24
-        num_frames = int(duration * fps)
-
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(
-            str(output_path),
-            fourcc,
-            fps,
-            (self.config.video_width, self.config.video_height)
-        )
-
-        for i in range(num_frames):
-            frame = np.zeros((self.config.video_height, self.config.video_width, 3), dtype=np.uint8)
-
-            hue = int((i / num_frames) * 180)
-            frame[:, :] = [hue, 200, 200]
-            frame = cv2.cvtColor(frame, cv2.COLOR_HSV2BGR)
+        fps = self.config.generation_fps
+        num_frames = max(1, int(duration * fps))
 
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            text = f"Segment {prompt.segment_index}"
-            cv2.putText(frame, text, (50, 100), font, 2, (255, 255, 255), 3)
+        if self.config.mock_latency > 0:
+            time.sleep(self.config.mock_latency * fps / OVI_FPS)
 
-            out.write(frame)
+        handoff, reserved = self._frame_handoff(
+            num_frames * self.config.video_height * self.config.video_width * 3
+        )
+        if handoff is not None:
+            frames = self._mock_frames(prompt, 0, num_frames, num_frames)[..., ::-1]
+            if handoff == "memory":
+                try:
+                    buffer = FrameBuffer.create(frames, fps=fps)
+                except MemoryError:
+                    buffer = FrameBuffer.create(frames, fps=fps, spill_path=str(output_path))
+            else:
+                buffer = FrameBuffer.create(frames, fps=fps, spill_path=str(output_path))
+
+            return GeneratedClip(
+                segment_index=prompt.segment_index,
+                start_time=prompt.start_time,
+                end_time=prompt.end_time,
+                video_path=str(output_path),
+                prompt_used=prompt.prompt_text,
+                frames=self._track_frames(buffer, reserved)
+            )
 
-        out.release()
+        self._encode_frames(
+            str(output_path),
+            (
+                self._mock_frames(prompt, start, min(start + MOCK_CHUNK_FRAMES, num_frames), num_frames)
+                for start in range(0, num_frames, MOCK_CHUNK_FRAMES)
+            ),
+            fps
+        )
 
         return GeneratedClip(
             segment_index=prompt.segment_index,
@@ -228,3 +505,53 @@ class MockOviVideoGenerator(OviVideoGenerator):
             video_path=str(output_path),
             prompt_used=prompt.prompt_text
         )
+
+    def _mock_frames(self, prompt: VideoPrompt, start: int, stop: int, num_frames: int):
+        import cv2
+        import numpy as np
+
+        height, width = self.config.video_height, self.config.video_width
+
+        hues = (np.arange(start, stop) / num_frames * 180).astype(np.uint8)
+        hsv = np.empty((1, len(hues), 3), dtype=np.uint8)
+        hsv[0, :, 0] = hues
+        hsv[0, :, 1:] = 200
+        colors = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)[0]
+
+        alpha = np.zeros((height, width), dtype=np.uint8)
+        text = f"Segment {prompt.segment_index}"
+        cv2.putText(alpha, text, (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, 255, 3)
+        text_pixels = np.flatnonzero(alpha)
+        text_alpha = alpha.reshape(-1)[text_pixels].astype(np.int32)[None, :, None]
+
+        frames = np.empty((len(hues), height, width, 3), dtype=np.uint8)
+        frames.reshape(len(hues), height, -1)[:] = np.tile(colors, (1, width))[:, None, :]
+        frames.reshape(len(hues), -1, 3)[:, text_pixels] = (
+            colors.astype(np.int32)[:, None, :] * (255 - text_alpha) + 255 * text_alpha + 127
+        ) // 255
+        return frames
+
+    def _encode_frames(self, output_path: str, chunks: Iterable[Any], fps: int):
+        import subprocess
+        import imageio_ffmpeg
+
+        width, height = self.config.video_width, self.config.video_height
+        cmd = [
+            imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-",
+            "-c:v", "mpeg4", "-q:v", "5", "-pix_fmt", "yuv420p",
+            output_path
+        ]
+
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for chunk in chunks:
+                process.stdin.write(chunk.tobytes())
+        except BrokenPipeError:
+            pass
+        _, stderr = process.communicate()
+
+        if process.returncode != 0:
+            raise RuntimeError(f"Mock clip encoding failed: {stderr.decode(errors='replace').strip()}")
@@ -0,0 +1,160 @@
+import re
+import threading
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class SegmentProfile:
+    segment_index: int
+    energy: float
+    repetition: float = 0.0
+    priority: float = 1.0
+
+
+@dataclass
+class StepPlan:
+    steps: Dict[int, int]
+    mode: str = "adaptive"
+    deadline_seconds: Optional[float] = None
+    seconds_per_step: Optional[float] = None
+    estimated_seconds: Optional[float] = None
+    feasible: bool = True
+    measured_seconds: Optional[float] = None
+    measured_seconds_per_step: Optional[float] = None
+    importance: Dict[int, float] = field(default_factory=dict)
+
+    @property
+    def total_steps(self) -> int:
+        return sum(self.steps.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["steps"] = {str(idx): steps for idx, steps in sorted(self.steps.items())}
+        data["importance"] = {str(idx): round(value, 3) for idx, value in sorted(self.importance.items())}
+        data["total_steps"] = self.total_steps
+        return data
+
+
+def _lyric_words(text: Optional[str]) -> set:
+    return set(re.findall(r"[a-z']+", (text or "").lower()))
+
+
+def segment_similarity(a: Any, b: Any, max_energy: float) -> float:
+    scores = [
+        1.0 if a.mood == b.mood else 0.0,
+        1.0 - min(1.0, abs(a.energy - b.energy) / max_energy),
+        1.0 - min(1.0, abs(a.tempo - b.tempo) / 20.0)
+    ]
+
+    words_a, words_b = _lyric_words(a.lyrics), _lyric_words(b.lyrics)
+    if words_a and words_b:
+        scores.append(len(words_a & words_b) / len(words_a | words_b))
+
+    return sum(scores) / len(scores)
+
+
+def profile_segments(
+    segments: Sequence[Any],
+    priorities: Optional[Dict[int, float]] = None
+) -> List[SegmentProfile]:
+    priorities = priorities or {}
+    max_energy = max((segment.energy for segment in segments), default=0.0) or 1.0
+
+    profiles = []
+    for idx, segment in enumerate(segments):
+        repetition = max(
+            (segment_similarity(segment, earlier, max_energy) for earlier in segments[:idx]),
+            default=0.0
+        )
+        profiles.append(SegmentProfile(
+            segment_index=idx,
+            energy=segment.energy / max_energy,
+            repetition=repetition,
+            priority=float(priorities.get(idx, 1.0))
+        ))
+    return profiles
+
+
+class StepPlanner:
+    def __init__(
+        self,
+        base_steps: int = 50,
+        min_steps: int = 20,
+        max_steps: int = 60,
+        repetition_threshold: float = 0.8
+    ):
+        self.base_steps = base_steps
+        self.min_steps = min(min_steps, base_steps)
+        self.max_steps = max(max_steps, base_steps)
+        self.repetition_threshold = repetition_threshold
+
+    def importance(self, profile: SegmentProfile) -> float:
+        repeated = max(0.0, profile.repetition - self.repetition_threshold) / (1.0 - self.repetition_threshold)
+        return max(0.0, profile.priority) * (0.5 + profile.energy) * (1.0 - 0.5 * repeated)
+
+    def _steps_for(self, weights: Dict[int, float], scale: float) -> Dict[int, int]:
+        return {
+            idx: max(self.min_steps, min(self.max_steps, int(round(self.base_steps * weight * scale))))
+            for idx, weight in weights.items()
+        }
+
+    def plan(
+        self,
+        profiles: List[SegmentProfile],
+        deadline_seconds: Optional[float] = None,
+        seconds_per_step: Optional[float] = None,
+        parallelism: int = 1
+    ) -> StepPlan:
+        if not profiles:
+            return StepPlan(steps={})
+
+        raw = {profile.segment_index: self.importance(profile) for profile in profiles}
+        mean = sum(raw.values()) / len(raw) or 1.0
+        weights = {idx: value / mean for idx, value in raw.items()}
+
+        steps = self._steps_for(weights, 1.0)
+        plan = StepPlan(steps=steps, importance=weights)
+
+        if deadline_seconds is None or not seconds_per_step:
+            return plan
+
+        plan.mode = "deadline"
+        plan.deadline_seconds = deadline_seconds
+        plan.seconds_per_step = seconds_per_step
+
+        step_budget = max(0.0, deadline_seconds) * max(1, parallelism) / seconds_per_step
+        if plan.total_steps > step_budget:
+            low, high = 0.0, 1.0
+            for _ in range(40):
+                mid = (low + high) / 2
+                if sum(self._steps_for(weights, mid).values()) <= step_budget:
+                    low = mid
+                else:
+                    high = mid
+            plan.steps = self._steps_for(weights, low)
+            plan.feasible = plan.total_steps <= step_budget
+
+        plan.estimated_seconds = plan.total_steps * seconds_per_step / max(1, parallelism)
+        return plan
+
+
+_timings: Dict[Tuple, Tuple[float, int]] = {}
+_timings_lock = threading.Lock()
+
+
+def record_step_timing(key: Tuple, seconds: float, steps: int, smoothing: float = 0.3):
+    if steps <= 0 or seconds <= 0:
+        return
+
+    with _timings_lock:
+        observed = seconds / steps
+        previous, samples = _timings.get(key, (observed, 0))
+        estimate = observed if samples == 0 else (1 - smoothing) * previous + smoothing * observed
+        _timings[key] = (estimate, samples + 1)
+
+
+def get_seconds_per_step(key: Tuple) -> Optional[float]:
+    with _timings_lock:
+        timing = _timings.get(key)
+        return timing[0] if timing else None
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TextEmbeddingCache:
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._entries
+
+    def get(self, model_name: str, text: str) -> Optional[Any]:
+        key = (model_name, text)
+        with self._lock:
+            self.lookups += 1
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, model_name: str, text: str, embedding: Any):
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[(model_name, text)] = embedding
+            self._entries.move_to_end((model_name, text))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0
+        }
+
+
+class CachedTextEncoder:
+    def __init__(self, encoder: Any, cache: TextEmbeddingCache, model_name: str):
+        self.encoder = encoder
+        self.cache = cache
+        self.model_name = model_name
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.encoder, name)
+
+    def __call__(self, texts: List[str], *args, **kwargs) -> List[Any]:
+        embeddings = [self.cache.get(self.model_name, text) for text in texts]
+
+        missing = list(dict.fromkeys(
+            text for text, embedding in zip(texts, embeddings) if embedding is None
+        ))
+        if missing:
+            encoded = dict(zip(missing, self.encoder(missing, *args, **kwargs)))
+            for text, embedding in encoded.items():
+                self.cache.put(self.model_name, text, embedding)
+            embeddings = [
+                encoded[text] if embedding is None else embedding
+                for text, embedding in zip(texts, embeddings)
+            ]
+
+        return embeddings
+
+
+def install_text_embedding_cache(engine: Any, cache: TextEmbeddingCache, model_name: str) -> bool:
+    encoder = getattr(engine, "text_model", None)
+    if encoder is None:
+        return False
+
+    if isinstance(encoder, CachedTextEncoder):
+        encoder.cache = cache
+        return True
+
+    engine.text_model = CachedTextEncoder(encoder, cache, model_name)
+    return True
@@ -1,11 +1,15 @@
 import os
+import re
 import tempfile
 from typing import List, Optional, Tuple, Callable
 from pathlib import Path
 from dataclasses import dataclass
 import subprocess
 
+import cv2
+import numpy as np
 from moviepy.editor import (
+    VideoClip,
     VideoFileClip,
     AudioFileClip,
     concatenate_videoclips,
@@ -14,6 +18,8 @@ from moviepy.editor import (
 )
 
 from .ovi_generator import GeneratedClip
+from .frame_buffer import FrameBuffer
+from .frame_interpolation import FrameInterpolator
 from .lipsync_processor import MuseTalkLipSyncProcessor, LipSyncConfig, create_audio_segment
 
 
@@ -29,6 +35,12 @@ class CompositionConfig:
     video_bitrate: str = "8M"
     audio_bitrate: str = "192k"
     enable_lipsync: bool = False
+    frame_interpolation: str = "dis"
+    upscale_method: str = "none"
+    superres_model: str = ""
+
+
+UPSCALE_METHODS = ("none", "lanczos", "superres")
 
 
 class VideoComposer:
@@ -40,6 +52,11 @@ class VideoComposer:
         self.config = config or CompositionConfig()
         self.progress_callback = progress_callback
         self.lipsync_processor = None
+        self.interpolator = FrameInterpolator(self.config.frame_interpolation)
+        self._superres = None
+
+        if self.config.upscale_method not in UPSCALE_METHODS:
+            raise ValueError(f"Unknown upscale method: {self.config.upscale_method}")
 
         if self.config.enable_lipsync:
             self.lipsync_processor = MuseTalkLipSyncProcessor(
@@ -61,16 +78,42 @@ class VideoComposer:
     ) -> str:
         clips_sorted = sorted(clips, key=lambda c: c.segment_index)
 
+        try:
+            return self._compose(clips_sorted, original_audio_path, output_path, use_crossfade)
+        finally:
+            for clip in clips_sorted:
+                if clip.frames is not None:
+                    clip.frames.release()
+
+    def _compose(
+        self,
+        clips_sorted: List[GeneratedClip],
+        original_audio_path: str,
+        output_path: str,
+        use_crossfade: bool
+    ) -> str:
         if self.config.enable_lipsync and self.lipsync_processor:
             self._log("Starting lip sync processing...")
             clips_sorted = self._apply_lipsync_to_clips(clips_sorted, original_audio_path)
 
         video_clips = []
+        sources = []
         for clip in clips_sorted:
+            if clip.frames is not None:
+                video_clips.append(self._frames_to_clip(clip.frames))
+                continue
+
             if not os.path.exists(clip.video_path):
                 raise FileNotFoundError(f"Video clip not found: {clip.video_path}")
 
             video = VideoFileClip(clip.video_path)
+            if self._needs_interpolation(video.fps):
+                sources.append(video)
+                video = self._interpolated_clip(
+                    lambda idx, source=video: source.get_frame(idx / source.fps),
+                    int(round(video.duration * video.fps)),
+                    video.fps
+                )
             video_clips.append(video)
 
         if use_crossfade and len(video_clips) > 1:
@@ -90,6 +133,9 @@ class VideoComposer:
 
         final_video = final_video.set_audio(original_audio)
 
+        if self.config.upscale_method == "superres" and self._needs_upscale(final_video.size):
+            final_video = self._apply_superres(final_video)
+
         output_dir = os.path.dirname(output_path)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
@@ -102,16 +148,102 @@ class VideoComposer:
             bitrate=self.config.video_bitrate,
             audio_bitrate=self.config.audio_bitrate,
             threads=4,
-            preset='medium'
+            preset='medium',
+            ffmpeg_params=self._scale_filter(final_video.size)
         )
 
-        for clip in video_clips:
+        for clip in video_clips + sources:
             clip.close()
         final_video.close()
         original_audio.close()
 
         return output_path
 
+    def _needs_upscale(self, size: Tuple[int, int]) -> bool:
+        width, height = self.config.output_resolution
+        return self.config.upscale_method != "none" and size[0] < width and size[1] < height
+
+    def _scale_filter(self, size: Tuple[int, int]) -> Optional[List[str]]:
+        if self.config.upscale_method == "none" or tuple(size) == tuple(self.config.output_resolution):
+            return None
+
+        width, height = self.config.output_resolution
+        return [
+            "-vf",
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease:flags=lanczos,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,format=yuv420p"
+        ]
+
+    def _load_superres(self):
+        if self._superres is not None:
+            return self._superres
+
+        match = re.match(r"([a-z]+)_x(\d+)", Path(self.config.superres_model).stem.lower())
+        if not hasattr(cv2, "dnn_superres") or not match or not os.path.exists(self.config.superres_model):
+            self._log("Super-resolution model unavailable; upscaling with lanczos only")
+            self._superres = False
+            return self._superres
+
+        model = cv2.dnn_superres.DnnSuperResImpl_create()
+        model.readModel(self.config.superres_model)
+        model.setModel(match.group(1), int(match.group(2)))
+        self._superres = model
+        return self._superres
+
+    def _apply_superres(self, video: VideoClip) -> VideoClip:
+        model = self._load_superres()
+        if not model:
+            return video
+
+        self._log(f"Upscaling frames with {Path(self.config.superres_model).name}")
+        return video.fl_image(lambda frame: model.upsample(np.ascontiguousarray(frame[..., ::-1]))[..., ::-1])
+
+    def _needs_interpolation(self, fps: float) -> bool:
+        return self.interpolator.method != "none" and fps < self.config.output_fps - 0.5
+
+    def _interpolated_clip(
+        self,
+        get_frame: Callable[[int], np.ndarray],
+        num_frames: int,
+        fps: float
+    ) -> VideoClip:
+        make_frame = self.interpolator.frame_function(get_frame, num_frames, fps)
+        return VideoClip(make_frame, duration=num_frames / fps)
+
+    def _frames_to_clip(self, buffer: FrameBuffer, interpolate: bool = True) -> VideoClip:
+        frames = buffer.array()
+        last = len(frames) - 1
+        fps = buffer.fps
+
+        if interpolate and self._needs_interpolation(fps):
+            return self._interpolated_clip(lambda idx: frames[idx], len(frames), fps)
+
+        def make_frame(t):
+            return frames[min(int(t * fps + 1e-6), last)]
+
+        return VideoClip(make_frame, duration=buffer.duration)
+
+    def _write_frames(self, clip: GeneratedClip) -> GeneratedClip:
+        video = self._frames_to_clip(clip.frames, interpolate=False)
+        video.write_videofile(
+            clip.video_path,
+            fps=clip.frames.fps,
+            codec=self.config.video_codec,
+            audio=False,
+            logger=None
+        )
+        video.close()
+        clip.frames.release()
+
+        return GeneratedClip(
+            segment_index=clip.segment_index,
+            start_time=clip.start_time,
+            end_time=clip.end_time,
+            video_path=clip.video_path,
+            prompt_used=clip.prompt_used,
+            reused=clip.reused
+        )
+
     def _concatenate_with_crossfade(self, clips: List[VideoFileClip]) -> VideoFileClip:
         if len(clips) == 1:
             return clips[0]
@@ -243,6 +375,9 @@ class VideoComposer:
         for idx, clip in enumerate(clips):
             self._log(f"Lip syncing clip {idx + 1}/{total}")
 
+            if clip.frames is not None:
+                clip = self._write_frames(clip)
+
             audio_segment_path = temp_dir / f"audio_segment_{idx:04d}.wav"
             create_audio_segment(
                 audio_path=audio_path,
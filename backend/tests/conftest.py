@@ -110,3 +110,94 @@ def mock_config():
     config.output_dir = "./test_output"
     config.temp_dir = "./test_temp"
     return config
+
+
+class FakeOviEngine:
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, **kwargs):
+        self.calls.append([kwargs])
+        return f"video:{kwargs['text_prompt']}:{kwargs['seed']}", "audio", None
+
+    def generate_batch(self, requests):
+        self.calls.append(list(requests))
+        return [(f"video:{r['text_prompt']}:{r['seed']}", "audio", None) for r in requests]
+
+
+class FakeFrameEngine:
+    def generate(self, **kwargs):
+        video = np.full((3, 5, 16, 16), kwargs["seed"] / 100.0, dtype=np.float32)
+        return video, "audio", None
+
+
+class FakeTextEngine:
+    def __init__(self):
+        self.encoded = []
+        self.text_model = Mock(side_effect=self._encode)
+        self.text_model.device = "cuda:0"
+
+    def _encode(self, texts, device):
+        self.encoded.extend(texts)
+        return [f"emb:{text}" for text in texts]
+
+    def generate(self, text_prompt, video_negative_prompt, audio_negative_prompt, **kwargs):
+        embeddings = self.text_model(
+            [text_prompt, video_negative_prompt, audio_negative_prompt],
+            self.text_model.device
+        )
+        return embeddings[0], "audio", None
+
+
+def save_text_video(path, video, audio, fps, sample_rate):
+    Path(path).write_text(video)
+
+
+def frame_engine_backend(ovi_path, config):
+    from src.video_generation.engine_worker import OviEngineBackend
+    return OviEngineBackend(ovi_path, config, engine=FakeFrameEngine(), save_video=Mock())
+
+
+@pytest.fixture
+def make_prompts():
+    from src.prompt_generation.prompt_generator import VideoPrompt
+
+    def _make(count, duration=5.0, scenes=None):
+        return [
+            VideoPrompt(i, i * duration, (i + 1) * duration, f"scene {i % scenes if scenes else i}", "music", "")
+            for i in range(count)
+        ]
+    return _make
+
+
+@pytest.fixture
+def fake_ovi_engine():
+    return FakeOviEngine
+
+
+@pytest.fixture
+def fake_frame_engine():
+    return FakeFrameEngine
+
+
+@pytest.fixture
+def frame_backend_factory():
+    return frame_engine_backend
+
+
+@pytest.fixture
+def fake_text_engine():
+    return FakeTextEngine
+
+
+@pytest.fixture
+def make_ovi_generator():
+    from src.video_generation.engine_worker import OviEngineBackend
+    from src.video_generation.ovi_generator import OviVideoGenerator, GenerationConfig
+
+    def _make(engine, save_video=save_text_video, **config):
+        generator = OviVideoGenerator(config=GenerationConfig(**config))
+        generator._engine = OviEngineBackend("./Ovi", generator.config, engine=engine, save_video=save_video)
+        generator._initialized = True
+        return generator
+    return _make
@@ -0,0 +1,104 @@
+import sys
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch
+
+from src.audio_analysis.asr_backends import (
+    ASR_BACKENDS,
+    FasterWhisperBackend,
+    get_asr_loader,
+    real_time_factor,
+    word_agreement
+)
+from src.audio_analysis.lyrics_extractor import LyricsExtractor, TimestampedLyric
+from src.audio_analysis.whisper_registry import get_whisper_registry
+
+
+@pytest.fixture
+def mock_faster_whisper():
+    words = [
+        SimpleNamespace(word=" hello", start=0.0, end=0.4),
+        SimpleNamespace(word=" world", start=0.5, end=1.0)
+    ]
+    segment = SimpleNamespace(start=0.0, end=1.0, text=" hello world", words=words)
+
+    model = MagicMock()
+    model.transcribe.return_value = (iter([segment]), SimpleNamespace(language="en"))
+
+    module = MagicMock()
+    module.WhisperModel.return_value = model
+
+    with patch.dict(sys.modules, {"faster_whisper": module}):
+        yield module, model
+
+
+class TestAsrBackends:
+    def test_available_backends(self):
+        assert "whisper" in ASR_BACKENDS
+        assert "faster-whisper" in ASR_BACKENDS
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown lyrics backend"):
+            get_asr_loader("nonexistent")
+
+    def test_faster_whisper_loads_int8_on_cpu(self, mock_faster_whisper):
+        module, _ = mock_faster_whisper
+
+        FasterWhisperBackend("small")
+
+        args, kwargs = module.WhisperModel.call_args
+        assert args == ("small",)
+        assert kwargs["device"] == "cpu"
+        assert kwargs["compute_type"] == "int8"
+
+    def test_faster_whisper_returns_whisper_format(self, mock_faster_whisper):
+        backend = FasterWhisperBackend("base")
+
+        result = backend.transcribe(np.zeros(16000, dtype=np.float32), word_timestamps=True)
+
+        assert result["text"] == "hello world"
+        assert result["segments"][0]["start"] == 0.0
+        assert [word["word"] for word in result["segments"][0]["words"]] == [" hello", " world"]
+
+    def test_faster_whisper_missing_dependency(self):
+        with patch.dict(sys.modules, {"faster_whisper": None}):
+            with pytest.raises(ImportError, match="faster-whisper"):
+                FasterWhisperBackend("base")
+
+    def test_extractor_output_matches_across_backends(self, mock_faster_whisper, mock_whisper_model):
+        mock_whisper_model.transcribe.return_value = {
+            "text": "hello world",
+            "segments": [{"start": 0.0, "end": 1.0, "text": " hello world"}]
+        }
+        whisper_extractor = LyricsExtractor(backend="whisper")
+        whisper_extractor._model = mock_whisper_model
+
+        faster_extractor = LyricsExtractor(backend="faster-whisper")
+        faster_extractor._model = FasterWhisperBackend("base")
+
+        audio = np.zeros(16000, dtype=np.float32)
+        expected = [TimestampedLyric(0.0, 1.0, "hello world")]
+
+        assert whisper_extractor.extract_with_timestamps(audio, 16000) == expected
+        assert faster_extractor.extract_with_timestamps(audio, 16000) == expected
+
+    def test_registry_per_backend(self):
+        assert get_whisper_registry("whisper") is get_whisper_registry()
+        assert get_whisper_registry("faster-whisper") is not get_whisper_registry("whisper")
+
+
+class TestBenchmarkMetrics:
+    def test_word_agreement_identical(self):
+        assert word_agreement("Hello, world!", "hello world") == 1.0
+
+    def test_word_agreement_partial(self):
+        assert word_agreement("the quick brown fox", "the quick red fox") == pytest.approx(0.75)
+
+    def test_word_agreement_empty(self):
+        assert word_agreement("", "") == 1.0
+        assert word_agreement("words", "") == 0.0
+
+    def test_real_time_factor(self):
+        assert real_time_factor(5.0, 20.0) == pytest.approx(0.25)
+        assert real_time_factor(1.0, 0.0) is None
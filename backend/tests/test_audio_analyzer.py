@@ -1,9 +1,11 @@
+import threading
 import pytest
 import numpy as np
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
 
 from src.audio_analysis.analyzer import AudioAnalyzer, AudioSegment, AudioAnalysisResult
+from src.audio_analysis.lyrics_extractor import LyricsIndex, LyricsTranscription, TimestampedLyric
 
 
 class TestAudioAnalyzer:
@@ -95,14 +97,136 @@ class TestAudioAnalyzer:
 
                 with patch('src.audio_analysis.analyzer.LyricsExtractor') as mock_lyrics_cls:
                     mock_lyrics_instance = Mock()
-                    mock_lyrics_instance.extract.return_value = "Test lyrics here"
+                    mock_lyrics_instance.transcribe.return_value = LyricsTranscription(
+                        text="Test lyrics here",
+                        segments=[TimestampedLyric(0.0, 2.0, "Test lyrics here")]
+                    )
                     mock_lyrics_cls.return_value = mock_lyrics_instance
 
                     analyzer = AudioAnalyzer()
                     result = analyzer.analyze(temp_audio_file, extract_lyrics=True)
 
                     assert result.lyrics == "Test lyrics here"
-                    mock_lyrics_instance.extract.assert_called_once_with(temp_audio_file)
+                    assert len(result.timestamped_lyrics) == 1
+                    mock_lyrics_instance.transcribe.assert_called_once_with(y, sr)
+
+    @patch('librosa.load')
+    def test_analyze_transcribes_concurrently_with_dsp(self, mock_load, temp_audio_file, sample_audio_data):
+        y, sr = sample_audio_data
+        mock_load.return_value = (y, sr)
+        dsp_started = threading.Event()
+        overlapped = []
+
+        def transcribe(audio, sample_rate):
+            overlapped.append(dsp_started.wait(timeout=5))
+            return LyricsTranscription(
+                text="late lyrics",
+                segments=[TimestampedLyric(1.0, 2.0, "late lyrics")]
+            )
+
+        def classify(audio, sample_rate):
+            dsp_started.set()
+            return "happy"
+
+        segment = AudioSegment(0.0, 5.0, 120.0, 0.5, "happy", 2000.0)
+
+        with patch('src.audio_analysis.analyzer.LyricsExtractor') as mock_lyrics_cls:
+            mock_lyrics_cls.return_value.transcribe.side_effect = transcribe
+            analyzer = AudioAnalyzer()
+
+            with patch.object(analyzer.mood_classifier, 'classify', side_effect=classify):
+                with patch.object(analyzer, '_predict_genre', return_value="pop"):
+                    with patch.object(analyzer, '_create_segments', return_value=[segment]):
+                        result = analyzer.analyze(temp_audio_file, extract_lyrics=True)
+
+        assert overlapped == [True]
+        assert result.lyrics == "late lyrics"
+        assert result.segments[0].lyrics == "late lyrics"
+
+    @patch('librosa.load')
+    def test_analyze_stream_yields_segments_before_lyrics(self, mock_load, temp_audio_file, sample_audio_data):
+        y, sr = sample_audio_data
+        mock_load.return_value = (y, sr)
+        first_yielded = threading.Event()
+
+        def transcribe(audio, sample_rate):
+            first_yielded.wait(timeout=5)
+            return LyricsTranscription(
+                text="one two three",
+                segments=[
+                    TimestampedLyric(1.0, 2.0, "one"),
+                    TimestampedLyric(6.0, 7.0, "two"),
+                    TimestampedLyric(11.0, 12.0, "three")
+                ]
+            )
+
+        segments = [AudioSegment(i * 5.0, (i + 1) * 5.0, 120.0, 0.5, "happy", 2000.0) for i in range(3)]
+
+        with patch('src.audio_analysis.analyzer.LyricsExtractor') as mock_lyrics_cls:
+            mock_lyrics_cls.return_value.transcribe.side_effect = transcribe
+            analyzer = AudioAnalyzer()
+
+            with patch.object(analyzer.mood_classifier, 'classify', return_value="happy"):
+                with patch.object(analyzer, '_predict_genre', return_value="pop"):
+                    with patch.object(analyzer, '_iter_segments', return_value=iter(segments)):
+                        seen = []
+                        for result, idx in analyzer.analyze_stream(temp_audio_file, extract_lyrics=True):
+                            seen.append((idx, len(result.segments), result.segments[idx].lyrics))
+                            first_yielded.set()
+
+        assert [(idx, count) for idx, count, _ in seen] == [(0, 1), (1, 2), (2, 3)]
+        assert seen[0][2] is None
+        assert result.lyrics == "one two three"
+        assert [segment.lyrics for segment in result.segments] == ["one", "two", "three"]
+
+    @patch('librosa.load')
+    def test_analyze_stream_without_lyrics(self, mock_load, temp_audio_file, sample_audio_data):
+        mock_load.return_value = sample_audio_data
+        segment = AudioSegment(0.0, 5.0, 120.0, 0.5, "happy", 2000.0)
+
+        analyzer = AudioAnalyzer()
+        with patch.object(analyzer.mood_classifier, 'classify', return_value="happy"):
+            with patch.object(analyzer, '_predict_genre', return_value="pop"):
+                with patch.object(analyzer, '_iter_segments', return_value=iter([segment])):
+                    items = list(analyzer.analyze_stream(temp_audio_file, extract_lyrics=False))
+
+        assert len(items) == 1
+        assert items[0][0].segments == [segment]
+        assert items[0][0].content_hash is not None
+        assert items[0][0].lyrics is None
+
+    def test_apply_lyrics_updates_analysis_and_segments(self):
+        analyzer = AudioAnalyzer()
+        analysis = AudioAnalysisResult(
+            duration=10.0,
+            overall_tempo=120.0,
+            overall_mood="happy",
+            genre_prediction="pop",
+            segments=[
+                AudioSegment(0.0, 5.0, 120.0, 0.5, "happy", 2000.0),
+                AudioSegment(5.0, 10.0, 120.0, 0.5, "happy", 2000.0)
+            ],
+            beat_times=np.array([]),
+            energy_profile=np.array([]),
+            spectral_centroid=np.array([])
+        )
+        transcription = LyricsTranscription(
+            text="verse chorus",
+            segments=[TimestampedLyric(1.0, 2.0, "verse"), TimestampedLyric(6.0, 7.0, "chorus")],
+            skipped_fraction=0.4
+        )
+
+        analyzer.apply_lyrics(analysis, transcription)
+
+        assert analysis.lyrics == "verse chorus"
+        assert analysis.lyrics_skipped_fraction == 0.4
+        assert [segment.lyrics for segment in analysis.segments] == ["verse", "chorus"]
+
+    def test_apply_lyrics_none_leaves_analysis(self):
+        analyzer = AudioAnalyzer()
+        analysis = Mock()
+
+        assert analyzer.apply_lyrics(analysis, None) is analysis
 
     def test_predict_genre_electronic(self):
         analyzer = AudioAnalyzer()
@@ -219,10 +343,41 @@ class TestAudioAnalyzer:
 
             assert len(segments) == 2
 
-    def test_extract_segment_lyrics_returns_none(self):
+    def test_extract_segment_lyrics_uses_overlapping_spans(self):
+        analyzer = AudioAnalyzer()
+        index = LyricsIndex([
+            TimestampedLyric(0.5, 3.0, "first line"),
+            TimestampedLyric(4.0, 6.0, "second line"),
+            TimestampedLyric(7.0, 9.0, "third line")
+        ])
+
+        assert analyzer._extract_segment_lyrics(index, 0.0, 5.0) == "first line second line"
+        assert analyzer._extract_segment_lyrics(index, 5.0, 10.0) == "second line third line"
+
+    def test_extract_segment_lyrics_returns_none_without_overlap(self):
         analyzer = AudioAnalyzer()
-        result = analyzer._extract_segment_lyrics("Full lyrics text", 0.0, 5.0)
-        assert result is None
+        index = LyricsIndex([TimestampedLyric(0.5, 3.0, "first line")])
+
+        assert analyzer._extract_segment_lyrics(index, 10.0, 15.0) is None
+
+    @patch('librosa.beat.beat_track')
+    @patch('librosa.feature.rms')
+    @patch('librosa.feature.spectral_centroid')
+    def test_create_segments_assigns_lyrics(self, mock_centroid, mock_rms, mock_beat):
+        mock_beat.return_value = (120.0, np.array([10, 20]))
+        mock_rms.return_value = np.array([[0.5, 0.6]])
+        mock_centroid.return_value = np.array([[2000.0, 2100.0]])
+
+        analyzer = AudioAnalyzer(segment_duration=5.0)
+        sr = 22050
+        y = np.random.randn(sr * 10)
+        index = LyricsIndex([TimestampedLyric(6.0, 8.0, "chorus")])
+
+        with patch.object(analyzer.mood_classifier, 'classify', return_value="happy"):
+            segments = analyzer._create_segments(y, sr, 10.0, np.array([]), index)
+
+        assert segments[0].lyrics is None
+        assert segments[1].lyrics == "chorus"
 
     @patch('librosa.beat.beat_track')
     def test_analyze_handles_numpy_array_tempo(self, mock_beat, temp_audio_file, sample_audio_data):
@@ -0,0 +1,124 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+from src.audio_analysis.chunked_transcription import ChunkedTranscriber
+from src.audio_analysis.lyrics_extractor import LyricsExtractor
+
+
+def _words(*entries):
+    return [{"word": f" {text}", "start": start, "end": end} for text, start, end in entries]
+
+
+class TestChunkedTranscriber:
+    def test_invalid_overlap_raises(self):
+        with pytest.raises(ValueError):
+            ChunkedTranscriber(chunk_duration=10.0, overlap=10.0)
+
+    def test_split_windows_overlap_and_cover(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+
+        windows = transcriber.split_windows(25 * 100, sr=100)
+
+        assert windows == [(0, 1000), (800, 1800), (1600, 2500)]
+
+    def test_split_windows_short_audio_single_window(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+
+        assert transcriber.split_windows(500, sr=100) == [(0, 500)]
+
+    def test_should_chunk(self):
+        transcriber = ChunkedTranscriber(max_workers=4, chunk_duration=30.0)
+
+        assert transcriber.should_chunk(60.0)
+        assert not transcriber.should_chunk(59.0)
+        assert not ChunkedTranscriber(max_workers=1).should_chunk(1000.0)
+
+    def test_stitch_offsets_and_deduplicates_overlap(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+        windows = [(0, 1000), (800, 1800)]
+        results = [
+            {"segments": [{"words": _words(("hello", 1.0, 1.5), ("bright", 7.5, 8.2), ("world", 8.6, 9.5))}]},
+            {"segments": [{"words": _words(("bright", -0.5, 0.2), ("world", 0.6, 1.5), ("again", 3.0, 3.5))}]}
+        ]
+
+        stitched = transcriber.stitch(results, windows, sr=100)
+
+        assert stitched["text"] == "hello bright world again"
+        starts = [word["start"] for segment in stitched["segments"] for word in segment["words"]]
+        assert starts == pytest.approx([1.0, 7.5, 8.6, 11.0])
+
+    def test_stitch_drops_repeated_word_straddling_cut(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+        windows = [(0, 1000), (800, 1800)]
+        results = [
+            {"segments": [{"words": _words(("love", 8.7, 9.1))}]},
+            {"segments": [{"words": _words(("love", 1.0, 1.3), ("you", 1.4, 1.8))}]}
+        ]
+
+        stitched = transcriber.stitch(results, windows, sr=100)
+
+        assert stitched["text"] == "love you"
+
+    def test_stitch_keeps_genuine_repeats(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+        windows = [(0, 1000)]
+        results = [{"segments": [{"words": _words(("la", 1.0, 1.2), ("la", 1.5, 1.7), ("la", 2.0, 2.2))}]}]
+
+        stitched = transcriber.stitch(results, windows, sr=100)
+
+        assert stitched["text"] == "la la la"
+
+    def test_stitch_segments_without_words_by_midpoint(self):
+        transcriber = ChunkedTranscriber(chunk_duration=10.0, overlap=2.0)
+        windows = [(0, 1000), (800, 1800)]
+        results = [
+            {"segments": [{"start": 2.0, "end": 4.0, "text": "first"}, {"start": 8.5, "end": 9.5, "text": "dup"}]},
+            {"segments": [{"start": 0.5, "end": 1.5, "text": "dup"}, {"start": 4.0, "end": 5.0, "text": "last"}]}
+        ]
+
+        stitched = transcriber.stitch(results, windows, sr=100)
+
+        assert stitched["text"] == "first dup last"
+        assert stitched["segments"][1]["start"] == pytest.approx(8.5)
+
+    def test_transcribe_dispatches_each_window(self):
+        transcriber = ChunkedTranscriber(max_workers=2, chunk_duration=10.0, overlap=2.0)
+        audio = np.zeros(25 * 16000, dtype=np.float32)
+
+        with patch.object(transcriber, '_transcribe_windows', return_value=[{"segments": []}] * 3) as mock_windows:
+            result = transcriber.transcribe(audio)
+
+        assert len(mock_windows.call_args[0][1]) == 3
+        assert result == {"text": "", "segments": []}
+
+
+class TestLyricsExtractorChunking:
+    def test_long_audio_uses_chunked_transcriber(self):
+        chunked = ChunkedTranscriber(max_workers=2, chunk_duration=10.0, overlap=2.0)
+        chunked.transcribe = Mock(return_value={
+            "text": "stitched",
+            "segments": [{"start": 1.0, "end": 2.0, "text": "stitched"}]
+        })
+        model = Mock()
+
+        extractor = LyricsExtractor(chunked_transcriber=chunked)
+        extractor._model = model
+
+        transcription = extractor.transcribe(np.zeros(30 * 16000, dtype=np.float32), 16000)
+
+        assert transcription.text == "stitched"
+        chunked.transcribe.assert_called_once()
+        model.transcribe.assert_not_called()
+
+    def test_short_audio_uses_single_model(self, mock_whisper_model):
+        chunked = ChunkedTranscriber(max_workers=2, chunk_duration=10.0, overlap=2.0)
+        chunked.transcribe = Mock()
+
+        extractor = LyricsExtractor(chunked_transcriber=chunked)
+        extractor._model = mock_whisper_model
+
+        extractor.transcribe(np.zeros(5 * 16000, dtype=np.float32), 16000)
+
+        chunked.transcribe.assert_not_called()
+        mock_whisper_model.transcribe.assert_called_once()
@@ -0,0 +1,112 @@
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.clip_cache import ClipCache, clip_cache_key, get_clip_cache
+from src.video_generation.ovi_generator import OviVideoGenerator, GenerationConfig
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+def _write(path, size):
+    Path(path).write_bytes(b"x" * size)
+    return str(path)
+
+
+class TestClipCacheKey:
+    def test_same_inputs_same_key(self):
+        assert clip_cache_key(prompt="a", seed=1) == clip_cache_key(seed=1, prompt="a")
+
+    def test_any_input_change_changes_key(self):
+        base = clip_cache_key(prompt="a", seed=1, sample_steps=50)
+
+        assert clip_cache_key(prompt="a", seed=2, sample_steps=50) != base
+        assert clip_cache_key(prompt="a", seed=1, sample_steps=30) != base
+
+
+class TestClipCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = ClipCache(str(tmp_path / "cache"))
+        source = _write(tmp_path / "clip.mp4", 10)
+
+        assert cache.get("k", str(tmp_path / "out.mp4")) is False
+        cache.put("k", source)
+        assert cache.get("k", str(tmp_path / "out.mp4")) is True
+
+        assert (tmp_path / "out.mp4").read_bytes() == b"x" * 10
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ClipCache(str(tmp_path / "cache"), max_bytes=25)
+        cache.put("a", _write(tmp_path / "a.mp4", 10))
+        cache.put("b", _write(tmp_path / "b.mp4", 10))
+        cache.get("a", str(tmp_path / "out.mp4"))
+
+        cache.put("c", _write(tmp_path / "c.mp4", 10))
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert not (tmp_path / "cache" / "b.mp4").exists()
+        assert cache.stats()["bytes"] == 20
+
+    def test_oversized_clip_not_cached(self, tmp_path):
+        cache = ClipCache(str(tmp_path / "cache"), max_bytes=5)
+
+        cache.put("a", _write(tmp_path / "a.mp4", 10))
+
+        assert len(cache) == 0
+
+    def test_entries_survive_restart(self, tmp_path):
+        ClipCache(str(tmp_path / "cache")).put("a", _write(tmp_path / "a.mp4", 10))
+
+        reloaded = ClipCache(str(tmp_path / "cache"))
+
+        assert "a" in reloaded
+        assert reloaded.stats()["bytes"] == 10
+
+    def test_missing_file_counts_as_miss(self, tmp_path):
+        cache = ClipCache(str(tmp_path / "cache"))
+        cache.put("a", _write(tmp_path / "a.mp4", 10))
+        os.remove(tmp_path / "cache" / "a.mp4")
+
+        assert cache.get("a", str(tmp_path / "out.mp4")) is False
+        assert "a" not in cache
+
+    def test_get_clip_cache_shared(self, tmp_path):
+        assert get_clip_cache(str(tmp_path / "c")) is get_clip_cache(str(tmp_path / "c"))
+
+
+class TestGeneratorClipCache:
+    def _generator(self, tmp_path, **config):
+        engine_worker = Mock()
+        engine_worker.generate.side_effect = lambda output_path, **kwargs: _write(output_path, 10)
+        generator = OviVideoGenerator(
+            config=GenerationConfig(**config),
+            engine_worker=engine_worker,
+            clip_cache=ClipCache(str(tmp_path / "cache"))
+        )
+        return generator, engine_worker
+
+    def test_rerender_served_from_cache(self, tmp_path):
+        generator, engine_worker = self._generator(tmp_path)
+        prompt = VideoPrompt(0, 0.0, 5.0, "neon city", "synth", "")
+
+        generator.generate_clips([prompt], str(tmp_path / "job1"))
+        clips = generator.generate_clips([prompt], str(tmp_path / "job2"))
+
+        assert engine_worker.generate.call_count == 1
+        assert Path(clips[0].video_path).exists()
+        assert str(tmp_path / "job2") in clips[0].video_path
+
+    def test_changed_inputs_miss_cache(self, tmp_path):
+        generator, engine_worker = self._generator(tmp_path)
+        prompt = VideoPrompt(0, 0.0, 5.0, "neon city", "synth", "")
+
+        generator.generate_clips([prompt], str(tmp_path / "job1"))
+        generator.generate_clips([prompt], str(tmp_path / "job2"), seed=5)
+        generator.config.sample_steps = 20
+        generator.generate_clips([prompt], str(tmp_path / "job3"))
+
+        assert engine_worker.generate.call_count == 3
@@ -0,0 +1,172 @@
+import pytest
+import numpy as np
+
+from src.video_generation.clip_library import (
+    ClipLibrary,
+    hashed_ngram_vector,
+    probe_clip_duration,
+    retime_clip
+)
+from src.video_generation.ovi_generator import MockOviVideoGenerator, GenerationConfig
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+def _write_clip(path, duration=2.0, fps=24, size=32):
+    import cv2
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), fps, (size, size))
+    for i in range(int(duration * fps)):
+        writer.write(np.full((size, size, 3), i % 255, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+@pytest.fixture
+def clip_file(tmp_path):
+    return _write_clip(tmp_path / "source.mp4")
+
+
+class TestHashedNgramVector:
+    def test_identical_prompts_have_unit_similarity(self):
+        a = hashed_ngram_vector("neon city streets at night")
+        b = hashed_ngram_vector("Neon city streets at night!")
+
+        assert float(a @ b) == pytest.approx(1.0)
+
+    def test_similar_prompts_score_higher_than_unrelated(self):
+        query = hashed_ngram_vector("neon city streets at night, rain")
+        similar = hashed_ngram_vector("neon city streets at night, fog")
+        unrelated = hashed_ngram_vector("sunny meadow with wildflowers")
+
+        assert float(query @ similar) > float(query @ unrelated)
+
+    def test_empty_text_is_zero_vector(self):
+        assert not hashed_ngram_vector("").any()
+
+
+class TestClipLibrary:
+    def test_add_copies_clip_into_library(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"))
+
+        entry = library.add("neon city", clip_file, width=32, height=32)
+
+        assert entry.video_path.startswith(str(tmp_path / "library"))
+        assert entry.duration == pytest.approx(2.0, abs=0.1)
+        assert len(library) == 1
+
+    def test_query_ranks_by_similarity(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"))
+        library.add("sunny meadow with wildflowers", clip_file, 32, 32, duration=2.0)
+        library.add("neon city streets at night", clip_file, 32, 32, duration=2.0)
+
+        results = library.query("neon city streets at night, rain", top_k=2)
+
+        assert results[0][0].prompt == "neon city streets at night"
+        assert results[0][1] > results[1][1]
+
+    def test_find_match_requires_threshold_and_resolution(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"), threshold=0.9)
+        library.add("neon city streets at night", clip_file, 32, 32, duration=2.0)
+
+        assert library.find_match("neon city streets at night", 32, 32, 2.0) is not None
+        assert library.find_match("neon city streets at night", 64, 64, 2.0) is None
+        assert library.find_match("sunny meadow with wildflowers", 32, 32, 2.0) is None
+
+    def test_find_match_rejects_large_retime(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"), max_retime=0.25)
+        library.add("neon city", clip_file, 32, 32, duration=2.0)
+
+        assert library.find_match("neon city", 32, 32, 2.4) is not None
+        assert library.find_match("neon city", 32, 32, 5.0) is None
+
+    def test_stats_track_hit_rate(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"))
+        library.add("neon city", clip_file, 32, 32, duration=2.0)
+
+        library.find_match("neon city", 32, 32, 2.0)
+        library.find_match("ocean waves", 32, 32, 2.0)
+
+        stats = library.stats()
+        assert stats["lookups"] == 2
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_index_persists_across_instances(self, tmp_path, clip_file):
+        ClipLibrary(str(tmp_path / "library")).add("neon city", clip_file, 32, 32, duration=2.0)
+
+        reloaded = ClipLibrary(str(tmp_path / "library"))
+
+        assert len(reloaded) == 1
+        assert reloaded.find_match("neon city", 32, 32, 2.0) is not None
+
+    def test_evicts_least_used_clips_over_budget(self, tmp_path, clip_file):
+        import os
+
+        size = os.path.getsize(clip_file)
+        library = ClipLibrary(str(tmp_path / "library"), max_bytes=2 * size)
+        reused = library.add("neon city streets", clip_file, 32, 32, duration=2.0)
+        stale = library.add("ocean waves crashing", clip_file, 32, 32, duration=2.0)
+        library.find_match("neon city streets", 32, 32, 2.0)
+
+        fresh = library.add("desert dunes at dawn", clip_file, 32, 32, duration=2.0)
+
+        assert len(library) == 2
+        assert not os.path.exists(stale.video_path)
+        assert os.path.exists(reused.video_path) and os.path.exists(fresh.video_path)
+        assert library.query("ocean waves crashing")[0][0].entry_id != stale.entry_id
+        assert library.stats()["evictions"] == 1
+        assert library.stats()["bytes"] == 2 * size
+
+    def test_budget_applied_when_reloaded(self, tmp_path, clip_file):
+        import os
+
+        library = ClipLibrary(str(tmp_path / "library"))
+        library.add("neon city", clip_file, 32, 32, duration=2.0)
+        library.add("ocean waves", clip_file, 32, 32, duration=2.0)
+
+        reloaded = ClipLibrary(str(tmp_path / "library"), max_bytes=os.path.getsize(clip_file))
+
+        assert len(reloaded) == 1
+        assert len(ClipLibrary(str(tmp_path / "library"))) == 1
+
+    def test_clip_larger_than_budget_not_added(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"), max_bytes=10)
+
+        assert library.add("neon city", clip_file, 32, 32, duration=2.0) is None
+        assert len(library) == 0
+
+    def test_materialize_retimes_clip(self, tmp_path, clip_file):
+        library = ClipLibrary(str(tmp_path / "library"))
+        entry = library.add("neon city", clip_file, 32, 32)
+
+        output = library.materialize(entry, str(tmp_path / "out.mp4"), duration=2.25)
+
+        assert probe_clip_duration(output) == pytest.approx(2.25, abs=0.05)
+
+
+class TestRetimeClip:
+    def test_retime_changes_frame_count(self, tmp_path, clip_file):
+        output = retime_clip(clip_file, str(tmp_path / "slow.mp4"), duration=3.0)
+
+        assert probe_clip_duration(output) == pytest.approx(3.0, abs=0.05)
+
+
+class TestGeneratorClipReuse:
+    def test_second_run_reuses_library_clips(self, tmp_path):
+        library = ClipLibrary(str(tmp_path / "library"))
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_width=32, video_height=32),
+            clip_library=library
+        )
+        prompts = [
+            VideoPrompt(i, i * 1.0, (i + 1) * 1.0, f"scene {name}", "music", "")
+            for i, name in enumerate(["neon city", "ocean waves"])
+        ]
+
+        first = generator.generate_clips(prompts, str(tmp_path / "job1"))
+        second = generator.generate_clips(prompts, str(tmp_path / "job2"))
+
+        assert [clip.reused for clip in first] == [False, False]
+        assert [clip.reused for clip in second] == [True, True]
+        assert all(str(tmp_path / "job2") in clip.video_path for clip in second)
+        assert library.stats()["hits"] == 2
@@ -0,0 +1,89 @@
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.clip_scheduler import ClipScheduler, shutdown_pools
+from src.video_generation.ovi_generator import MockOviVideoGenerator, GenerationConfig
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pools():
+    yield
+    shutdown_pools()
+
+
+class TestClipScheduler:
+    def test_clips_reassembled_in_segment_order(self, tmp_path, make_prompts):
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_width=32, video_height=32, num_workers=2)
+        )
+        progress = Mock()
+        generator.progress_callback = progress
+
+        clips = generator.generate_clips(make_prompts(6, duration=0.5), str(tmp_path))
+
+        assert [clip.segment_index for clip in clips] == list(range(6))
+        assert all(Path(clip.video_path).exists() for clip in clips)
+        assert [call[0][0] for call in progress.call_args_list] == [1, 2, 3, 4, 5, 6]
+        assert all(call[0][1] == 6 for call in progress.call_args_list)
+
+    def test_work_runs_in_worker_processes(self, tmp_path, make_prompts):
+        import os
+
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_width=32, video_height=32))
+        scheduler = ClipScheduler(generator, num_workers=2)
+
+        clips = scheduler.run(make_prompts(4, duration=0.5), str(tmp_path))
+
+        assert len(clips) == 4
+        assert scheduler.worker_pids
+        assert os.getpid() not in scheduler.worker_pids
+        assert len(scheduler.worker_pids) <= 2
+
+    def test_pool_reused_across_runs(self, tmp_path, make_prompts):
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_width=32, video_height=32))
+
+        first = ClipScheduler(generator, num_workers=2)
+        first.run(make_prompts(2, duration=0.5), str(tmp_path / "a"))
+        second = ClipScheduler(generator, num_workers=2)
+        second.run(make_prompts(2, duration=0.5), str(tmp_path / "b"))
+
+        assert first._get_pool() is second._get_pool()
+        assert second.worker_pids <= first.worker_pids or len(first.worker_pids) < 2
+
+    def test_render_settings_share_pool_and_reach_workers(self, tmp_path, make_prompts):
+        import cv2
+
+        full = MockOviVideoGenerator(config=GenerationConfig(video_width=32, video_height=32, sample_steps=50))
+        draft = MockOviVideoGenerator(
+            config=GenerationConfig(video_width=64, video_height=64, sample_steps=10, frame_handoff_gb=1.0)
+        )
+
+        ClipScheduler(full, num_workers=1).run(make_prompts(1, duration=0.5), str(tmp_path / "full"))
+        scheduler = ClipScheduler(draft, num_workers=1)
+        clips = scheduler.run(make_prompts(1, duration=0.5), str(tmp_path / "draft"))
+
+        assert scheduler._get_pool() is ClipScheduler(full, num_workers=1)._get_pool()
+
+        capture = cv2.VideoCapture(clips[0].video_path)
+        ok, frame = capture.read()
+        capture.release()
+        assert ok
+        assert frame.shape[:2] == (64, 64)
+
+    def test_pool_key_tracks_engine_fields(self):
+        base = MockOviVideoGenerator(config=GenerationConfig())
+        fp16 = MockOviVideoGenerator(config=GenerationConfig(fp8=False))
+
+        assert ClipScheduler(base, 2)._pool_key() != ClipScheduler(fp16, 2)._pool_key()
+
+    def test_library_hits_skip_workers(self, tmp_path, make_prompts):
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_width=32, video_height=32))
+        reused = Mock(segment_index=0)
+        generator._reuse_clip = Mock(return_value=reused)
+        scheduler = ClipScheduler(generator, num_workers=2)
+
+        clips = scheduler.run(make_prompts(1, duration=0.5), str(tmp_path))
+
+        assert clips == [reused]
+        assert scheduler.worker_pids == set()
@@ -0,0 +1,111 @@
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.engine_worker import OviEngineWorker, get_engine_worker
+from src.video_generation.ovi_generator import OviVideoGenerator, GenerationConfig
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+class EchoBackend:
+    def __init__(self, ovi_path, config):
+        self.loads = 1
+
+    def generate(self, output_path, text_prompt, **kwargs):
+        if text_prompt == "fail":
+            raise ValueError("bad prompt")
+        if text_prompt == "crash once" and not os.path.exists(output_path + ".crashed"):
+            Path(output_path + ".crashed").touch()
+            os._exit(1)
+        if text_prompt == "crash":
+            os._exit(1)
+
+        Path(output_path).write_text(f"{os.getpid()}:{text_prompt}")
+        return output_path
+
+    def stats(self):
+        return {"text_embeddings": {"pid": os.getpid()}}
+
+
+class BrokenBackend:
+    def __init__(self, ovi_path, config):
+        raise ImportError("Ovi not installed")
+
+
+@pytest.fixture
+def worker():
+    worker = OviEngineWorker("./Ovi", GenerationConfig(), backend_factory=EchoBackend, start_timeout=60)
+    yield worker
+    worker.shutdown()
+
+
+class TestOviEngineWorker:
+    def test_engine_loaded_once_for_many_requests(self, worker, tmp_path):
+        outputs = [
+            worker.generate(str(tmp_path / f"clip_{i}.mp4"), text_prompt=f"scene {i}")
+            for i in range(3)
+        ]
+
+        pids = {Path(output).read_text().split(":")[0] for output in outputs}
+        assert len(pids) == 1
+        assert int(pids.pop()) != os.getpid()
+        assert worker.stats()["starts"] == 1
+        assert worker.stats()["requests"] == 3
+
+    def test_backend_stats_read_from_worker_process(self, worker):
+        stats = worker.backend_stats()
+
+        assert stats["text_embeddings"]["pid"] == worker.stats()["pid"]
+
+    def test_generation_error_keeps_worker_alive(self, worker, tmp_path):
+        with pytest.raises(RuntimeError, match="bad prompt"):
+            worker.generate(str(tmp_path / "clip.mp4"), text_prompt="fail")
+
+        worker.generate(str(tmp_path / "clip.mp4"), text_prompt="ok")
+        assert worker.stats()["restarts"] == 0
+
+    def test_restarts_and_retries_after_crash(self, worker, tmp_path):
+        output = worker.generate(str(tmp_path / "clip.mp4"), text_prompt="crash once")
+
+        assert Path(output).read_text().endswith("crash once")
+        assert worker.stats()["restarts"] == 1
+        assert worker.is_running()
+
+    def test_repeated_crash_raises(self, worker, tmp_path):
+        with pytest.raises(RuntimeError, match="crashed"):
+            worker.generate(str(tmp_path / "clip.mp4"), text_prompt="crash")
+
+    def test_failed_load_raises(self):
+        worker = OviEngineWorker("./Ovi", GenerationConfig(), backend_factory=BrokenBackend, start_timeout=60)
+
+        with pytest.raises(RuntimeError, match="Ovi not installed"):
+            worker.start()
+        assert not worker.is_running()
+
+    def test_get_engine_worker_shared_per_model(self):
+        config = GenerationConfig()
+
+        assert get_engine_worker("./Ovi", config) is get_engine_worker("./Ovi", GenerationConfig())
+        assert get_engine_worker("./Ovi", config) is not get_engine_worker(
+            "./Ovi", GenerationConfig(model_name="960x960_5s")
+        )
+
+
+class TestGeneratorWithEngineWorker:
+    def test_clips_rendered_through_worker(self, tmp_path):
+        engine_worker = Mock()
+        engine_worker.generate.side_effect = lambda output_path, **kwargs: output_path
+        generator = OviVideoGenerator(config=GenerationConfig(seed=7), engine_worker=engine_worker)
+        prompt = VideoPrompt(2, 10.0, 15.0, "neon city", "synth pads", "blurry")
+
+        clips = generator.generate_clips([prompt], str(tmp_path))
+
+        engine_worker.start.assert_called_once()
+        output_path, = engine_worker.generate.call_args[0]
+        kwargs = engine_worker.generate.call_args[1]
+        assert output_path == clips[0].video_path
+        assert kwargs["text_prompt"] == "neon city\n\nsynth pads"
+        assert kwargs["seed"] == 9
+        assert kwargs["video_negative_prompt"] == "blurry"
+        assert generator._engine is None
@@ -9,6 +9,7 @@ from src.utils.file_utils import (
     get_unique_filename,
     clean_temp_files,
     get_file_info,
+    compute_file_hash,
     SUPPORTED_AUDIO_FORMATS,
     SUPPORTED_VIDEO_FORMATS
 )
@@ -293,3 +294,27 @@ class TestConstants:
     def test_no_duplicate_formats(self):
         assert len(SUPPORTED_AUDIO_FORMATS) == len(set(SUPPORTED_AUDIO_FORMATS))
         assert len(SUPPORTED_VIDEO_FORMATS) == len(set(SUPPORTED_VIDEO_FORMATS))
+
+
+class TestComputeFileHash:
+    def test_same_content_same_hash(self, tmp_path):
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        first.write_bytes(b"audio bytes")
+        second.write_bytes(b"audio bytes")
+
+        assert compute_file_hash(str(first)) == compute_file_hash(str(second))
+
+    def test_different_content_different_hash(self, tmp_path):
+        first = tmp_path / "a.wav"
+        second = tmp_path / "b.wav"
+        first.write_bytes(b"audio bytes")
+        second.write_bytes(b"other bytes")
+
+        assert compute_file_hash(str(first)) != compute_file_hash(str(second))
+
+    def test_hash_independent_of_chunk_size(self, tmp_path):
+        audio_file = tmp_path / "a.wav"
+        audio_file.write_bytes(bytes(range(256)) * 100)
+
+        assert compute_file_hash(str(audio_file), chunk_size=7) == compute_file_hash(str(audio_file))
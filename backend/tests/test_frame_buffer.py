@@ -0,0 +1,171 @@
+import os
+import pickle
+import pytest
+import numpy as np
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.frame_buffer import FrameBuffer, FrameBudget, frames_to_uint8
+from src.video_generation.ovi_generator import OviVideoGenerator, MockOviVideoGenerator, GenerationConfig
+
+
+def _frames(count=4, size=8):
+    return np.random.RandomState(0).randint(0, 255, (count, size, size, 3), dtype=np.uint8)
+
+
+class TestFramesToUint8:
+    def test_channels_first_float_video(self):
+        video = np.zeros((3, 2, 4, 4), dtype=np.float32)
+        video[0] = 1.0
+        video[2] = -1.0
+
+        frames = frames_to_uint8(video)
+
+        assert frames.shape == (2, 4, 4, 3)
+        assert frames.dtype == np.uint8
+        assert tuple(frames[0, 0, 0]) == (255, 128, 0)
+
+    def test_uint8_frames_unchanged(self):
+        frames = _frames()
+
+        assert np.array_equal(frames_to_uint8(frames), frames)
+
+
+class TestFrameBuffer:
+    def test_shared_memory_round_trip(self):
+        frames = _frames()
+        buffer = FrameBuffer.create(frames, fps=24)
+
+        handle = pickle.loads(pickle.dumps(buffer))
+
+        assert buffer.in_memory
+        assert np.array_equal(handle.array(), frames)
+        assert handle.duration == pytest.approx(4 / 24)
+        handle.release()
+        buffer.release()
+
+    def test_release_frees_shared_memory(self):
+        from multiprocessing import shared_memory
+
+        buffer = FrameBuffer.create(_frames())
+        name = buffer.shm_name
+
+        buffer.release()
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        with pytest.raises(ValueError):
+            buffer.array()
+
+    def test_spill_to_disk(self, tmp_path):
+        frames = _frames()
+        buffer = FrameBuffer.create(frames, spill_path=str(tmp_path / "clip_0000.mp4"))
+
+        assert not buffer.in_memory
+        assert buffer.spill_path == str(tmp_path / "clip_0000.npy")
+        assert np.array_equal(buffer.array(), frames)
+
+        buffer.release()
+        assert not (tmp_path / "clip_0000.npy").exists()
+
+    def test_release_returns_budget(self):
+        budget = FrameBudget()
+        assert budget.reserve(100, limit=150)
+        assert not budget.reserve(100, limit=150)
+
+        buffer = FrameBuffer.create(_frames())
+        buffer.track(budget, 100)
+        buffer.release()
+
+        assert budget.used_bytes == 0
+        assert budget.peak_bytes == 100
+
+
+class TestGeneratorFrameHandoff:
+    @pytest.fixture
+    def frame_generator(self, make_ovi_generator, fake_frame_engine):
+        def _make(handoff_gb):
+            return make_ovi_generator(
+                fake_frame_engine(), save_video=Mock(), video_height=16, video_width=16, frame_handoff_gb=handoff_gb
+            )
+        return _make
+
+    def test_frames_handed_over_without_encoding(self, tmp_path, make_prompts, frame_generator):
+        generator = frame_generator(handoff_gb=1.0)
+
+        clips = generator.generate_clips(make_prompts(2), str(tmp_path))
+
+        generator._engine._save_video.assert_not_called()
+        assert all(clip.frames.in_memory for clip in clips)
+        assert clips[0].frames.array().shape == (5, 16, 16, 3)
+        assert generator.frame_budget.used_bytes == 2 * generator.clip_frame_bytes()
+
+        for clip in clips:
+            clip.frames.release()
+        assert generator.frame_budget.used_bytes == 0
+
+    def test_clips_over_budget_spill_to_disk(self, tmp_path, make_prompts, frame_generator):
+        generator = frame_generator(handoff_gb=0.0)
+        generator.config.frame_handoff_gb = 1.5 * generator.clip_frame_bytes() / 1024 ** 3
+
+        clips = generator.generate_clips(make_prompts(2), str(tmp_path))
+
+        assert clips[0].frames.in_memory
+        assert not clips[1].frames.in_memory
+        assert Path(clips[1].frames.spill_path).exists()
+        assert not Path(clips[1].video_path).exists()
+        for clip in clips:
+            clip.frames.release()
+
+    def test_frames_cross_engine_worker_process(self, tmp_path, make_prompts, frame_backend_factory):
+        from src.video_generation.engine_worker import OviEngineWorker
+
+        config = GenerationConfig(video_height=16, video_width=16, frame_handoff_gb=1.0)
+        worker = OviEngineWorker("./Ovi", config, backend_factory=frame_backend_factory, start_timeout=60)
+        generator = OviVideoGenerator(config=config, engine_worker=worker)
+        try:
+            clips = generator.generate_clips(make_prompts(2), str(tmp_path), seed=10)
+
+            assert clips[1].frames.in_memory
+            assert abs(int(clips[1].frames.array()[0, 0, 0, 0]) - (0.11 + 1) * 127.5) <= 1
+            for clip in clips:
+                clip.frames.release()
+            assert generator.frame_budget.used_bytes == 0
+        finally:
+            worker.shutdown()
+
+    def test_disabled_by_default(self, tmp_path, make_prompts, frame_generator):
+        generator = frame_generator(handoff_gb=0.0)
+
+        clips = generator.generate_clips(make_prompts(1), str(tmp_path))
+
+        assert clips[0].frames is None
+        generator._engine._save_video.assert_called_once()
+
+
+class TestComposerFrameHandoff:
+    def test_composes_from_frames_and_releases(self, tmp_path, make_prompts):
+        from scipy.io import wavfile
+        from moviepy.editor import VideoFileClip
+        from src.video_generation.video_composer import VideoComposer, CompositionConfig
+
+        audio_path = str(tmp_path / "song.wav")
+        wavfile.write(audio_path, 16000, np.zeros(16000, dtype=np.int16))
+
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_height=64, video_width=64, frame_handoff_gb=1.0)
+        )
+        prompts = make_prompts(2, duration=0.5)
+        clips = generator.generate_clips(prompts, str(tmp_path / "clips"))
+        names = [clip.frames.shm_name for clip in clips]
+
+        composer = VideoComposer(CompositionConfig(output_fps=12, crossfade_duration=0.1))
+        output = composer.compose_music_video(clips, audio_path, str(tmp_path / "out.mp4"))
+
+        video = VideoFileClip(output)
+        assert video.duration == pytest.approx(1.0, abs=0.15)
+        video.close()
+        assert not any(Path(clip.video_path).exists() for clip in clips)
+        assert all(clip.frames.released for clip in clips)
+        assert generator.frame_budget.used_bytes == 0
+        assert not any(os.path.exists(f"/dev/shm/{name}") for name in names)
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.video_generation.frame_interpolation import FrameInterpolator
+from src.video_generation.engine_worker import OviEngineBackend
+from src.video_generation.ovi_generator import GenerationConfig, MockOviVideoGenerator
+from src.video_generation.clip_cache import ClipCache
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+def moving_square(num_frames, step=10):
+    yy, xx = np.mgrid[0:40, 0:40]
+    texture = np.stack([128 + 100 * np.sin(xx / 4.0) * np.cos(yy / 5.0)] * 3, axis=-1).astype(np.uint8)
+    frames = np.zeros((num_frames, 96, 160, 3), dtype=np.uint8)
+    for idx in range(num_frames):
+        x = 20 + idx * step
+        frames[idx, 30:70, x:x + 40] = texture
+    return frames
+
+
+def square_columns(frame):
+    columns = np.where(frame[30:70].max(axis=(0, 2)) > 60)[0]
+    return columns.min(), columns.max()
+
+
+class TestFrameInterpolator:
+    @pytest.mark.parametrize("method", ["dis", "farneback"])
+    def test_intermediate_frames_closer_than_repeats(self, method):
+        truth = moving_square(11, step=5)
+        frames = truth[::2]
+
+        output = FrameInterpolator(method).interpolate(frames, 12, 24)
+
+        assert output.shape == (12, 96, 160, 3)
+        np.testing.assert_array_equal(output[2], frames[1])
+        for idx in (1, 3, 5, 7):
+            interpolated_error = np.abs(output[idx].astype(int) - truth[idx]).mean()
+            repeated_error = np.abs(frames[idx // 2].astype(int) - truth[idx]).mean()
+            assert interpolated_error < repeated_error / 4
+
+    def test_dis_places_moving_square_midway(self):
+        frames = moving_square(6)
+
+        output = FrameInterpolator("dis").interpolate(frames, 12, 24)
+
+        left, right = square_columns(output[3])
+        assert abs(left - 35) <= 2
+        assert abs(right - 74) <= 2
+
+    def test_none_repeats_frames(self):
+        frames = moving_square(4)
+
+        output = FrameInterpolator("none").interpolate(frames, 12, 24)
+
+        np.testing.assert_array_equal(output[1], frames[0])
+        np.testing.assert_array_equal(output[3], frames[1])
+
+    def test_flows_computed_once_per_frame_pair(self):
+        frames = moving_square(4)
+        interpolator = FrameInterpolator("dis")
+
+        interpolator.interpolate(frames, 8, 24)
+
+        assert interpolator.pairs_computed == 3
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError):
+            FrameInterpolator("rife")
+
+
+class TestLowFrameRateGeneration:
+    def test_backend_shortens_latent_length(self):
+        engine = Mock(video_latent_length=31)
+        save_video = Mock()
+        backend = OviEngineBackend(
+            "./Ovi", GenerationConfig(generation_fps=12, text_embedding_cache_size=0),
+            engine=engine, save_video=save_video
+        )
+        engine.generate.return_value = ("video", "audio", None)
+
+        backend.generate("/tmp/clip.mp4", text_prompt="a")
+
+        assert engine.video_latent_length == 16
+        assert backend.fps == 12
+        assert save_video.call_args.kwargs["fps"] == 12
+
+    def test_backend_without_latent_length_keeps_full_rate(self):
+        engine = Mock(spec=["generate"])
+        backend = OviEngineBackend(
+            "./Ovi", GenerationConfig(generation_fps=12, text_embedding_cache_size=0),
+            engine=engine, save_video=Mock()
+        )
+
+        assert backend.fps == 24
+
+    def test_mock_generator_renders_fewer_frames(self, tmp_path):
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_height=32, video_width=32, generation_fps=12, frame_handoff_gb=1.0)
+        )
+        prompt = VideoPrompt(0, 0.0, 2.0, "scene", "music", "")
+
+        clip = generator.generate_clips([prompt], str(tmp_path))[0]
+
+        assert clip.frames.num_frames == 24
+        assert clip.frames.fps == 12
+        assert clip.frames.duration == pytest.approx(2.0)
+        clip.frames.release()
+
+    def test_cache_key_depends_on_generation_fps(self, tmp_path):
+        cache = ClipCache(str(tmp_path / "cache"))
+        request = {"output_path": "a.mp4", "text_prompt": "scene", "seed": 1}
+        full = MockOviVideoGenerator(clip_cache=cache)
+        reduced = MockOviVideoGenerator(config=GenerationConfig(generation_fps=12), clip_cache=cache)
+
+        assert full._cache_key(request) != reduced._cache_key(request)
+
+
+class TestComposerInterpolation:
+    def test_low_fps_clips_interpolated_to_output_fps(self, tmp_path):
+        from scipy.io import wavfile
+        from moviepy.editor import VideoFileClip
+        from src.video_generation.video_composer import VideoComposer, CompositionConfig
+
+        audio_path = str(tmp_path / "song.wav")
+        wavfile.write(audio_path, 16000, np.zeros(16000, dtype=np.int16))
+
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_height=64, video_width=64, generation_fps=12)
+        )
+        prompts = [VideoPrompt(i, i * 0.5, (i + 1) * 0.5, f"scene {i}", "music", "") for i in range(2)]
+        clips = generator.generate_clips(prompts, str(tmp_path / "clips"))
+
+        composer = VideoComposer(CompositionConfig(output_fps=24, crossfade_duration=0.0))
+        output = composer.compose_music_video(clips, audio_path, str(tmp_path / "out.mp4"), use_crossfade=False)
+
+        video = VideoFileClip(output)
+        assert video.fps == 24
+        assert video.duration == pytest.approx(1.0, abs=0.1)
+        video.close()
+        assert composer.interpolator.pairs_computed >= 8
@@ -0,0 +1,88 @@
+import pytest
+from pathlib import Path
+
+from src.job_manifest import JobManifest, job_dir_path, list_job_manifests, remove_job_dir
+from src.prompt_generation.prompt_generator import VideoPrompt
+from src.video_generation.ovi_generator import GeneratedClip
+
+
+def _clip(tmp_path, idx, exists=True):
+    path = tmp_path / f"clip_{idx:04d}.mp4"
+    if exists:
+        path.write_bytes(b"clip")
+    return GeneratedClip(idx, idx * 5.0, (idx + 1) * 5.0, str(path), f"scene {idx}")
+
+
+class TestJobManifest:
+    def test_round_trip(self, tmp_path):
+        manifest = JobManifest(str(tmp_path), "job1", "/audio.mp3", options={"style_override": "anime"}, seed=7)
+        manifest.set_prompts([VideoPrompt(0, 0.0, 5.0, "scene", "desc", "neg")])
+        manifest.record_clip(_clip(tmp_path, 0), seed=7)
+
+        loaded = JobManifest.load(str(tmp_path))
+
+        assert loaded.job_id == "job1"
+        assert loaded.options == {"style_override": "anime"}
+        assert loaded.seed == 7
+        assert loaded.get_prompts() == [VideoPrompt(0, 0.0, 5.0, "scene", "desc", "neg")]
+        assert loaded.clips[0].seed == 7
+        assert loaded.completed_clips()[0].video_path == str(tmp_path / "clip_0000.mp4")
+
+    def test_missing_clip_files_are_pending(self, tmp_path):
+        manifest = JobManifest(str(tmp_path), "job1", "/audio.mp3")
+        manifest.set_prompts([VideoPrompt(i, i * 5.0, (i + 1) * 5.0, "s", "d", "n") for i in range(3)])
+        manifest.record_clip(_clip(tmp_path, 0))
+        manifest.record_clip(_clip(tmp_path, 1, exists=False))
+
+        assert [clip.segment_index for clip in manifest.completed_clips()] == [0]
+        assert [prompt.segment_index for prompt in manifest.pending_prompts()] == [1, 2]
+
+    def test_load_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            JobManifest.load(str(tmp_path))
+
+    def test_list_and_remove_jobs(self, tmp_path):
+        for job_id in ["0000000a", "0000000b"]:
+            JobManifest(str(tmp_path / job_id), job_id, "/audio.mp3").save()
+        (tmp_path / "not_a_job").mkdir()
+
+        assert [m.job_id for m in list_job_manifests(str(tmp_path))] == ["0000000a", "0000000b"]
+        assert remove_job_dir(str(tmp_path), "0000000a") is True
+        assert [m.job_id for m in list_job_manifests(str(tmp_path))] == ["0000000b"]
+
+    def test_remove_job_dir_rejects_invalid_ids(self, tmp_path):
+        jobs_dir = tmp_path / "jobs"
+        jobs_dir.mkdir()
+        (tmp_path / "keep").mkdir()
+
+        for job_id in ["..", "../keep", "", "not_a_job", "0000000A", "/tmp"]:
+            assert job_dir_path(str(jobs_dir), job_id) is None
+            assert remove_job_dir(str(jobs_dir), job_id) is False
+
+        assert jobs_dir.exists()
+        assert (tmp_path / "keep").exists()
+        assert job_dir_path(str(jobs_dir), "1a2b3c4d") == (jobs_dir / "1a2b3c4d").resolve()
+
+    def test_rejected_segment_gets_new_seed(self, tmp_path):
+        manifest = JobManifest(str(tmp_path), "job1", "/audio.mp3", seed=100)
+        manifest.record_clip(_clip(tmp_path, 0))
+        manifest.record_clip(_clip(tmp_path, 1))
+
+        manifest.reject_segments([1])
+        loaded = JobManifest.load(str(tmp_path))
+
+        assert loaded.segment_seed(0) == 100
+        assert loaded.segment_seed(1) != 101
+        assert sorted(loaded.clips) == [0]
+
+    def test_promote_draft_keeps_draft_clips(self, tmp_path):
+        manifest = JobManifest(str(tmp_path), "job1", "/audio.mp3")
+        manifest.phase = "draft"
+        manifest.record_clip(_clip(tmp_path, 0))
+
+        manifest.promote_draft()
+        loaded = JobManifest.load(str(tmp_path))
+
+        assert loaded.phase == "final"
+        assert loaded.clips == {}
+        assert list(loaded.draft_clips) == [0]
@@ -0,0 +1,172 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+from src.audio_analysis.lyrics_extractor import (
+    LyricsExtractor,
+    LyricsIndex,
+    LyricsTranscription,
+    TimestampedLyric,
+    WHISPER_SAMPLE_RATE
+)
+
+
+class TestLyricsExtractor:
+    def test_extract_from_path(self, temp_audio_file, mock_whisper_model):
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        lyrics = extractor.extract(temp_audio_file)
+
+        assert lyrics == "This is a test lyric"
+        mock_whisper_model.transcribe.assert_called_once_with(temp_audio_file, word_timestamps=False)
+
+    def test_extract_missing_path_returns_none(self, mock_whisper_model):
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        assert extractor.extract("/nonexistent/audio.wav") is None
+        mock_whisper_model.transcribe.assert_not_called()
+
+    def test_extract_from_array_resamples_once(self, sample_audio_data, mock_whisper_model):
+        y, sr = sample_audio_data
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        lyrics = extractor.extract(y, sr)
+
+        assert lyrics == "This is a test lyric"
+        audio = mock_whisper_model.transcribe.call_args[0][0]
+        assert isinstance(audio, np.ndarray)
+        assert audio.dtype == np.float32
+        assert abs(len(audio) - len(y) * WHISPER_SAMPLE_RATE / sr) <= 1
+
+    def test_extract_from_array_at_whisper_rate_skips_resample(self, mock_whisper_model):
+        y = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float64)
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        with patch('librosa.resample') as mock_resample:
+            extractor.extract(y, WHISPER_SAMPLE_RATE)
+            mock_resample.assert_not_called()
+
+        audio = mock_whisper_model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32
+        assert len(audio) == WHISPER_SAMPLE_RATE
+
+    def test_extract_empty_array_returns_none(self, mock_whisper_model):
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        assert extractor.extract(np.array([]), 22050) is None
+
+    def test_extract_handles_transcribe_error(self, sample_audio_data):
+        y, sr = sample_audio_data
+        extractor = LyricsExtractor()
+        extractor._model = Mock()
+        extractor._model.transcribe.side_effect = RuntimeError("decode failed")
+
+        assert extractor.extract(y, sr) is None
+
+    def test_extract_with_timestamps_from_array(self, sample_audio_data, mock_whisper_model):
+        y, sr = sample_audio_data
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        lyrics = extractor.extract_with_timestamps(y, sr)
+
+        assert lyrics == [
+            TimestampedLyric(0.0, 2.0, "This is"),
+            TimestampedLyric(2.0, 4.0, "a test lyric")
+        ]
+
+    def test_transcribe_returns_text_and_segments_in_one_pass(self, sample_audio_data, mock_whisper_model):
+        y, sr = sample_audio_data
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        transcription = extractor.transcribe(y, sr)
+
+        assert isinstance(transcription, LyricsTranscription)
+        assert transcription.text == "This is a test lyric"
+        assert [lyric.text for lyric in transcription.segments] == ["This is", "a test lyric"]
+        mock_whisper_model.transcribe.assert_called_once()
+
+    def test_resample_failure_returns_none(self, sample_audio_data, mock_whisper_model):
+        audio, sr = sample_audio_data
+        extractor = LyricsExtractor()
+        extractor._model = mock_whisper_model
+
+        with patch('librosa.resample', side_effect=RuntimeError("resample failed")):
+            assert extractor.transcribe(audio, sr) is None
+
+        mock_whisper_model.transcribe.assert_not_called()
+
+    def test_get_lyrics_for_segment(self):
+        extractor = LyricsExtractor()
+        lyrics = [
+            TimestampedLyric(0.0, 2.0, "one"),
+            TimestampedLyric(2.0, 4.0, "two"),
+            TimestampedLyric(4.0, 6.0, "three")
+        ]
+
+        assert extractor.get_lyrics_for_segment(lyrics, 1.0, 3.0) == "one two"
+        assert extractor.get_lyrics_for_segment(lyrics, 10.0, 12.0) == ""
+
+    def test_get_lyrics_for_segment_indexes_once(self):
+        extractor = LyricsExtractor()
+        lyrics = [TimestampedLyric(0.0, 2.0, "one"), TimestampedLyric(2.0, 4.0, "two")]
+
+        index = extractor._lyrics_index(lyrics)
+        assert extractor.get_lyrics_for_segment(lyrics, 0.0, 1.0) == "one"
+        assert extractor._lyrics_index(lyrics) is index
+
+        lyrics.append(TimestampedLyric(4.0, 6.0, "three"))
+        assert extractor.get_lyrics_for_segment(lyrics, 4.5, 5.0) == "three"
+
+    def test_get_lyrics_for_segment_accepts_prebuilt_index(self):
+        extractor = LyricsExtractor()
+        index = LyricsIndex([TimestampedLyric(0.0, 2.0, "one")])
+
+        assert extractor._lyrics_index(index) is index
+        assert extractor.get_lyrics_for_segment(index, 0.0, 1.0) == "one"
+
+
+class TestLyricsIndex:
+    def test_query_matches_linear_scan(self):
+        rng = np.random.default_rng(0)
+        lyrics = []
+        for _ in range(200):
+            start = float(rng.uniform(0, 300))
+            lyrics.append(TimestampedLyric(start, start + float(rng.uniform(0, 8)), f"{start:.2f}"))
+
+        index = LyricsIndex(lyrics)
+
+        for _ in range(100):
+            start = float(rng.uniform(0, 300))
+            end = start + float(rng.uniform(0, 10))
+            expected = {
+                lyric.text for lyric in lyrics
+                if (lyric.start_time >= start and lyric.end_time <= end)
+                or (lyric.start_time < end and lyric.end_time > start)
+            }
+            assert {lyric.text for lyric in index.query(start, end)} == expected
+
+    def test_query_orders_by_start_time(self):
+        index = LyricsIndex([
+            TimestampedLyric(3.0, 4.0, "b"),
+            TimestampedLyric(1.0, 2.0, "a")
+        ])
+
+        assert index.text_between(0.0, 5.0) == "a b"
+
+    def test_touching_boundaries_excluded(self):
+        index = LyricsIndex([TimestampedLyric(0.0, 5.0, "a")])
+
+        assert index.query(5.0, 10.0) == []
+
+    def test_empty_index(self):
+        index = LyricsIndex([])
+
+        assert len(index) == 0
+        assert index.query(0.0, 5.0) == []
@@ -0,0 +1,167 @@
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.ovi_generator import OviVideoGenerator, MockOviVideoGenerator, GenerationConfig
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+class TestBatchSize:
+    def test_disabled_without_budget(self):
+        assert OviVideoGenerator(config=GenerationConfig()).batch_size() == 1
+
+    def test_sized_to_memory_budget(self):
+        config = GenerationConfig(batch_memory_gb=20.0, clip_memory_gb=6.0)
+
+        assert OviVideoGenerator(config=config).batch_size() == 3
+
+    def test_scales_with_resolution(self):
+        config = GenerationConfig(
+            batch_memory_gb=20.0, clip_memory_gb=6.0, video_height=360, video_width=360
+        )
+
+        assert OviVideoGenerator(config=config).batch_size() == 8
+
+    def test_mock_generator_never_batches(self):
+        config = GenerationConfig(batch_memory_gb=100.0)
+
+        assert MockOviVideoGenerator(config=config).batch_size() == 1
+
+
+class TestGenerateBatch:
+    def test_groups_prompts_into_engine_batches(self, tmp_path, make_ovi_generator, fake_ovi_engine, make_prompts):
+        engine = fake_ovi_engine()
+        generator = make_ovi_generator(engine, batch_memory_gb=12.0, clip_memory_gb=6.0)
+
+        clips = generator.generate_clips(make_prompts(5), str(tmp_path))
+
+        assert [len(call) for call in engine.calls] == [2, 2, 1]
+        assert [clip.segment_index for clip in clips] == [0, 1, 2, 3, 4]
+
+    def test_matches_sequential_outputs_and_seeds(self, tmp_path, make_ovi_generator, fake_ovi_engine, make_prompts):
+        sequential = make_ovi_generator(fake_ovi_engine())
+        batched = make_ovi_generator(fake_ovi_engine(), batch_memory_gb=100.0)
+
+        expected = sequential.generate_clips(make_prompts(4), str(tmp_path / "seq"), seed=7)
+        clips = batched.generate_clips(make_prompts(4), str(tmp_path / "batch"), seed=7)
+
+        assert len(batched._engine.engine.calls) == 1
+        for seq_clip, batch_clip in zip(expected, clips):
+            assert Path(batch_clip.video_path).read_text() == Path(seq_clip.video_path).read_text()
+            assert Path(batch_clip.video_path).name == Path(seq_clip.video_path).name
+            assert batch_clip.prompt_used == seq_clip.prompt_used
+
+        assert [r["seed"] for r in batched._engine.engine.calls[0]] == [7, 8, 9, 10]
+
+    def test_per_prompt_seeds_batched_together(self, tmp_path, make_ovi_generator, fake_ovi_engine, make_prompts):
+        from dataclasses import replace
+
+        generator = make_ovi_generator(fake_ovi_engine(), batch_memory_gb=100.0)
+        prompts = [replace(prompt, seed=seed) for prompt, seed in zip(make_prompts(3), [100, 10108, 102])]
+
+        generator.generate_clips(prompts, str(tmp_path), seed=100)
+
+        assert [[r["seed"] for r in call] for call in generator._engine.engine.calls] == [[100, 10108, 102]]
+
+    def test_incompatible_requests_not_batched_together(self, tmp_path, make_ovi_generator, fake_ovi_engine, make_prompts):
+        engine = fake_ovi_engine()
+        generator = make_ovi_generator(engine, batch_memory_gb=100.0)
+        original = generator._render_request
+
+        def steps_by_parity(text_prompt, negative_prompt, seed, output_path):
+            request = original(text_prompt, negative_prompt, seed, output_path)
+            request["sample_steps"] = 20 if seed % 2 else 50
+            return request
+
+        generator._render_request = steps_by_parity
+
+        clips = generator.generate_clips(make_prompts(4), str(tmp_path))
+
+        assert sorted(len(call) for call in engine.calls) == [2, 2]
+        for call in engine.calls:
+            assert len({r["sample_steps"] for r in call}) == 1
+        assert [clip.segment_index for clip in clips] == [0, 1, 2, 3]
+
+    def test_batches_sent_to_engine_worker(self, tmp_path, make_prompts):
+        engine_worker = Mock()
+        engine_worker.generate_batch.side_effect = lambda requests: [r["output_path"] for r in requests]
+        generator = OviVideoGenerator(
+            config=GenerationConfig(batch_memory_gb=100.0),
+            engine_worker=engine_worker
+        )
+
+        clips = generator.generate_clips(make_prompts(3), str(tmp_path))
+
+        engine_worker.generate_batch.assert_called_once()
+        requests = engine_worker.generate_batch.call_args[0][0]
+        assert [r["output_path"] for r in requests] == [clip.video_path for clip in clips]
+
+
+class TestMockOviVideoGenerator:
+    def _reference_frame(self, generator, segment_index, index, num_frames):
+        import cv2
+        import numpy as np
+
+        frame = np.zeros((generator.config.video_height, generator.config.video_width, 3), dtype=np.uint8)
+        frame[:, :] = [int((index / num_frames) * 180), 200, 200]
+        frame = cv2.cvtColor(frame, cv2.COLOR_HSV2BGR)
+        cv2.putText(frame, f"Segment {segment_index}", (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        return frame
+
+    def test_vectorized_frames_match_per_frame_rendering(self, make_prompts):
+        import numpy as np
+
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_height=128, video_width=256))
+        prompt = make_prompts(4)[3]
+
+        frames = generator._mock_frames(prompt, 10, 40, 48)
+
+        assert frames.shape == (30, 128, 256, 3)
+        for offset in (0, 15, 29):
+            expected = self._reference_frame(generator, 3, 10 + offset, 48)
+            assert np.abs(frames[offset].astype(int) - expected.astype(int)).max() <= 1
+
+    def test_clip_encoded_through_single_pipe(self, tmp_path):
+        import cv2
+
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_height=64, video_width=96))
+        prompt = VideoPrompt(0, 0.0, 2.5, "scene", "music", "")
+
+        clip = generator.generate_clips([prompt], str(tmp_path))[0]
+
+        capture = cv2.VideoCapture(clip.video_path)
+        assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == 60
+        assert int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)) == 96
+        assert int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) == 64
+        capture.release()
+
+    def test_encoded_chunks_keep_bgr_colors(self, tmp_path):
+        import cv2
+        import numpy as np
+
+        generator = MockOviVideoGenerator(config=GenerationConfig(video_height=32, video_width=32))
+        chunk = np.zeros((4, 32, 32, 3), dtype=np.uint8)
+        chunk[..., 0] = 200
+        output = str(tmp_path / "blue.mp4")
+
+        generator._encode_frames(output, [chunk, chunk], fps=24)
+
+        capture = cv2.VideoCapture(output)
+        assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == 8
+        ok, frame = capture.read()
+        capture.release()
+        assert ok
+        assert np.abs(frame.mean(axis=(0, 1)) - [200, 0, 0]).max() < 12
+
+    def test_artificial_latency_per_clip(self, tmp_path):
+        import time
+
+        generator = MockOviVideoGenerator(
+            config=GenerationConfig(video_height=32, video_width=32, mock_latency=0.2)
+        )
+        prompts = [VideoPrompt(i, i * 0.1, (i + 1) * 0.1, "scene", "music", "") for i in range(3)]
+
+        started = time.monotonic()
+        generator.generate_clips(prompts, str(tmp_path))
+
+        assert time.monotonic() - started >= 0.6
@@ -1,3 +1,4 @@
+import threading
 import pytest
 import numpy as np
 from pathlib import Path
@@ -11,6 +12,8 @@ from src.pipeline import (
 )
 from src.audio_analysis.analyzer import AudioAnalysisResult, AudioSegment
 from src.prompt_generation.prompt_generator import VideoPrompt
+from src.video_generation.ovi_generator import GeneratedClip
+from src.job_manifest import JobManifest
 
 
 class TestPipelineStatus:
@@ -277,7 +280,7 @@ class TestMusicVideoPipeline:
     @patch('src.pipeline.validate_audio_file')
     @patch('src.pipeline.ensure_directory')
     @patch('shutil.rmtree')
-    def test_generate_cleans_up_temp_files(self, mock_rmtree, mock_ensure_dir, mock_validate, tmp_path):
+    def test_generate_keeps_job_artifacts(self, mock_rmtree, mock_ensure_dir, mock_validate, tmp_path):
         mock_validate.return_value = (True, None)
         temp_job_dir = str(tmp_path / "job_temp")
         mock_ensure_dir.return_value = temp_job_dir
@@ -317,11 +320,14 @@ class TestMusicVideoPipeline:
                         mock_composer = Mock()
                         mock_composer_cls.return_value = mock_composer
 
-                        with patch('os.path.exists', return_value=True):
-                            pipeline = MusicVideoPipeline(use_mock_generator=True)
-                            pipeline.generate("/test/audio.mp3")
+                        pipeline = MusicVideoPipeline(use_mock_generator=True)
+                        result = pipeline.generate("/test/audio.mp3")
 
-                            mock_rmtree.assert_called()
+                        mock_rmtree.assert_not_called()
+                        manifest = JobManifest.load(temp_job_dir)
+                        assert manifest.job_id == result.job_id
+                        assert manifest.status == "completed"
+                        assert manifest.get_prompts() == [prompt]
 
     @patch('src.pipeline.validate_audio_file')
     def test_analyze_only(self, mock_validate):
@@ -400,6 +406,49 @@ class TestMusicVideoPipeline:
                         assert result[0]["prompt_text"] == "happy scene"
                         assert result[0]["audio_description"] == "energetic music"
 
+    @patch('src.pipeline.validate_audio_file')
+    def test_preview_skips_lyrics_by_default(self, mock_validate):
+        mock_validate.return_value = (True, None)
+
+        with patch('src.pipeline.AudioAnalyzer') as mock_analyzer_cls:
+            mock_analyzer = Mock()
+            mock_analyzer_cls.return_value = mock_analyzer
+
+            with patch('src.pipeline.PromptGenerator') as mock_prompt_cls:
+                mock_prompt_cls.return_value.generate_prompts.return_value = []
+
+                with patch('src.pipeline.MockOviVideoGenerator'):
+                    with patch('src.pipeline.VideoComposer'):
+                        pipeline = MusicVideoPipeline(use_mock_generator=True)
+
+                        pipeline.preview_prompts("/test/audio.mp3")
+                        mock_analyzer.analyze.assert_called_with("/test/audio.mp3", extract_lyrics=False)
+
+                        pipeline.preview_prompts("/test/audio.mp3", extract_lyrics=True)
+                        mock_analyzer.analyze.assert_called_with("/test/audio.mp3", extract_lyrics=True)
+
+    def test_refine_with_lyrics_reuses_analysis(self):
+        analysis = Mock()
+        transcription = Mock()
+
+        with patch('src.pipeline.AudioAnalyzer') as mock_analyzer_cls:
+            mock_analyzer = Mock()
+            mock_analyzer.transcribe_lyrics.return_value = transcription
+            mock_analyzer.apply_lyrics.return_value = analysis
+            mock_analyzer_cls.return_value = mock_analyzer
+
+            with patch('src.pipeline.PromptGenerator'):
+                with patch('src.pipeline.MockOviVideoGenerator'):
+                    with patch('src.pipeline.VideoComposer'):
+                        pipeline = MusicVideoPipeline(use_mock_generator=True)
+
+                        refined = pipeline.refine_with_lyrics("/test/audio.mp3", analysis)
+
+                        assert refined is analysis
+                        mock_analyzer.analyze.assert_not_called()
+                        mock_analyzer.transcribe_lyrics.assert_called_once_with("/test/audio.mp3")
+                        mock_analyzer.apply_lyrics.assert_called_once_with(analysis, transcription)
+
     def test_status_property(self):
         with patch('src.pipeline.AudioAnalyzer'):
             with patch('src.pipeline.PromptGenerator'):
@@ -416,9 +465,9 @@ class TestMusicVideoPipeline:
     @patch('src.pipeline.validate_audio_file')
     @patch('src.pipeline.ensure_directory')
     @patch('shutil.rmtree')
-    def test_generate_handles_exception(self, mock_rmtree, mock_ensure_dir, mock_validate):
+    def test_generate_handles_exception(self, mock_rmtree, mock_ensure_dir, mock_validate, tmp_path):
         mock_validate.return_value = (True, None)
-        mock_ensure_dir.return_value = "/tmp/job"
+        mock_ensure_dir.return_value = str(tmp_path)
 
         with patch('src.pipeline.AudioAnalyzer') as mock_analyzer_cls:
             mock_analyzer = Mock()
@@ -435,7 +484,8 @@ class TestMusicVideoPipeline:
                                 pipeline.generate("/test/audio.mp3")
 
                             assert pipeline.status == PipelineStatus.ERROR
-                            mock_rmtree.assert_called()
+                            mock_rmtree.assert_not_called()
+                            assert JobManifest.load(str(tmp_path)).status == "failed"
 
     @patch('src.pipeline.OviVideoGenerator')
     def test_initialization_with_real_generator(self, mock_ovi_gen):
@@ -446,3 +496,510 @@ class TestMusicVideoPipeline:
 
                     mock_ovi_gen.assert_called_once()
                     assert not pipeline.use_mock_generator
+
+
+class TestPipelineResume:
+    def _config(self, tmp_path):
+        from src.utils.config import Config
+        return Config(
+            output_dir=str(tmp_path / "output"),
+            temp_dir=str(tmp_path / "temp"),
+            jobs_dir=str(tmp_path / "jobs")
+        )
+
+    def _analysis(self):
+        return AudioAnalysisResult(
+            duration=15.0,
+            overall_tempo=120.0,
+            overall_mood="happy",
+            genre_prediction="pop",
+            segments=[AudioSegment(i * 5.0, (i + 1) * 5.0, 120.0, 0.6, "happy", 2000.0) for i in range(3)],
+            beat_times=np.array([0.5]),
+            energy_profile=np.array([0.6]),
+            spectral_centroid=np.array([2000.0]),
+            lyrics=None
+        )
+
+    @patch('src.pipeline.validate_audio_file', return_value=(True, None))
+    def test_resume_skips_completed_segments(self, mock_validate, tmp_path):
+        prompts = [VideoPrompt(i, i * 5.0, (i + 1) * 5.0, f"scene {i}", "desc", "neg") for i in range(3)]
+        fail_on = {2}
+
+        with patch('src.pipeline.AudioAnalyzer') as mock_analyzer_cls, \
+                patch('src.pipeline.PromptGenerator') as mock_prompt_cls, \
+                patch('src.pipeline.MockOviVideoGenerator') as mock_video_cls, \
+                patch('src.pipeline.VideoComposer') as mock_composer_cls:
+            mock_analyzer_cls.return_value.analyze.return_value = self._analysis()
+            mock_prompt_cls.return_value.generate_prompts.return_value = prompts
+            mock_video_gen = mock_video_cls.return_value
+            mock_composer = mock_composer_cls.return_value
+
+            def generate_clips(pending, output_dir, seed):
+                clips = []
+                for prompt in pending:
+                    if prompt.segment_index in fail_on:
+                        raise RuntimeError("GPU out of memory")
+                    path = Path(output_dir) / f"clip_{prompt.segment_index:04d}.mp4"
+                    path.write_bytes(b"clip")
+                    clip = GeneratedClip(prompt.segment_index, prompt.start_time, prompt.end_time, str(path), prompt.prompt_text)
+                    mock_video_gen.clip_callback(clip)
+                    clips.append(clip)
+                return clips
+
+            mock_video_gen.generate_clips.side_effect = generate_clips
+
+            pipeline = MusicVideoPipeline(config=self._config(tmp_path), use_mock_generator=True)
+
+            with pytest.raises(RuntimeError, match="out of memory"):
+                pipeline.generate("/test/audio.mp3", job_id="job1")
+
+            manifest = JobManifest.load(str(tmp_path / "jobs" / "job1"))
+            assert manifest.status == "failed"
+            assert sorted(manifest.clips) == [0, 1]
+            assert manifest.clips[1].seed == manifest.seed + 1
+            assert pipeline.resumable_jobs() == ["job1"]
+
+            fail_on.clear()
+            result = pipeline.resume("job1")
+
+            mock_analyzer_cls.return_value.analyze.assert_called_once()
+            resumed_prompts = mock_video_gen.generate_clips.call_args[0][0]
+            assert [p.segment_index for p in resumed_prompts] == [2]
+            composed = mock_composer.compose_music_video.call_args[1]["clips"]
+            assert [clip.segment_index for clip in composed] == [0, 1, 2]
+            assert result.analysis_summary["clips_resumed"] == 2
+            assert JobManifest.load(str(tmp_path / "jobs" / "job1")).status == "completed"
+            assert pipeline.resumable_jobs() == []
+
+    def test_cleanup_job_removes_artifacts(self, tmp_path):
+        with patch('src.pipeline.AudioAnalyzer'), patch('src.pipeline.PromptGenerator'), \
+                patch('src.pipeline.MockOviVideoGenerator'), patch('src.pipeline.VideoComposer'):
+            pipeline = MusicVideoPipeline(config=self._config(tmp_path), use_mock_generator=True)
+            JobManifest(str(tmp_path / "jobs" / "1a2b3c4d"), "1a2b3c4d", "/test/audio.mp3").save()
+
+            assert pipeline.cleanup_job("1a2b3c4d") is True
+            assert not (tmp_path / "jobs" / "1a2b3c4d").exists()
+            assert pipeline.cleanup_job("1a2b3c4d") is False
+            assert pipeline.cleanup_job("..") is False
+            assert tmp_path.exists()
+
+    def test_resume_unknown_job_raises(self, tmp_path):
+        with patch('src.pipeline.AudioAnalyzer'), patch('src.pipeline.PromptGenerator'), \
+                patch('src.pipeline.MockOviVideoGenerator'), patch('src.pipeline.VideoComposer'):
+            pipeline = MusicVideoPipeline(config=self._config(tmp_path), use_mock_generator=True)
+
+            with pytest.raises(FileNotFoundError):
+                pipeline.resume("missing")
+
+
+class TestPipelineDraftMode:
+    def _run(self, tmp_path):
+        from src.utils.config import Config
+
+        config = Config(
+            output_dir=str(tmp_path / "output"),
+            temp_dir=str(tmp_path / "temp"),
+            jobs_dir=str(tmp_path / "jobs"),
+            sample_steps=50,
+            draft_sample_steps=8,
+            draft_scale=0.5
+        )
+        prompts = [VideoPrompt(i, i * 5.0, (i + 1) * 5.0, f"scene {i}", "desc", "neg") for i in range(3)]
+        analysis = AudioAnalysisResult(
+            duration=15.0, overall_tempo=120.0, overall_mood="happy", genre_prediction="pop",
+            segments=[], beat_times=np.array([0.5]), energy_profile=np.array([0.6]),
+            spectral_centroid=np.array([2000.0]), lyrics=None
+        )
+        renders = []
+
+        patches = [
+            patch('src.pipeline.validate_audio_file', return_value=(True, None)),
+            patch('src.pipeline.AudioAnalyzer'),
+            patch('src.pipeline.PromptGenerator'),
+            patch('src.pipeline.MockOviVideoGenerator'),
+            patch('src.pipeline.VideoComposer')
+        ]
+        mocks = [p.start() for p in patches]
+        _, analyzer_cls, prompt_cls, video_cls, _ = mocks
+        analyzer_cls.return_value.analyze.return_value = analysis
+        prompt_cls.return_value.generate_prompts.return_value = prompts
+
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+        generator = pipeline.video_generator
+        generator.config = pipeline.generation_config
+
+        def generate_clips(pending, output_dir, seed):
+            clips = []
+            for prompt in pending:
+                renders.append({
+                    "segment": prompt.segment_index,
+                    "seed": prompt.seed,
+                    "steps": generator.config.sample_steps,
+                    "size": (generator.config.video_height, generator.config.video_width)
+                })
+                path = Path(output_dir) / f"clip_{prompt.segment_index:04d}.mp4"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"clip")
+                clip = GeneratedClip(prompt.segment_index, prompt.start_time, prompt.end_time, str(path), prompt.prompt_text)
+                generator.clip_callback(clip)
+                clips.append(clip)
+            return clips
+
+        generator.generate_clips.side_effect = generate_clips
+        return pipeline, renders, patches
+
+    def test_draft_then_refine_reuses_seeds(self, tmp_path):
+        pipeline, renders, patches = self._run(tmp_path)
+        try:
+            draft = pipeline.generate("/test/song.mp3", job_id="job1", draft=True)
+
+            assert draft.is_draft
+            assert "_draft_job1" in draft.output_path
+            assert {r["steps"] for r in renders} == {8}
+            assert {r["size"] for r in renders} == {(352, 352)}
+            assert pipeline.generation_config.sample_steps == 50
+            draft_seeds = {r["segment"]: r["seed"] for r in renders}
+
+            renders.clear()
+            final = pipeline.refine("job1")
+
+            assert not final.is_draft
+            assert {r["steps"] for r in renders} == {50}
+            assert {r["size"] for r in renders} == {(720, 720)}
+            assert {r["segment"]: r["seed"] for r in renders} == draft_seeds
+            assert JobManifest.load(str(tmp_path / "jobs" / "job1")).status == "completed"
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_rejected_segments_redrafted_with_new_seed(self, tmp_path):
+        pipeline, renders, patches = self._run(tmp_path)
+        try:
+            pipeline.generate("/test/song.mp3", job_id="job1", draft=True)
+            draft_seeds = {r["segment"]: r["seed"] for r in renders}
+
+            renders.clear()
+            result = pipeline.refine("job1", rejected_segments=[1])
+
+            assert result.is_draft
+            assert [r["segment"] for r in renders] == [1]
+            assert renders[0]["steps"] == 8
+            assert renders[0]["seed"] != draft_seeds[1]
+
+            renders.clear()
+            pipeline.refine("job1")
+
+            final_seeds = {r["segment"]: r["seed"] for r in renders}
+            assert final_seeds[0] == draft_seeds[0]
+            assert final_seeds[1] != draft_seeds[1]
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_refine_generates_mixed_seeds_in_one_ordered_call(self, tmp_path):
+        pipeline, renders, patches = self._run(tmp_path)
+        try:
+            pipeline.generate("/test/song.mp3", job_id="job1", draft=True)
+            pipeline.refine("job1", rejected_segments=[0, 2])
+            draft_seeds = {r["segment"]: r["seed"] for r in renders[-2:]}
+
+            renders.clear()
+            pipeline.video_generator.generate_clips.reset_mock()
+            pipeline.refine("job1")
+
+            pipeline.video_generator.generate_clips.assert_called_once()
+            assert [r["segment"] for r in renders] == [0, 1, 2]
+            assert renders[0]["seed"] == draft_seeds[0]
+            assert renders[2]["seed"] == draft_seeds[2]
+            assert renders[1]["seed"] == pipeline.generation_config.seed + 1
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_refine_requires_draft(self, tmp_path):
+        pipeline, renders, patches = self._run(tmp_path)
+        try:
+            pipeline.generate("/test/song.mp3", job_id="job1")
+
+            with pytest.raises(ValueError, match="no draft"):
+                pipeline.refine("job1")
+        finally:
+            for p in patches:
+                p.stop()
+
+
+class TestPipelineStepPlan:
+    def _pipeline(self, tmp_path, **config):
+        from src.utils.config import Config
+
+        config = Config(
+            output_dir=str(tmp_path / "output"),
+            temp_dir=str(tmp_path / "temp"),
+            jobs_dir=str(tmp_path / "jobs"),
+            sample_steps=50,
+            min_sample_steps=10,
+            **config
+        )
+        segments = [
+            AudioSegment(i * 5.0, (i + 1) * 5.0, 120.0, energy, "happy", 440.0)
+            for i, energy in enumerate([0.1, 0.9, 0.5])
+        ]
+        analysis = AudioAnalysisResult(
+            duration=15.0, overall_tempo=120.0, overall_mood="happy", genre_prediction="pop",
+            segments=segments, beat_times=np.array([0.5]), energy_profile=np.array([0.6]),
+            spectral_centroid=np.array([2000.0]), lyrics=None
+        )
+        prompts = [VideoPrompt(i, i * 5.0, (i + 1) * 5.0, f"scene {i}", "desc", "neg") for i in range(3)]
+        steps = {}
+
+        patches = [
+            patch('src.pipeline.validate_audio_file', return_value=(True, None)),
+            patch('src.pipeline.AudioAnalyzer'),
+            patch('src.pipeline.PromptGenerator'),
+            patch('src.pipeline.MockOviVideoGenerator'),
+            patch('src.pipeline.VideoComposer')
+        ]
+        _, analyzer_cls, prompt_cls, _, _ = [p.start() for p in patches]
+        analyzer_cls.return_value.analyze.return_value = analysis
+        prompt_cls.return_value.generate_prompts.return_value = prompts
+
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+        pipeline.video_generator.timing_key.return_value = ("pipeline-test",)
+
+        def generate_clips(pending, output_dir, seed):
+            clips = []
+            for prompt in pending:
+                steps[prompt.segment_index] = prompt.sample_steps
+                path = Path(output_dir) / f"clip_{prompt.segment_index:04d}.mp4"
+                path.write_bytes(b"clip")
+                clips.append(GeneratedClip(prompt.segment_index, prompt.start_time, prompt.end_time, str(path), "p"))
+            return clips
+
+        pipeline.video_generator.generate_clips.side_effect = generate_clips
+        return pipeline, steps, patches
+
+    def test_fixed_steps_by_default(self, tmp_path):
+        pipeline, steps, patches = self._pipeline(tmp_path)
+        try:
+            result = pipeline.generate("/test/song.mp3", job_id="job1")
+
+            assert steps == {0: None, 1: None, 2: None}
+            assert result.step_plan is None
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_adaptive_steps_follow_energy(self, tmp_path):
+        pipeline, steps, patches = self._pipeline(tmp_path, adaptive_steps=True)
+        try:
+            result = pipeline.generate("/test/song.mp3", job_id="job1", segment_priorities={0: 3.0})
+
+            assert steps[1] > steps[2]
+            assert steps[0] > 10
+            assert result.step_plan["mode"] == "adaptive"
+            assert result.step_plan["measured_seconds"] is not None
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_deadline_plan_reported(self, tmp_path):
+        pipeline, steps, patches = self._pipeline(tmp_path, seconds_per_step=2.0)
+        try:
+            result = pipeline.generate("/test/song.mp3", job_id="job1", deadline_seconds=200.0)
+
+            assert sum(steps.values()) <= 100
+            assert result.step_plan["mode"] == "deadline"
+            assert result.step_plan["seconds_per_step"] == 2.0
+            assert result.step_plan["estimated_seconds"] <= 200.0
+            assert JobManifest.load(str(tmp_path / "jobs" / "job1")).step_plan["total_steps"] == sum(steps.values())
+        finally:
+            for p in patches:
+                p.stop()
+
+
+class TestPipelineStreaming:
+    def _pipeline(self, tmp_path, **config):
+        from src.utils.config import Config
+
+        config = Config(
+            output_dir=str(tmp_path / "output"),
+            temp_dir=str(tmp_path / "temp"),
+            jobs_dir=str(tmp_path / "jobs"),
+            streaming_pipeline=True,
+            **config
+        )
+        analysis = AudioAnalysisResult(
+            duration=15.0, overall_tempo=120.0, overall_mood="happy", genre_prediction="pop",
+            segments=[], beat_times=np.array([0.5]), energy_profile=np.array([0.6]),
+            spectral_centroid=np.array([2000.0]), lyrics=None, content_hash="abc"
+        )
+        events = []
+        clip_started = threading.Event()
+
+        def analyze_stream(audio_path, extract_lyrics=True):
+            for i in range(3):
+                if i > 0:
+                    events.append(("overlapped", clip_started.wait(timeout=5)))
+                analysis.segments.append(AudioSegment(i * 5.0, (i + 1) * 5.0, 120.0, 0.5, "happy", 440.0))
+                events.append(("analyzed", i))
+                yield analysis, i
+
+        def prompt_for_segment(analysis, segment_index, style_override=None, custom_theme=None):
+            start = analysis.segments[segment_index].start_time
+            return VideoPrompt(segment_index, start, start + 5.0, f"scene {segment_index}", "desc", "neg")
+
+        patches = [
+            patch('src.pipeline.validate_audio_file', return_value=(True, None)),
+            patch('src.pipeline.AudioAnalyzer'),
+            patch('src.pipeline.PromptGenerator'),
+            patch('src.pipeline.MockOviVideoGenerator'),
+            patch('src.pipeline.VideoComposer')
+        ]
+        _, analyzer_cls, prompt_cls, _, _ = [p.start() for p in patches]
+        analyzer_cls.return_value.analyze_stream.side_effect = analyze_stream
+        analyzer_cls.return_value.analyze.return_value = analysis
+        prompt_cls.return_value.prompt_for_segment.side_effect = prompt_for_segment
+
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+
+        def generate_clips(pending, output_dir, seed):
+            clips = []
+            for prompt in pending:
+                events.append(("generated", prompt.segment_index))
+                clip_started.set()
+                path = Path(output_dir) / f"clip_{prompt.segment_index:04d}.mp4"
+                path.write_bytes(b"clip")
+                clip = GeneratedClip(prompt.segment_index, prompt.start_time, prompt.end_time, str(path), "p")
+                pipeline.video_generator.clip_callback(clip)
+                clips.append(clip)
+            return clips
+
+        pipeline.video_generator.generate_clips.side_effect = generate_clips
+        return pipeline, events, patches
+
+    def test_generation_starts_before_analysis_finishes(self, tmp_path):
+        pipeline, events, patches = self._pipeline(tmp_path)
+        try:
+            result = pipeline.generate("/test/song.mp3", job_id="job1")
+
+            assert events.index(("generated", 0)) < events.index(("analyzed", 2))
+            assert ("overlapped", False) not in events
+            assert sorted(idx for kind, idx in events if kind == "generated") == [0, 1, 2]
+            assert result.segments_generated == 3
+            assert result.analysis_summary["segments"] == 3
+            pipeline.audio_analyzer.analyze.assert_not_called()
+
+            manifest = JobManifest.load(str(tmp_path / "jobs" / "job1"))
+            assert [prompt["segment_index"] for prompt in manifest.prompts] == [0, 1, 2]
+            assert sorted(manifest.clips) == [0, 1, 2]
+            assert len(manifest.segment_profiles) == 3
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_adaptive_steps_disables_streaming(self, tmp_path):
+        pipeline, events, patches = self._pipeline(tmp_path, adaptive_steps=True)
+        pipeline.video_generator.timing_key.return_value = ("streaming-test",)
+        pipeline.prompt_generator.generate_prompts.return_value = [
+            VideoPrompt(0, 0.0, 5.0, "scene 0", "desc", "neg")
+        ]
+        try:
+            pipeline.generate("/test/song.mp3", job_id="job1")
+
+            pipeline.audio_analyzer.analyze.assert_called_once()
+            pipeline.audio_analyzer.analyze_stream.assert_not_called()
+        finally:
+            for p in patches:
+                p.stop()
+
+
+class TestPipelineResolution:
+    def _config(self, tmp_path, **config):
+        from src.utils.config import Config
+
+        return Config(
+            output_dir=str(tmp_path / "output"),
+            temp_dir=str(tmp_path / "temp"),
+            jobs_dir=str(tmp_path / "jobs"),
+            **config
+        )
+
+    @patch('src.pipeline.VideoComposer')
+    @patch('src.pipeline.MockOviVideoGenerator')
+    @patch('src.pipeline.PromptGenerator')
+    @patch('src.pipeline.AudioAnalyzer')
+    def test_native_resolution_by_default(self, mock_analyzer, mock_prompt, mock_gen, mock_composer, tmp_path):
+        pipeline = MusicVideoPipeline(config=self._config(tmp_path), use_mock_generator=True)
+
+        assert (pipeline.generation_config.video_width, pipeline.generation_config.video_height) == (720, 720)
+        assert pipeline.composition_config.upscale_method == "none"
+        assert pipeline._resolution_report(10.0) is None
+
+    @patch('src.pipeline.VideoComposer')
+    @patch('src.pipeline.MockOviVideoGenerator')
+    @patch('src.pipeline.PromptGenerator')
+    @patch('src.pipeline.AudioAnalyzer')
+    def test_scaled_generation_upscaled_to_output(self, mock_analyzer, mock_prompt, mock_gen, mock_composer, tmp_path):
+        config = self._config(tmp_path, generation_scale=0.667, output_resolution="1920x1080")
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+        pipeline.video_generator.timing_key.return_value = ("resolution-test",)
+
+        assert (pipeline.generation_config.video_width, pipeline.generation_config.video_height) == (480, 480)
+        assert pipeline.composition_config.output_resolution == (1920, 1080)
+        assert pipeline.composition_config.upscale_method == "lanczos"
+
+        report = pipeline._resolution_report(40.0)
+        assert report["generated_resolution"] == "480x480"
+        assert report["native_resolution"] == "720x720"
+        assert report["output_resolution"] == "1920x1080"
+        assert report["estimate_basis"] == "pixel_ratio"
+        assert report["native_seconds_estimate"] == pytest.approx(90.0)
+        assert report["seconds_saved"] == pytest.approx(50.0)
+
+    @patch('src.pipeline.VideoComposer')
+    @patch('src.pipeline.MockOviVideoGenerator')
+    @patch('src.pipeline.PromptGenerator')
+    @patch('src.pipeline.AudioAnalyzer')
+    def test_scaled_generation_upscaled_to_native_by_default(self, mock_analyzer, mock_prompt, mock_gen, mock_composer, tmp_path):
+        config = self._config(tmp_path, generation_scale=0.667)
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+        pipeline.video_generator.timing_key.return_value = ("resolution-test",)
+
+        assert (pipeline.generation_config.video_width, pipeline.generation_config.video_height) == (480, 480)
+        assert pipeline.composition_config.output_resolution == (720, 720)
+        assert pipeline.composition_config.upscale_method == "lanczos"
+        assert mock_composer.call_args[1]["config"] is pipeline.composition_config
+
+        report = pipeline._resolution_report(40.0)
+        assert report["generated_resolution"] == "480x480"
+        assert report["output_resolution"] == "720x720"
+        assert report["upscale_method"] == "lanczos"
+
+    @patch('src.pipeline.validate_audio_file', return_value=(True, None))
+    @patch('src.pipeline.VideoComposer')
+    @patch('src.pipeline.MockOviVideoGenerator')
+    @patch('src.pipeline.PromptGenerator')
+    @patch('src.pipeline.AudioAnalyzer')
+    def test_report_uses_measured_step_timings(self, mock_analyzer, mock_prompt, mock_gen, mock_composer, mock_validate, tmp_path):
+        from src.video_generation.step_planner import record_step_timing
+
+        config = self._config(tmp_path, generation_scale=0.5, model_name="resolution_test_5s")
+        pipeline = MusicVideoPipeline(config=config, use_mock_generator=True)
+        low_key = ("resolution_test_5s", 352, 352, True, 24)
+        pipeline.video_generator.timing_key.return_value = low_key
+        record_step_timing(low_key, 10.0, 10)
+        record_step_timing(("resolution_test_5s", 720, 720, True, 24), 30.0, 10)
+
+        mock_analyzer.return_value.analyze.return_value = AudioAnalysisResult(
+            duration=5.0, overall_tempo=120.0, overall_mood="happy", genre_prediction="pop",
+            segments=[AudioSegment(0.0, 5.0, 120.0, 0.5, "happy", 440.0)], beat_times=np.array([0.5]),
+            energy_profile=np.array([0.6]), spectral_centroid=np.array([2000.0]), lyrics=None
+        )
+        mock_prompt.return_value.generate_prompts.return_value = [VideoPrompt(0, 0.0, 5.0, "scene", "desc", "neg")]
+        pipeline.video_generator.generate_clips.return_value = []
+
+        result = pipeline.generate("/test/song.mp3", job_id="job1")
+
+        assert result.resolution_report["estimate_basis"] == "measured"
+        assert result.resolution_report["speedup"] == pytest.approx(3.0)
+        assert result.resolution_report["output_resolution"] == "720x720"
@@ -381,11 +381,10 @@ class TestPromptGenerator:
 
         assert "mysterious atmosphere" in prompt.prompt_text
 
-    @patch('random.choice')
-    def test_random_selection_calls(self, mock_choice):
-        mock_choice.side_effect = lambda x: x[0]
-
+    def test_random_selection_calls(self):
         generator = PromptGenerator()
+        mock_choice = Mock(side_effect=lambda x: x[0])
+        generator._rng.choice = mock_choice
 
         segment = AudioSegment(
             start_time=0.0,
@@ -404,3 +403,80 @@ class TestPromptGenerator:
         )
 
         assert mock_choice.call_count >= 3
+
+
+class TestPromptGeneratorDeterminism:
+    def _analysis(self, content_hash="abc123"):
+        segments = [
+            AudioSegment(i * 5.0, (i + 1) * 5.0, 120.0, 0.5, mood, 2000.0)
+            for i, mood in enumerate(["happy", "energetic", "calm", "sad"])
+        ]
+        return AudioAnalysisResult(
+            duration=20.0,
+            overall_tempo=120.0,
+            overall_mood="happy",
+            genre_prediction="pop",
+            segments=segments,
+            beat_times=np.array([]),
+            energy_profile=np.array([]),
+            spectral_centroid=np.array([]),
+            content_hash=content_hash
+        )
+
+    def test_identical_requests_produce_identical_prompts(self):
+        first = PromptGenerator().generate_prompts(self._analysis(), custom_theme="neon")
+        second = PromptGenerator().generate_prompts(self._analysis(), custom_theme="neon")
+
+        assert first == second
+
+    def test_independent_of_global_random_state(self):
+        random.seed(1)
+        first = PromptGenerator().generate_prompts(self._analysis())
+        random.seed(2)
+        second = PromptGenerator().generate_prompts(self._analysis())
+
+        assert first == second
+
+    def test_does_not_consume_global_random(self):
+        random.seed(42)
+        expected = random.random()
+
+        random.seed(42)
+        PromptGenerator().generate_prompts(self._analysis())
+
+        assert random.random() == expected
+
+    def test_segment_seed_varies_with_inputs(self):
+        generator = PromptGenerator()
+        base = generator._segment_seed("hash", 0, None, None)
+
+        assert generator._segment_seed("hash", 0, None, None) == base
+        assert generator._segment_seed("other", 0, None, None) != base
+        assert generator._segment_seed("hash", 1, None, None) != base
+        assert generator._segment_seed("hash", 0, "anime", None) != base
+        assert generator._segment_seed("hash", 0, None, "ocean") != base
+        assert PromptGenerator(seed=7)._segment_seed("hash", 0, None, None) != base
+
+    def test_different_audio_can_differ(self):
+        generator = PromptGenerator()
+        prompts = {
+            tuple(p.prompt_text for p in generator.generate_prompts(self._analysis(f"hash{i}")))
+            for i in range(10)
+        }
+
+        assert len(prompts) > 1
+
+    def test_segment_order_does_not_affect_other_segments(self):
+        generator = PromptGenerator()
+        full = generator.generate_prompts(self._analysis())
+
+        analysis = self._analysis()
+        single = generator._generate_segment_prompt(
+            segment=analysis.segments[2],
+            segment_index=2,
+            overall_mood=analysis.overall_mood,
+            genre=analysis.genre_prediction,
+            content_key=analysis.content_hash
+        )
+
+        assert single == full[2]
@@ -0,0 +1,143 @@
+import pytest
+from unittest.mock import Mock
+
+from src.audio_analysis.analyzer import AudioSegment
+from src.video_generation.step_planner import (
+    SegmentProfile,
+    StepPlanner,
+    profile_segments,
+    record_step_timing,
+    get_seconds_per_step
+)
+from src.video_generation.ovi_generator import OviVideoGenerator, GenerationConfig
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+def _segment(energy, mood="happy", tempo=120.0, lyrics=None):
+    return AudioSegment(0.0, 5.0, tempo, energy, mood, 440.0, lyrics)
+
+
+class TestProfileSegments:
+    def test_energy_normalized_to_loudest_segment(self):
+        profiles = profile_segments([_segment(0.1), _segment(0.4)])
+
+        assert [p.energy for p in profiles] == [0.25, 1.0]
+
+    def test_repeated_chorus_detected(self):
+        chorus = "we are the light tonight"
+        segments = [
+            _segment(0.2, mood="calm", tempo=90.0),
+            _segment(0.8, lyrics=chorus),
+            _segment(0.3, mood="sad", tempo=100.0, lyrics="walking alone"),
+            _segment(0.8, lyrics=chorus)
+        ]
+
+        profiles = profile_segments(segments, priorities={2: 2.0})
+
+        assert profiles[0].repetition == 0.0
+        assert profiles[3].repetition == pytest.approx(1.0)
+        assert profiles[3].repetition > profiles[2].repetition
+        assert profiles[2].priority == 2.0
+
+
+class TestStepPlanner:
+    def test_uniform_profiles_keep_base_steps(self):
+        plan = StepPlanner(base_steps=50).plan([SegmentProfile(i, energy=0.5) for i in range(3)])
+
+        assert plan.steps == {0: 50, 1: 50, 2: 50}
+        assert plan.mode == "adaptive"
+
+    def test_energy_repetition_and_priority_shift_steps(self):
+        plan = StepPlanner(base_steps=40, min_steps=10, max_steps=80).plan([
+            SegmentProfile(0, energy=0.1),
+            SegmentProfile(1, energy=1.0),
+            SegmentProfile(2, energy=1.0, repetition=1.0),
+            SegmentProfile(3, energy=0.1, priority=3.0)
+        ])
+
+        assert plan.steps[1] > plan.steps[0]
+        assert plan.steps[2] < plan.steps[1]
+        assert plan.steps[3] > plan.steps[0]
+        assert all(10 <= steps <= 80 for steps in plan.steps.values())
+
+    def test_steps_clamped(self):
+        plan = StepPlanner(base_steps=50, min_steps=30, max_steps=55).plan([
+            SegmentProfile(0, energy=0.0, priority=0.1),
+            SegmentProfile(1, energy=1.0, priority=10.0)
+        ])
+
+        assert plan.steps == {0: 30, 1: 55}
+
+    def test_deadline_fits_step_budget(self):
+        profiles = [SegmentProfile(i, energy=i / 4) for i in range(5)]
+
+        plan = StepPlanner(base_steps=50, min_steps=10).plan(
+            profiles, deadline_seconds=300.0, seconds_per_step=2.0
+        )
+
+        assert plan.mode == "deadline"
+        assert plan.feasible
+        assert plan.total_steps <= 150
+        assert plan.estimated_seconds <= 300.0
+        assert plan.steps[4] >= plan.steps[0]
+
+    def test_generous_deadline_keeps_adaptive_plan(self):
+        profiles = [SegmentProfile(i, energy=i / 4) for i in range(5)]
+        planner = StepPlanner(base_steps=50)
+
+        plan = planner.plan(profiles, deadline_seconds=10000.0, seconds_per_step=1.0)
+
+        assert plan.steps == planner.plan(profiles).steps
+
+    def test_parallel_workers_raise_budget(self):
+        profiles = [SegmentProfile(i, energy=0.5) for i in range(4)]
+        planner = StepPlanner(base_steps=50, min_steps=10)
+
+        single = planner.plan(profiles, deadline_seconds=120.0, seconds_per_step=1.0)
+        double = planner.plan(profiles, deadline_seconds=120.0, seconds_per_step=1.0, parallelism=2)
+
+        assert double.total_steps > single.total_steps
+
+    def test_impossible_deadline_falls_back_to_min_steps(self):
+        plan = StepPlanner(base_steps=50, min_steps=20).plan(
+            [SegmentProfile(i, energy=0.5) for i in range(3)],
+            deadline_seconds=10.0,
+            seconds_per_step=1.0
+        )
+
+        assert plan.steps == {0: 20, 1: 20, 2: 20}
+        assert not plan.feasible
+
+    def test_plan_serializes(self):
+        plan = StepPlanner().plan([SegmentProfile(0, energy=0.5)], deadline_seconds=100.0, seconds_per_step=1.0)
+
+        data = plan.to_dict()
+
+        assert data["steps"] == {"0": 50}
+        assert data["total_steps"] == 50
+        assert data["deadline_seconds"] == 100.0
+
+
+class TestStepTimings:
+    def test_smoothed_seconds_per_step(self):
+        key = ("test-model", 1, 1, False)
+
+        record_step_timing(key, 100.0, 50)
+        record_step_timing(key, 50.0, 50)
+
+        assert get_seconds_per_step(key) == pytest.approx(0.7 * 2.0 + 0.3 * 1.0)
+        assert get_seconds_per_step(("unknown",)) is None
+
+    def test_generator_uses_prompt_steps_and_records_timing(self, tmp_path):
+        engine_worker = Mock()
+        engine_worker.generate.side_effect = lambda output_path, **kwargs: output_path
+        generator = OviVideoGenerator(
+            config=GenerationConfig(model_name="timing-test"),
+            engine_worker=engine_worker
+        )
+        prompt = VideoPrompt(0, 0.0, 5.0, "scene", "music", "", sample_steps=12)
+
+        generator.generate_clips([prompt], str(tmp_path))
+
+        assert engine_worker.generate.call_args[1]["sample_steps"] == 12
+        assert get_seconds_per_step(generator.timing_key()) is not None
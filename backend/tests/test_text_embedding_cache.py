@@ -0,0 +1,89 @@
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.video_generation.text_embedding_cache import (
+    TextEmbeddingCache,
+    CachedTextEncoder,
+    install_text_embedding_cache
+)
+
+
+class TestTextEmbeddingCache:
+    def test_hit_rate(self):
+        cache = TextEmbeddingCache()
+
+        assert cache.get("m", "a") is None
+        cache.put("m", "a", "emb")
+        assert cache.get("m", "a") == "emb"
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["lookups"] == 2
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_keyed_by_model(self):
+        cache = TextEmbeddingCache()
+        cache.put("720x720_5s", "a", "emb")
+
+        assert cache.get("960x960_10s", "a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TextEmbeddingCache(max_entries=2)
+        cache.put("m", "a", 1)
+        cache.put("m", "b", 2)
+        cache.get("m", "a")
+        cache.put("m", "c", 3)
+
+        assert ("m", "a") in cache
+        assert ("m", "b") not in cache
+
+    def test_encoder_batches_only_missing_texts(self):
+        encoder = Mock(side_effect=lambda texts, device: [f"emb:{t}" for t in texts])
+        cached = CachedTextEncoder(encoder, TextEmbeddingCache(), "m")
+
+        assert cached(["a", "b", "a"], "cpu") == ["emb:a", "emb:b", "emb:a"]
+        assert cached(["b", "c"], "cpu") == ["emb:b", "emb:c"]
+
+        assert encoder.call_args_list[0][0] == (["a", "b"], "cpu")
+        assert encoder.call_args_list[1][0] == (["c"], "cpu")
+
+    def test_wrapper_exposes_encoder_attributes(self, fake_text_engine):
+        engine = fake_text_engine()
+
+        assert install_text_embedding_cache(engine, TextEmbeddingCache(), "m")
+        assert install_text_embedding_cache(engine, TextEmbeddingCache(), "m")
+
+        assert isinstance(engine.text_model, CachedTextEncoder)
+        assert not isinstance(engine.text_model.encoder, CachedTextEncoder)
+        assert engine.text_model.device == "cuda:0"
+
+    def test_engine_without_text_encoder(self):
+        assert install_text_embedding_cache(object(), TextEmbeddingCache(), "m") is False
+
+
+class TestGeneratorTextEmbeddings:
+    def test_encoder_called_once_per_unique_string(self, tmp_path, make_prompts, make_ovi_generator, fake_text_engine):
+        engine = fake_text_engine()
+        generator = make_ovi_generator(engine)
+
+        generator.generate_clips(make_prompts(4, scenes=2), str(tmp_path))
+
+        assert len(engine.encoded) == len(set(engine.encoded))
+        assert "robotic, muffled, echo, distorted" in engine.encoded
+
+        stats = generator.text_embedding_stats()
+        assert stats["lookups"] == 12
+        assert stats["hits"] == 12 - len(engine.encoded)
+
+    def test_cached_embeddings_match_uncached(self, tmp_path, make_prompts, make_ovi_generator, fake_text_engine):
+        cached = make_ovi_generator(fake_text_engine())
+        uncached_engine = fake_text_engine()
+        uncached = make_ovi_generator(uncached_engine, text_embedding_cache_size=0)
+
+        cached_clips = cached.generate_clips(make_prompts(4, scenes=2), str(tmp_path / "cached"))
+        uncached_clips = uncached.generate_clips(make_prompts(4, scenes=2), str(tmp_path / "uncached"))
+
+        for a, b in zip(cached_clips, uncached_clips):
+            assert Path(a.video_path).read_text() == Path(b.video_path).read_text()
+        assert len(uncached_engine.encoded) == 12
+        assert uncached.text_embedding_stats() is None
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.video_generation.video_composer import VideoComposer, CompositionConfig
+from src.video_generation.ovi_generator import GenerationConfig, MockOviVideoGenerator
+from src.prompt_generation.prompt_generator import VideoPrompt
+
+
+def compose(tmp_path, composition):
+    from scipy.io import wavfile
+
+    audio_path = str(tmp_path / "song.wav")
+    wavfile.write(audio_path, 16000, np.zeros(16000, dtype=np.int16))
+
+    generator = MockOviVideoGenerator(config=GenerationConfig(video_height=64, video_width=64))
+    prompts = [VideoPrompt(i, i * 0.5, (i + 1) * 0.5, f"scene {i}", "music", "") for i in range(2)]
+    clips = generator.generate_clips(prompts, str(tmp_path / "clips"))
+
+    composer = VideoComposer(composition)
+    return composer, composer.compose_music_video(clips, audio_path, str(tmp_path / "out.mp4"), use_crossfade=False)
+
+
+class TestComposerUpscale:
+    def test_clip_size_kept_without_upscale(self, tmp_path):
+        from moviepy.editor import VideoFileClip
+
+        _, output = compose(tmp_path, CompositionConfig(output_resolution=(160, 96)))
+
+        video = VideoFileClip(output)
+        assert video.size == [64, 64]
+        video.close()
+
+    def test_lanczos_upscale_letterboxes_to_output_resolution(self, tmp_path):
+        from moviepy.editor import VideoFileClip
+
+        _, output = compose(tmp_path, CompositionConfig(output_resolution=(160, 96), upscale_method="lanczos"))
+
+        video = VideoFileClip(output)
+        frame = video.get_frame(0.25)
+        video.close()
+
+        assert frame.shape == (96, 160, 3)
+        assert frame[:, :24].max() < 20
+        assert frame[:, -24:].max() < 20
+        assert frame[:, 40:120].mean() > 40
+
+    def test_scale_filter(self):
+        composer = VideoComposer(CompositionConfig(output_resolution=(1920, 1080), upscale_method="lanczos"))
+
+        params = composer._scale_filter((480, 480))
+
+        assert params[0] == "-vf"
+        assert "scale=1920:1080:force_original_aspect_ratio=decrease:flags=lanczos" in params[1]
+        assert "pad=1920:1080" in params[1]
+        assert composer._scale_filter((1920, 1080)) is None
+        assert VideoComposer(CompositionConfig())._scale_filter((480, 480)) is None
+
+    def test_superres_falls_back_without_model(self):
+        composer = VideoComposer(CompositionConfig(upscale_method="superres", superres_model="/missing/FSRCNN_x2.pb"))
+        video = Mock()
+
+        assert composer._apply_superres(video) is video
+        assert composer._load_superres() is False
+        assert composer._scale_filter((480, 480)) is not None
+
+    def test_unknown_upscale_method_raises(self):
+        with pytest.raises(ValueError):
+            VideoComposer(CompositionConfig(upscale_method="bicubic"))
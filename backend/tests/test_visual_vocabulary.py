@@ -0,0 +1,103 @@
+import json
+import pytest
+
+from src.prompt_generation.visual_vocabulary import (
+    VisualVocabularyMatcher,
+    get_visual_matcher,
+    stem_word,
+    DEFAULT_VOCABULARY_PATH
+)
+
+
+class TestStemWord:
+    @pytest.mark.parametrize("word,base", [
+        ("stars", "star"),
+        ("dancing", "dance"),
+        ("danced", "dance"),
+        ("skies", "sky"),
+        ("flying", "fly"),
+        ("running", "run"),
+        ("sunny", "sun"),
+        ("rainy", "rain"),
+        ("kisses", "kiss"),
+        ("cities", "city")
+    ])
+    def test_inflections_share_stem(self, word, base):
+        assert stem_word(word) == stem_word(base)
+
+    @pytest.mark.parametrize("word,other", [
+        ("today", "day"),
+        ("runway", "run"),
+        ("sunday", "sun"),
+        ("start", "star"),
+        ("train", "rain")
+    ])
+    def test_distinct_words_keep_distinct_stems(self, word, other):
+        assert stem_word(word) != stem_word(other)
+
+
+class TestVisualVocabularyMatcher:
+    def test_word_boundaries_prevent_false_hits(self):
+        matcher = VisualVocabularyMatcher({"day": "daylight scenes", "run": "running movement"})
+
+        assert matcher.match("today we walk the runway") == []
+
+    def test_matches_inflected_forms(self):
+        matcher = VisualVocabularyMatcher({"star": "starry night sky", "dance": "dancing figures"})
+
+        assert matcher.match("Dancing under the stars") == ["dancing figures", "starry night sky"]
+
+    def test_truncated_stem_is_not_a_match(self):
+        matcher = VisualVocabularyMatcher({"fire": "flame elements", "evening": "evening light"})
+
+        assert matcher.match("fir trees even now") == []
+        assert matcher.match("fires in the evening") == ["flame elements", "evening light"]
+
+    def test_multi_word_phrases_preferred(self):
+        matcher = VisualVocabularyMatcher({
+            "heart": "love symbolism",
+            "broken heart": "shattered heart imagery"
+        })
+
+        assert matcher.match("my broken heart") == ["shattered heart imagery"]
+        assert matcher.match("my heart") == ["love symbolism"]
+
+    def test_results_in_lyric_order_deduplicated_and_limited(self):
+        matcher = VisualVocabularyMatcher({"sky": "sky", "sun": "sun", "moon": "moon", "rain": "rain"})
+
+        assert matcher.match("moon sky moon sun rain", limit=3) == ["moon", "sky", "sun"]
+
+    def test_empty_text(self):
+        matcher = VisualVocabularyMatcher({"sky": "sky"})
+
+        assert matcher.match("") == []
+        assert matcher.match(None) == []
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "vocab.json"
+        path.write_text(json.dumps({"comet": "blazing comet"}))
+
+        matcher = VisualVocabularyMatcher.from_file(str(path))
+
+        assert matcher.match("a comet passed") == ["blazing comet"]
+
+    def test_from_file_rejects_non_mapping(self, tmp_path):
+        path = tmp_path / "vocab.json"
+        path.write_text(json.dumps(["comet"]))
+
+        with pytest.raises(ValueError):
+            VisualVocabularyMatcher.from_file(str(path))
+
+    def test_default_vocabulary_loaded_once(self):
+        assert get_visual_matcher() is get_visual_matcher(str(DEFAULT_VOCABULARY_PATH))
+        assert len(get_visual_matcher()) > 100
+
+    def test_large_vocabulary(self):
+        letters = "bcdfghjklm"
+        words = [a + "o" + b + "u" + c for a in letters for b in letters for c in letters]
+        vocabulary = {word: f"visual {word}" for word in words}
+        vocabulary["ocean"] = "ocean waves"
+        matcher = VisualVocabularyMatcher(vocabulary)
+
+        assert len(matcher) == 1001
+        assert matcher.match("across the ocean mokum") == ["ocean waves", "visual mokum"]
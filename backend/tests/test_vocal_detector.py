@@ -0,0 +1,141 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from src.audio_analysis.vocal_detector import VocalActivityDetector, VocalRegion, GatedAudio
+from src.audio_analysis.lyrics_extractor import LyricsExtractor
+
+
+def _voice_like(t: np.ndarray) -> np.ndarray:
+    return sum(
+        (0.3 / k) * np.sin(2 * np.pi * 220.0 * k * t)
+        for k in range(1, 6)
+    )
+
+
+@pytest.fixture
+def intro_vocal_outro_audio():
+    sr = 22050
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sr * 12.0)) / sr
+
+    y = 0.05 * rng.standard_normal(len(t))
+    vocal = (t >= 4.0) & (t < 8.0)
+    y[vocal] = _voice_like(t[vocal])
+    return y.astype(np.float32), sr
+
+
+class TestVocalActivityDetector:
+    def test_detect_finds_vocal_region(self, intro_vocal_outro_audio):
+        y, sr = intro_vocal_outro_audio
+        detector = VocalActivityDetector()
+
+        regions = detector.detect(y, sr)
+
+        assert len(regions) == 1
+        assert regions[0].start_time == pytest.approx(4.0, abs=0.6)
+        assert regions[0].end_time == pytest.approx(8.0, abs=0.6)
+
+    def test_detect_vocals_over_loud_bass(self):
+        sr = 22050
+        t = np.arange(int(sr * 6.0)) / sr
+        y = _voice_like(t) + 0.9 * np.sin(2 * np.pi * 55.0 * t)
+        detector = VocalActivityDetector()
+
+        regions = detector.detect(y.astype(np.float32), sr)
+
+        assert len(regions) == 1
+        assert regions[0].duration > 5.0
+
+    def test_detect_bass_only_returns_no_regions(self):
+        sr = 22050
+        t = np.arange(int(sr * 6.0)) / sr
+        detector = VocalActivityDetector()
+
+        assert detector.detect((0.5 * np.sin(2 * np.pi * 55.0 * t)).astype(np.float32), sr) == []
+
+    def test_detect_silence_returns_no_regions(self, silence_audio_data):
+        y, sr = silence_audio_data
+        detector = VocalActivityDetector()
+
+        assert detector.detect(y, sr) == []
+
+    def test_gate_reports_skipped_fraction(self, intro_vocal_outro_audio):
+        y, sr = intro_vocal_outro_audio
+        detector = VocalActivityDetector()
+
+        gated = detector.gate(y, sr)
+
+        assert len(gated.audio) < len(y)
+        assert gated.skipped_fraction == pytest.approx(1.0 - gated.voiced_duration / 12.0)
+        assert 0.4 < gated.skipped_fraction < 0.8
+
+    def test_gate_concatenates_regions_with_gap(self):
+        sr = 100
+        detector = VocalActivityDetector(join_gap=0.5)
+        detector.detect = Mock(return_value=[VocalRegion(1.0, 2.0), VocalRegion(5.0, 7.0)])
+
+        gated = detector.gate(np.ones(1000, dtype=np.float32), sr)
+
+        assert len(gated.audio) == 100 + 50 + 200
+        assert gated.gated_starts == [0.0, 1.5]
+
+    def test_to_source_time_remaps_through_regions(self):
+        gated = GatedAudio(
+            audio=np.zeros(0),
+            sample_rate=100,
+            regions=[VocalRegion(1.0, 2.0), VocalRegion(5.0, 7.0)],
+            source_duration=10.0,
+            gated_starts=[0.0, 1.5]
+        )
+
+        assert gated.to_source_time(0.5) == pytest.approx(1.5)
+        assert gated.to_source_time(1.2) == pytest.approx(2.0)
+        assert gated.to_source_time(1.5) == pytest.approx(5.0)
+        assert gated.to_source_time(2.5) == pytest.approx(6.0)
+        assert gated.to_source_time(10.0) == pytest.approx(7.0)
+
+
+class TestLyricsExtractorVocalGating:
+    def test_transcribes_only_voiced_audio_and_remaps(self):
+        sr = 100
+        detector = VocalActivityDetector(join_gap=0.5)
+        detector.detect = Mock(return_value=[VocalRegion(10.0, 12.0), VocalRegion(20.0, 21.0)])
+
+        model = Mock()
+        model.transcribe.return_value = {
+            "text": "hello world",
+            "segments": [
+                {"start": 0.5, "end": 1.5, "text": "hello"},
+                {"start": 2.6, "end": 3.4, "text": "world"}
+            ]
+        }
+
+        extractor = LyricsExtractor(vocal_detector=detector)
+        extractor._model = model
+
+        transcription = extractor.transcribe(np.zeros(30 * sr, dtype=np.float32), sr)
+
+        transcribed = model.transcribe.call_args[0][0]
+        assert len(transcribed) == pytest.approx(3.5 * 16000, abs=2)
+        assert transcription.segments[0].start_time == pytest.approx(10.5)
+        assert transcription.segments[0].end_time == pytest.approx(11.5)
+        assert transcription.segments[1].start_time == pytest.approx(20.1)
+        assert transcription.segments[1].end_time == pytest.approx(20.9)
+        assert transcription.skipped_fraction == pytest.approx(0.9)
+
+    def test_no_vocals_transcribes_full_track(self):
+        detector = VocalActivityDetector()
+        detector.detect = Mock(return_value=[])
+        model = Mock()
+        model.transcribe.return_value = {"text": "hello", "segments": [{"start": 0.2, "end": 0.8, "text": "hello"}]}
+
+        extractor = LyricsExtractor(vocal_detector=detector)
+        extractor._model = model
+
+        transcription = extractor.transcribe(np.zeros(22050, dtype=np.float32), 22050)
+
+        assert len(model.transcribe.call_args[0][0]) == 16000
+        assert transcription.text == "hello"
+        assert transcription.segments[0].start_time == pytest.approx(0.2)
+        assert transcription.skipped_fraction == 0.0
@@ -0,0 +1,73 @@
+import threading
+import pytest
+from unittest.mock import Mock
+
+from src.utils.warmup import EngineWarmup
+
+
+class TestEngineWarmup:
+    def test_ready_with_no_components(self):
+        warmup = EngineWarmup()
+        warmup.start()
+
+        status = warmup.status()
+        assert status["ready"] is True
+        assert status["components"] == {}
+
+    def test_components_pending_until_started(self):
+        warmup = EngineWarmup()
+        warmup.add("ovi", Mock())
+
+        status = warmup.status()
+        assert status["ready"] is False
+        assert status["uptime_seconds"] is None
+        assert status["components"]["ovi"]["status"] == "pending"
+
+    def test_foreground_start_records_load_time(self):
+        whisper = Mock()
+        ovi = Mock()
+        warmup = EngineWarmup()
+        warmup.add("whisper", whisper)
+        warmup.add("ovi", ovi)
+
+        assert warmup.start(background=False) == []
+
+        whisper.assert_called_once_with()
+        ovi.assert_called_once_with()
+        status = warmup.status()
+        assert status["ready"] is True
+        assert status["components"]["ovi"]["status"] == "ready"
+        assert status["components"]["ovi"]["load_seconds"] >= 0
+
+    def test_background_loading_reports_progress(self):
+        release = threading.Event()
+        loading = threading.Event()
+
+        def slow_loader():
+            loading.set()
+            release.wait(timeout=5)
+
+        warmup = EngineWarmup()
+        warmup.add("ovi", slow_loader)
+        warmup.add("whisper", Mock())
+        warmup.start()
+
+        assert loading.wait(timeout=5)
+        assert warmup.status()["components"]["ovi"]["status"] == "loading"
+        assert warmup.is_ready() is False
+
+        release.set()
+        assert warmup.wait(timeout=5) is True
+        assert warmup.status()["components"]["whisper"]["status"] == "ready"
+
+    def test_failed_component_is_not_ready(self):
+        warmup = EngineWarmup()
+        warmup.add("musetalk", Mock(side_effect=RuntimeError("MuseTalk installation is missing")))
+        warmup.add("whisper", Mock())
+        warmup.start()
+
+        assert warmup.wait(timeout=5) is False
+        component = warmup.status()["components"]["musetalk"]
+        assert component["status"] == "failed"
+        assert component["error"] == "MuseTalk installation is missing"
+        assert warmup.status()["components"]["whisper"]["status"] == "ready"
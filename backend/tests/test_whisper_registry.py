@@ -0,0 +1,203 @@
+import threading
+import time
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+
+from src.audio_analysis.whisper_registry import WhisperModelRegistry, get_whisper_registry
+from src.audio_analysis.lyrics_extractor import LyricsExtractor
+
+
+class TestWhisperModelRegistry:
+    def test_get_loads_model_once(self):
+        loader = Mock(side_effect=lambda size: f"model-{size}")
+        registry = WhisperModelRegistry(loader=loader)
+
+        assert registry.get("base") == "model-base"
+        assert registry.get("base") == "model-base"
+
+        loader.assert_called_once_with("base")
+
+    def test_models_keyed_by_size(self):
+        loader = Mock(side_effect=lambda size: f"model-{size}")
+        registry = WhisperModelRegistry(loader=loader)
+
+        registry.get("base")
+        registry.get("small")
+
+        assert loader.call_count == 2
+        assert registry.loaded_models() == ["base", "small"]
+
+    def test_concurrent_get_loads_once(self):
+        def slow_loader(size):
+            time.sleep(0.05)
+            return object()
+
+        loader = Mock(side_effect=slow_loader)
+        registry = WhisperModelRegistry(loader=loader)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("base")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        loader.assert_called_once()
+        assert len(set(id(r) for r in results)) == 1
+
+    def test_evict_idle_removes_expired_models(self):
+        registry = WhisperModelRegistry(idle_timeout=10.0, loader=lambda size: size)
+        registry.get("base")
+
+        assert registry.evict_idle(now=time.monotonic() + 5.0) == 0
+        assert registry.is_loaded("base")
+
+        assert registry.evict_idle(now=time.monotonic() + 20.0) == 1
+        assert not registry.is_loaded("base")
+
+    def test_evict_idle_disabled_with_zero_timeout(self):
+        registry = WhisperModelRegistry(idle_timeout=0, loader=lambda size: size)
+        registry.get("base")
+
+        assert registry.evict_idle(now=time.monotonic() + 1e6) == 0
+        assert registry.is_loaded("base")
+
+    def test_get_refreshes_requested_model_before_evicting(self):
+        loader = Mock(side_effect=lambda size: f"model-{size}")
+        registry = WhisperModelRegistry(idle_timeout=10.0, loader=loader, reap_interval=60.0)
+        registry.get("base")
+        registry.get("small")
+
+        stale = time.monotonic() - 20.0
+        registry._entries["base"].last_used = stale
+        registry._entries["small"].last_used = stale
+
+        assert registry.get("base") == "model-base"
+        assert registry.loaded_models() == ["base"]
+        assert loader.call_count == 2
+        registry.stop_reaper(timeout=5)
+
+    def test_reaper_unloads_idle_models_in_background(self):
+        registry = WhisperModelRegistry(idle_timeout=0.05, loader=lambda size: size, reap_interval=0.02)
+        registry.get("base")
+        reaper = registry._reaper
+
+        reaper.join(timeout=5)
+
+        assert not reaper.is_alive()
+        assert not registry.is_loaded("base")
+        assert registry._reaper is None
+
+    def test_reaper_not_started_when_eviction_disabled(self):
+        registry = WhisperModelRegistry(idle_timeout=0, loader=lambda size: size)
+        registry.get("base")
+
+        assert registry._reaper is None
+
+    def test_leased_model_not_evicted(self):
+        registry = WhisperModelRegistry(idle_timeout=10.0, loader=lambda size: size, reap_interval=60.0)
+
+        with registry.lease("base") as model:
+            assert model == "base"
+            assert registry.evict_idle(now=time.monotonic() + 20.0) == 0
+
+        assert registry.evict_idle(now=time.monotonic() + 20.0) == 1
+        registry.stop_reaper(timeout=5)
+
+    def test_lease_serializes_inference(self):
+        registry = WhisperModelRegistry(loader=lambda size: size)
+        active = []
+        overlaps = []
+
+        def infer():
+            with registry.lease("base"):
+                active.append(1)
+                overlaps.append(len(active))
+                time.sleep(0.02)
+                active.pop()
+
+        threads = [threading.Thread(target=infer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [1, 1, 1, 1]
+        registry.stop_reaper(timeout=5)
+
+    def test_pinned_model_not_evicted(self):
+        registry = WhisperModelRegistry(idle_timeout=10.0, loader=lambda size: size, reap_interval=60.0)
+        registry.pin("base")
+        registry.get("tiny")
+
+        assert registry.evict_idle(now=time.monotonic() + 20.0) == 1
+        assert registry.loaded_models() == ["base"]
+
+        registry.unload("base")
+        registry.get("base")
+        assert registry.evict_idle(now=time.monotonic() + 20.0) == 1
+        registry.stop_reaper(timeout=5)
+
+    def test_warm_up_background(self):
+        loader = Mock(side_effect=lambda size: size)
+        registry = WhisperModelRegistry(loader=loader)
+
+        thread = registry.warm_up(["base"])
+        thread.join(timeout=5)
+
+        assert registry.is_loaded("base")
+
+    def test_warm_up_logs_loader_errors(self):
+        registry = WhisperModelRegistry(loader=Mock(side_effect=RuntimeError("boom")))
+
+        assert registry.warm_up(["base"], background=False) is None
+        assert not registry.is_loaded("base")
+
+    def test_unload_and_clear(self):
+        registry = WhisperModelRegistry(loader=lambda size: size)
+        registry.get("base")
+        registry.get("tiny")
+
+        assert registry.unload("base") is True
+        assert registry.unload("base") is False
+        registry.clear()
+        assert registry.loaded_models() == []
+
+    def test_get_whisper_registry_is_singleton(self):
+        assert get_whisper_registry() is get_whisper_registry()
+
+
+class TestLyricsExtractorRegistry:
+    def test_extractors_share_registry_model(self, mock_whisper_model):
+        registry = WhisperModelRegistry(loader=Mock(return_value=mock_whisper_model))
+
+        with patch('src.audio_analysis.lyrics_extractor.get_whisper_registry', return_value=registry):
+            first = LyricsExtractor(model_size="small")
+            second = LyricsExtractor(model_size="small")
+
+            assert first._load_model() is second._load_model()
+
+        registry._loader.assert_called_once_with("small")
+
+    def test_transcribe_holds_inference_lock(self, mock_whisper_model):
+        registry = WhisperModelRegistry(loader=Mock(return_value=mock_whisper_model))
+        held = []
+        mock_whisper_model.transcribe.side_effect = lambda *args, **kwargs: (
+            held.append(registry.inference_lock("small").locked()) or {"text": "", "segments": []}
+        )
+
+        with patch('src.audio_analysis.lyrics_extractor.get_whisper_registry', return_value=registry):
+            LyricsExtractor(model_size="small")._run_transcription(np.zeros(16000, dtype=np.float32), False)
+
+        assert held == [True]
+        assert not registry.inference_lock("small").locked()
+
+    def test_analyzer_passes_whisper_model(self):
+        from src.audio_analysis.analyzer import AudioAnalyzer
+
+        analyzer = AudioAnalyzer(whisper_model="medium")
+        assert analyzer.lyrics_extractor.model_size == "medium"